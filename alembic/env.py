@@ -21,6 +21,8 @@ from app.models import (
     offer,
     blacklist,
     notification,
+    parse_job,
+    metrics,
 )
 
 # Alembic Config object
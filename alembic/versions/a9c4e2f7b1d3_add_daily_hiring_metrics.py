@@ -0,0 +1,66 @@
+"""add daily hiring metrics
+
+Revision ID: a9c4e2f7b1d3
+Revises: f2b6d9e4a1c8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c4e2f7b1d3"
+down_revision: Union[str, None] = "f2b6d9e4a1c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_SQL = """
+INSERT INTO daily_hiring_metrics (day, hires, interviews, offers, logins)
+SELECT day, SUM(hires), SUM(interviews), SUM(offers), SUM(logins)
+FROM (
+    SELECT DATE(created_at) AS day,
+           CASE WHEN status = 'joined' THEN 1 ELSE 0 END AS hires,
+           0 AS interviews, 1 AS offers, 0 AS logins
+    FROM offers WHERE created_at IS NOT NULL
+    UNION ALL
+    SELECT DATE(scheduled_time), 0, 1, 0, 0
+    FROM interviews WHERE scheduled_time IS NOT NULL
+    UNION ALL
+    SELECT DATE(last_login), 0, 0, 0, 1
+    FROM users WHERE last_login IS NOT NULL
+) AS activity
+GROUP BY day
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "daily_hiring_metrics" not in existing_tables:
+        op.create_table(
+            "daily_hiring_metrics",
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("hires", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("interviews", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("offers", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("logins", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=True),
+            sa.PrimaryKeyConstraint("day"),
+        )
+
+    if {"offers", "interviews", "users"} <= existing_tables:
+        bind.execute(sa.text("DELETE FROM daily_hiring_metrics"))
+        bind.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "daily_hiring_metrics" in inspector.get_table_names():
+        op.drop_table("daily_hiring_metrics")
@@ -0,0 +1,89 @@
+"""add mpr pipeline counters
+
+Revision ID: b3d7f1a5c2e8
+Revises: a9c4e2f7b1d3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d7f1a5c2e8"
+down_revision: Union[str, None] = "a9c4e2f7b1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_SQL = """
+INSERT INTO mpr_pipeline_counters (job_id, sourced, screened, interviewed, offered, hired, dnj)
+SELECT job_id, SUM(sourced), SUM(screened), SUM(interviewed), SUM(offered), SUM(hired), SUM(dnj)
+FROM (
+    SELECT job_id, 1 AS sourced,
+           CASE WHEN LOWER(status) IN ('screening', 'shortlisted', 'interview', 'interviewing', 'offered', 'hired', 'joined')
+                THEN 1 ELSE 0 END AS screened,
+           CASE WHEN LOWER(status) IN ('interview', 'interviewing', 'offered', 'hired', 'joined')
+                THEN 1 ELSE 0 END AS interviewed,
+           0 AS offered, 0 AS hired, 0 AS dnj
+    FROM candidate_applications
+    UNION ALL
+    SELECT job_id, 0, 0, 0,
+           CASE WHEN CAST(status AS VARCHAR) IN ('offered', 'accepted', 'joined') THEN 1 ELSE 0 END,
+           CASE WHEN CAST(status AS VARCHAR) = 'joined' THEN 1 ELSE 0 END,
+           CASE WHEN CAST(status AS VARCHAR) IN ('declined', 'withdrawn', 'expired') THEN 1 ELSE 0 END
+    FROM offers
+) AS activity
+WHERE job_id IN (SELECT id FROM jobs)
+GROUP BY job_id
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "mpr_pipeline_counters" not in existing_tables:
+        op.create_table(
+            "mpr_pipeline_counters",
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("sourced", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("screened", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("interviewed", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("offered", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("hired", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("dnj", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=True),
+            sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("job_id"),
+        )
+
+    if "job_requisitions" in existing_tables:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes("job_requisitions")}
+        if "ix_job_requisitions_mpr_id_job_id" not in existing_indexes:
+            op.create_index(
+                "ix_job_requisitions_mpr_id_job_id",
+                "job_requisitions",
+                ["mpr_id", "job_id"],
+                unique=False,
+            )
+
+    if {"jobs", "candidate_applications", "offers"} <= existing_tables:
+        bind.execute(sa.text("DELETE FROM mpr_pipeline_counters"))
+        bind.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "job_requisitions" in existing_tables:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes("job_requisitions")}
+        if "ix_job_requisitions_mpr_id_job_id" in existing_indexes:
+            op.drop_index("ix_job_requisitions_mpr_id_job_id", table_name="job_requisitions")
+    if "mpr_pipeline_counters" in existing_tables:
+        op.drop_table("mpr_pipeline_counters")
@@ -0,0 +1,78 @@
+"""add resume parse jobs
+
+Revision ID: b4d2c8e1a7f3
+Revises: 7e3a1b4c9f10
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d2c8e1a7f3"
+down_revision: Union[str, None] = "7e3a1b4c9f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "resume_parse_jobs" not in existing_tables:
+        op.create_table(
+            "resume_parse_jobs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("candidate_id", sa.Integer(), nullable=False),
+            sa.Column("document_id", sa.Integer(), nullable=False),
+            sa.Column("file_path", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("max_attempts", sa.Integer(), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("result", sa.JSON(), nullable=True),
+            sa.Column("available_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["candidate_id"], ["candidates.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["document_id"], ["candidate_documents.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    existing_indexes = {
+        idx["name"] for idx in inspector.get_indexes("resume_parse_jobs")
+    } if "resume_parse_jobs" in inspector.get_table_names() else set()
+
+    if "ix_resume_parse_jobs_id" not in existing_indexes:
+        op.create_index("ix_resume_parse_jobs_id", "resume_parse_jobs", ["id"], unique=False)
+    if "ix_resume_parse_jobs_candidate_id" not in existing_indexes:
+        op.create_index("ix_resume_parse_jobs_candidate_id", "resume_parse_jobs", ["candidate_id"], unique=False)
+    if "ix_resume_parse_jobs_document_id" not in existing_indexes:
+        op.create_index("ix_resume_parse_jobs_document_id", "resume_parse_jobs", ["document_id"], unique=False)
+    if "ix_resume_parse_jobs_status" not in existing_indexes:
+        op.create_index("ix_resume_parse_jobs_status", "resume_parse_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "resume_parse_jobs" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("resume_parse_jobs")}
+    for index_name in (
+        "ix_resume_parse_jobs_status",
+        "ix_resume_parse_jobs_document_id",
+        "ix_resume_parse_jobs_candidate_id",
+        "ix_resume_parse_jobs_id",
+    ):
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name="resume_parse_jobs")
+    op.drop_table("resume_parse_jobs")
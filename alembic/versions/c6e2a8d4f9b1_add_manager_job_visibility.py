@@ -0,0 +1,66 @@
+"""add manager job visibility
+
+Revision ID: c6e2a8d4f9b1
+Revises: b3d7f1a5c2e8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e2a8d4f9b1"
+down_revision: Union[str, None] = "b3d7f1a5c2e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_SQL = """
+INSERT INTO manager_job_visibility (manager_id, job_id)
+SELECT manager_id, id FROM jobs WHERE manager_id IS NOT NULL
+UNION
+SELECT mprs.hiring_manager_id, jobs.id
+FROM jobs
+JOIN mprs ON LOWER(jobs.title) = LOWER(mprs.job_title)
+          OR LOWER(jobs.department) = LOWER(mprs.department)
+WHERE jobs.manager_id IS NULL AND mprs.hiring_manager_id IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "manager_job_visibility" not in existing_tables:
+        op.create_table(
+            "manager_job_visibility",
+            sa.Column("manager_id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["manager_id"], ["users.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("manager_id", "job_id"),
+        )
+
+    existing_indexes = {idx["name"] for idx in inspect(bind).get_indexes("manager_job_visibility")}
+    if "ix_manager_job_visibility_job_id" not in existing_indexes:
+        op.create_index("ix_manager_job_visibility_job_id", "manager_job_visibility", ["job_id"], unique=False)
+
+    if {"jobs", "mprs"} <= existing_tables:
+        bind.execute(sa.text("DELETE FROM manager_job_visibility"))
+        bind.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "manager_job_visibility" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("manager_job_visibility")}
+    if "ix_manager_job_visibility_job_id" in existing_indexes:
+        op.drop_index("ix_manager_job_visibility_job_id", table_name="manager_job_visibility")
+    op.drop_table("manager_job_visibility")
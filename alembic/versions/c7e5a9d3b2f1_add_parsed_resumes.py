@@ -0,0 +1,65 @@
+"""add parsed resumes
+
+Revision ID: c7e5a9d3b2f1
+Revises: b4d2c8e1a7f3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e5a9d3b2f1"
+down_revision: Union[str, None] = "b4d2c8e1a7f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "parsed_resumes" not in existing_tables:
+        op.create_table(
+            "parsed_resumes",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("candidate_id", sa.Integer(), nullable=False),
+            sa.Column("document_id", sa.Integer(), nullable=False),
+            sa.Column("parser_version", sa.String(), nullable=True),
+            sa.Column("data", sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["candidate_id"], ["candidates.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["document_id"], ["candidate_documents.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("document_id"),
+        )
+
+    existing_indexes = {
+        idx["name"] for idx in inspector.get_indexes("parsed_resumes")
+    } if "parsed_resumes" in inspector.get_table_names() else set()
+
+    if "ix_parsed_resumes_id" not in existing_indexes:
+        op.create_index("ix_parsed_resumes_id", "parsed_resumes", ["id"], unique=False)
+    if "ix_parsed_resumes_candidate_id_id" not in existing_indexes:
+        op.create_index("ix_parsed_resumes_candidate_id_id", "parsed_resumes", ["candidate_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "parsed_resumes" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("parsed_resumes")}
+    if "ix_parsed_resumes_candidate_id_id" in existing_indexes:
+        op.drop_index("ix_parsed_resumes_candidate_id_id", table_name="parsed_resumes")
+    if "ix_parsed_resumes_id" in existing_indexes:
+        op.drop_index("ix_parsed_resumes_id", table_name="parsed_resumes")
+    op.drop_table("parsed_resumes")
@@ -0,0 +1,62 @@
+"""add notification outbox columns
+
+Revision ID: d1f3b7a2c9e4
+Revises: c7e5a9d3b2f1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d1f3b7a2c9e4"
+down_revision: Union[str, None] = "c7e5a9d3b2f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "notification_logs" not in inspector.get_table_names():
+        return
+
+    existing_columns = {column["name"] for column in inspector.get_columns("notification_logs")}
+    if "attempts" not in existing_columns:
+        op.add_column(
+            "notification_logs",
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        )
+    if "next_attempt_at" not in existing_columns:
+        op.add_column("notification_logs", sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True))
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("notification_logs")}
+    if "ix_notification_logs_status_next_attempt_at" not in existing_indexes:
+        op.create_index(
+            "ix_notification_logs_status_next_attempt_at",
+            "notification_logs",
+            ["status", "next_attempt_at"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "notification_logs" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("notification_logs")}
+    if "ix_notification_logs_status_next_attempt_at" in existing_indexes:
+        op.drop_index("ix_notification_logs_status_next_attempt_at", table_name="notification_logs")
+
+    existing_columns = {column["name"] for column in inspector.get_columns("notification_logs")}
+    with op.batch_alter_table("notification_logs") as batch_op:
+        if "next_attempt_at" in existing_columns:
+            batch_op.drop_column("next_attempt_at")
+        if "attempts" in existing_columns:
+            batch_op.drop_column("attempts")
@@ -0,0 +1,63 @@
+"""add job search vector
+
+Revision ID: d8f4b2e6a3c7
+Revises: c6e2a8d4f9b1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8f4b2e6a3c7"
+down_revision: Union[str, None] = "c6e2a8d4f9b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PostgreSQL only: other databases search jobs with LIKE (see crud_job.search_public_jobs)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(skills_required::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '') || ' ' || coalesce(requirements, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = inspect(bind)
+    if "jobs" not in inspector.get_table_names():
+        return
+
+    existing_columns = {column["name"] for column in inspector.get_columns("jobs")}
+    if "search_vector" not in existing_columns:
+        # The generated column is computed for every existing row on ADD COLUMN
+        bind.execute(sa.text(
+            f"ALTER TABLE jobs ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+        ))
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("jobs")}
+    if "ix_jobs_search_vector" not in existing_indexes:
+        op.create_index("ix_jobs_search_vector", "jobs", ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = inspect(bind)
+    if "jobs" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("jobs")}
+    if "ix_jobs_search_vector" in existing_indexes:
+        op.drop_index("ix_jobs_search_vector", table_name="jobs")
+    existing_columns = {column["name"] for column in inspector.get_columns("jobs")}
+    if "search_vector" in existing_columns:
+        op.drop_column("jobs", "search_vector")
@@ -0,0 +1,119 @@
+"""add candidate skill index
+
+Revision ID: e2a6c9f4b8d1
+Revises: d8f4b2e6a3c7
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a6c9f4b8d1"
+down_revision: Union[str, None] = "d8f4b2e6a3c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _normalize_skills(names):
+    # Same normalization as app.services.skill_index.normalize_skill
+    if not isinstance(names, list):
+        return set()
+    return {" ".join(name.split()).lower() for name in names if isinstance(name, str) and name.strip()}
+
+
+def _backfill(bind) -> None:
+    """Index Candidate.skills in id-ordered batches (JSON arrays cannot be unnested portably in SQL)"""
+    candidates = sa.table("candidates", sa.column("id", sa.Integer), sa.column("skills", sa.JSON))
+    skills = sa.table("skills", sa.column("id", sa.Integer), sa.column("name", sa.String))
+    candidate_skills = sa.table(
+        "candidate_skills", sa.column("candidate_id", sa.Integer), sa.column("skill_id", sa.Integer)
+    )
+
+    skill_ids = dict(bind.execute(sa.select(skills.c.name, skills.c.id)).all())
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(candidates.c.id, candidates.c.skills)
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        by_candidate = {candidate_id: _normalize_skills(names) for candidate_id, names in rows}
+        missing = sorted(set().union(*by_candidate.values()) - skill_ids.keys())
+        if missing:
+            bind.execute(skills.insert(), [{"name": name} for name in missing])
+            skill_ids.update(bind.execute(sa.select(skills.c.name, skills.c.id).where(skills.c.name.in_(missing))).all())
+        index_rows = [
+            {"candidate_id": candidate_id, "skill_id": skill_ids[name]}
+            for candidate_id, names in by_candidate.items()
+            for name in names
+        ]
+        if index_rows:
+            bind.execute(candidate_skills.insert(), index_rows)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "skills" not in existing_tables:
+        op.create_table(
+            "skills",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name"),
+        )
+        op.create_index(op.f("ix_skills_id"), "skills", ["id"], unique=False)
+
+    if "candidate_skills" not in existing_tables:
+        op.create_table(
+            "candidate_skills",
+            sa.Column("candidate_id", sa.Integer(), nullable=False),
+            sa.Column("skill_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["candidate_id"], ["candidates.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["skill_id"], ["skills.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("candidate_id", "skill_id"),
+        )
+
+    existing_indexes = {idx["name"] for idx in inspect(bind).get_indexes("candidate_skills")}
+    if "ix_candidate_skills_skill_id_candidate_id" not in existing_indexes:
+        op.create_index(
+            "ix_candidate_skills_skill_id_candidate_id",
+            "candidate_skills",
+            ["skill_id", "candidate_id"],
+            unique=False,
+        )
+
+    if "candidates" in existing_tables:
+        bind.execute(sa.text("DELETE FROM candidate_skills"))
+        _backfill(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "candidate_skills" in existing_tables:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes("candidate_skills")}
+        if "ix_candidate_skills_skill_id_candidate_id" in existing_indexes:
+            op.drop_index("ix_candidate_skills_skill_id_candidate_id", table_name="candidate_skills")
+        op.drop_table("candidate_skills")
+
+    if "skills" in existing_tables:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes("skills")}
+        if "ix_skills_id" in existing_indexes:
+            op.drop_index(op.f("ix_skills_id"), table_name="skills")
+        op.drop_table("skills")
@@ -0,0 +1,66 @@
+"""add pipeline indexes
+
+Revision ID: e5a8c3f1d6b2
+Revises: d1f3b7a2c9e4
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a8c3f1d6b2"
+down_revision: Union[str, None] = "d1f3b7a2c9e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns or SQL expressions)
+INDEXES = [
+    ("ix_candidate_applications_candidate_id_applied_at", "candidate_applications", ["candidate_id", sa.text("applied_at DESC")]),
+    ("ix_candidate_applications_job_id_status", "candidate_applications", ["job_id", "status"]),
+    ("ix_candidate_applications_status", "candidate_applications", ["status"]),
+    ("ix_candidate_applications_lower_status", "candidate_applications", [sa.text("lower(status)")]),
+    ("ix_candidate_documents_candidate_id_lower_document_type", "candidate_documents", ["candidate_id", sa.text("lower(document_type)")]),
+    ("ix_interviews_candidate_id_job_id_status", "interviews", ["candidate_id", "job_id", "status"]),
+    ("ix_interviews_job_id", "interviews", ["job_id"]),
+    ("ix_interviews_scheduled_time", "interviews", ["scheduled_time"]),
+    ("ix_offers_candidate_id_job_id", "offers", ["candidate_id", "job_id"]),
+    ("ix_offers_job_id_status", "offers", ["job_id", "status"]),
+    ("ix_offers_status", "offers", ["status"]),
+    ("ix_jobs_manager_id", "jobs", ["manager_id"]),
+    ("ix_jobs_public_board", "jobs", [sa.text("lower(visibility)"), sa.text("lower(status)"), sa.text("coalesce(posted_at, created_at)")]),
+    ("ix_jobs_lower_title", "jobs", [sa.text("lower(title)")]),
+    ("ix_jobs_lower_department", "jobs", [sa.text("lower(department)")]),
+    ("ix_mprs_hiring_manager_id", "mprs", ["hiring_manager_id"]),
+    ("ix_mprs_status", "mprs", ["status"]),
+]
+
+
+# SQLite's inspector does not report expression indexes, so existence is
+# checked with IF [NOT] EXISTS rather than the inspector.
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing_tables = set(inspect(bind).get_table_names())
+    pending = [(name, table, columns) for name, table, columns in INDEXES if table in existing_tables]
+
+    if bind.dialect.name == "postgresql":
+        # Build without blocking writes to the live pipeline tables.
+        with op.get_context().autocommit_block():
+            for name, table, columns in pending:
+                op.create_index(name, table, columns, unique=False, if_not_exists=True, postgresql_concurrently=True)
+    else:
+        for name, table, columns in pending:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    existing_tables = set(inspect(bind).get_table_names())
+    for name, table, _ in reversed(INDEXES):
+        if table in existing_tables:
+            op.drop_index(name, table_name=table, if_exists=True)
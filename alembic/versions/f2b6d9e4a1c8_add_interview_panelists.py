@@ -0,0 +1,109 @@
+"""add interview panelists
+
+Revision ID: f2b6d9e4a1c8
+Revises: e5a8c3f1d6b2
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b6d9e4a1c8"
+down_revision: Union[str, None] = "e5a8c3f1d6b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _panel_user_ids(panel_members) -> list:
+    if isinstance(panel_members, str):
+        try:
+            panel_members = json.loads(panel_members)
+        except ValueError:
+            return []
+    if not isinstance(panel_members, list):
+        return []
+    user_ids = []
+    for member in panel_members:
+        try:
+            user_id = int(member)
+        except (TypeError, ValueError):
+            continue
+        if user_id not in user_ids:
+            user_ids.append(user_id)
+    return user_ids
+
+
+def _backfill(bind) -> None:
+    """Copy interviews.panel_members into interview_panelists"""
+    panelists = sa.table(
+        "interview_panelists",
+        sa.column("interview_id", sa.Integer),
+        sa.column("user_id", sa.Integer),
+    )
+    user_ids = {row[0] for row in bind.execute(sa.text("SELECT id FROM users"))}
+    existing = {
+        (row[0], row[1])
+        for row in bind.execute(sa.text("SELECT interview_id, user_id FROM interview_panelists"))
+    }
+
+    rows = []
+    result = bind.execute(
+        sa.text("SELECT id, panel_members FROM interviews WHERE panel_members IS NOT NULL ORDER BY id")
+    )
+    for interview_id, panel_members in result:
+        for user_id in _panel_user_ids(panel_members):
+            if user_id in user_ids and (interview_id, user_id) not in existing:
+                rows.append({"interview_id": interview_id, "user_id": user_id})
+                if len(rows) >= BATCH_SIZE:
+                    op.bulk_insert(panelists, rows)
+                    rows = []
+    if rows:
+        op.bulk_insert(panelists, rows)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    if "interview_panelists" not in existing_tables:
+        op.create_table(
+            "interview_panelists",
+            sa.Column("interview_id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["interview_id"], ["interviews.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("interview_id", "user_id"),
+        )
+
+    existing_indexes = {idx["name"] for idx in inspect(bind).get_indexes("interview_panelists")}
+    if "ix_interview_panelists_user_id_interview_id" not in existing_indexes:
+        op.create_index(
+            "ix_interview_panelists_user_id_interview_id",
+            "interview_panelists",
+            ["user_id", "interview_id"],
+            unique=False,
+        )
+
+    if "interviews" in existing_tables:
+        _backfill(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "interview_panelists" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("interview_panelists")}
+    if "ix_interview_panelists_user_id_interview_id" in existing_indexes:
+        op.drop_index("ix_interview_panelists_user_id_interview_id", table_name="interview_panelists")
+    op.drop_table("interview_panelists")
@@ -1,14 +1,17 @@
 """
 Admin dashboard API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
-from app.database import get_db
+from typing import List, Dict, Any, Optional
+from app.database import get_async_db, get_db
 from app.utils.dependencies import get_current_user, require_role
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_cursor
 from app.schemas.user import UserResponse, UserCreate, UserUpdate
 from app.schemas.mpr import MPRConfigUpdate, MPRConfigResponse
 from app.schemas.blacklist import BlacklistCreate, BlacklistResponse, BlacklistUpdate
+from app.core.security import password_hasher
 from app.crud.user import crud_user
 from app.crud.mpr import crud_mpr
 from app.crud.blacklist import crud_blacklist
@@ -24,7 +27,8 @@ def _enum_value(value):
 
 @router.get("/stats/admin-dashboard", response_model=Dict[str, Any])
 async def get_admin_stats(
-    db: Session = Depends(get_db),
+    days: int = Query(5, ge=1, le=365, description="Days of hiring velocity to return"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_role("admin"))
 ):
     """
@@ -32,15 +36,15 @@ async def get_admin_stats(
     
     Fetch all KPI data for the main admin dashboard
     """
-    service = admin_service(db)
-    return service.get_admin_stats()
+    return await db.run_sync(lambda session: admin_service(session).get_admin_stats(days=days))
 
 @router.get("/users", response_model=List[Dict[str, Any]])
 async def get_all_users(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     include_inactive: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_role("admin"))
 ):
     """
@@ -48,7 +52,8 @@ async def get_all_users(
     
     Retrieve a list of all users in the system
     """
-    users = crud_user.get_all(db, skip=skip, limit=limit, include_inactive=include_inactive)
+    users, next_cursor = await crud_user.get_all_async(db, cursor=cursor, limit=limit, include_inactive=include_inactive)
+    set_next_cursor(response, next_cursor)
     return [
         {
             "id": user.id,
@@ -103,7 +108,8 @@ async def create_user(
             detail=exc.errors(),
         )
 
-    user = crud_user.create(db, validated_user)
+    password_hash = await password_hasher.hash(validated_user.password)
+    user = crud_user.create(db, validated_user, password_hash=password_hash)
     return {
         "id": user.id,
         "name": user.name,
@@ -25,7 +25,7 @@ async def login(
     Returns JWT token and user object
     """
     service = auth_service(db)
-    result = service.authenticate_user(login_data)
+    result = await service.authenticate_user(login_data)
     
     if not result:
         raise HTTPException(
@@ -46,7 +46,7 @@ async def register(
     Creates a new user account using the selected role
     """
     service = auth_service(db)
-    result = service.register_user(register_data)
+    result = await service.register_user(register_data)
     return result
 
 @router.post("/forgot-password", response_model=Dict[str, Any])
@@ -1,12 +1,19 @@
 """
 Candidate portal API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import json
 import shutil
 import os
-from app.database import get_db
+from app.core.config import settings
+from app.database import get_async_db, get_db
 from app.utils.dependencies import get_current_user, require_role
+from app.utils.job_board_cache import etag_matches, job_board_cache
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_cursor
 from app.schemas.candidate import CandidateProfileUpdate, CandidateDocumentResponse
 from app.schemas.candidate import CandidateProfileCreate
 from app.crud.candidate import crud_candidate
@@ -14,51 +21,106 @@ from app.crud.job import crud_job
 from app.crud.offer import crud_offer
 from app.services.candidate import candidate_service
 from app.services.notifications import notification_service
+from app.services.parse_jobs import parse_job_service
+from app.crud.parse_job import crud_parse_job
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
 router = APIRouter()
 
+# Uploaded files live under UPLOAD_ROOT, which is served at /uploads
+UPLOAD_ROOT = "uploads"
+UPLOAD_URL_PREFIX = "/uploads/"
+
 # Ensure upload directory exists
-UPLOAD_DIR = "uploads/candidate_documents"
+UPLOAD_DIR = os.path.join(UPLOAD_ROOT, "candidate_documents")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+def _upload_path(document_url: Optional[str]) -> str:
+    """Filesystem path of an uploaded document from its /uploads/... URL"""
+    document_url = str(document_url or "")
+    if document_url.startswith(UPLOAD_URL_PREFIX):
+        return os.path.join(UPLOAD_ROOT, document_url[len(UPLOAD_URL_PREFIX):])
+    return document_url
+
+
 def _get_or_create_candidate_profile(db: Session, current_user: Dict[str, Any]):
-    candidate = crud_candidate.get_profile_by_user_id(db, current_user["id"])
+    candidate_id = current_user.get("candidate_id")
+    if candidate_id:
+        candidate = crud_candidate.get_profile(db, candidate_id)
+    else:
+        candidate = crud_candidate.get_profile_by_user_id(db, current_user["id"])
     if candidate:
         return candidate
 
     profile = CandidateProfileCreate(user_id=current_user["id"])
     return crud_candidate.create_profile(db, profile)
 
+def _public_job(job) -> Dict[str, Any]:
+    return {
+        "id": job.id,
+        "title": job.title,
+        "description": job.description,
+        "department": job.department,
+        "location": job.location,
+        "jobType": job.job_type,
+        "experienceRequired": job.experience_required,
+        "skillsRequired": job.skills_required or [],
+        "postedAt": job.posted_at.isoformat() if job.posted_at else None
+    }
+
 @router.get("/jobs/public", response_model=List[Dict[str, Any]])
 async def get_public_job_board(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get public job board
     
-    Get all OPEN jobs for public viewing
+    Get all OPEN jobs for public viewing. Pages are served from the job
+    board cache with a strong ETag; a matching If-None-Match gets a 304.
     """
-    jobs = crud_job.get_public_jobs(db, skip=skip, limit=limit)
-    return [
-        {
-            "id": job.id,
-            "title": job.title,
-            "description": job.description,
-            "department": job.department,
-            "location": job.location,
-            "jobType": job.job_type,
-            "experienceRequired": job.experience_required,
-            "skillsRequired": job.skills_required or [],
-            "postedAt": job.posted_at.isoformat() if job.posted_at else None
-        }
-        for job in jobs
-    ]
+    key = (cursor, limit)
+    page = job_board_cache.get(key)
+    if page is None:
+        version = job_board_cache.version
+        jobs, next_cursor = await crud_job.get_public_jobs_async(db, cursor=cursor, limit=limit)
+        payload = [_public_job(job) for job in jobs]
+        body = json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        page = job_board_cache.set(key, version, body, next_cursor)
+
+    headers = {
+        "ETag": page.etag,
+        "Cache-Control": f"public, max-age={settings.JOB_BOARD_MAX_AGE_SECONDS}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), page.etag):
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        response = Response(content=page.body, media_type="application/json", headers=headers)
+    set_next_cursor(response, page.next_cursor)
+    return response
+
+@router.get("/jobs/public/search", response_model=List[Dict[str, Any]])
+async def search_public_job_board(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Search public job board
+    
+    Full-text search over title, description, requirements and skills of
+    OPEN public jobs, most relevant first
+    """
+    jobs, next_cursor = await crud_job.search_public_jobs_async(db, q, cursor=cursor, limit=limit)
+    set_next_cursor(response, next_cursor)
+    return [_public_job(job) for job in jobs]
 
 @router.post("/jobs/{job_id}/apply", response_model=Dict[str, Any])
 async def apply_for_job(
@@ -269,14 +331,15 @@ async def upload_document(
     """
     Upload a new document (e.g., resume, ID proof)
     
-    If document_type is 'resume' and parse_resume is True, 
-    automatically parse and update candidate profile
+    If document_type is 'resume' and parse_resume is True, a background
+    parse job is queued; poll /candidate/resume/parse-jobs/{job_id} for the
+    outcome. The profile is updated when the job completes.
     """
     # Get candidate profile
     candidate = _get_or_create_candidate_profile(db, current_user)
     
     # Create upload directory if it doesn't exist
-    UPLOAD_DIR = f"uploads/candidate_{candidate.id}"
+    UPLOAD_DIR = os.path.join(UPLOAD_ROOT, f"candidate_{candidate.id}")
     os.makedirs(UPLOAD_DIR, exist_ok=True)
     
     # Generate unique filename
@@ -294,7 +357,7 @@ async def upload_document(
     db_document = CandidateDocument(
         candidate_id=candidate.id,
         document_type=document_type,
-        document_url=f"/uploads/candidate_{candidate.id}/{unique_filename}",
+        document_url=f"{UPLOAD_URL_PREFIX}candidate_{candidate.id}/{unique_filename}",
         file_name=file.filename,
         file_size=os.path.getsize(file_location)
     )
@@ -316,31 +379,12 @@ async def upload_document(
         "parsed": False
     }
     
-    # Parse resume if requested
+    # Queue resume parsing; the background worker merges results into the profile
     if document_type == "resume" and parse_resume:
-        try:
-            service = candidate_service(db)
-            parse_result = service.parse_and_update_profile(candidate.id, file_location)
-            
-            if parse_result.get("success"):
-                db_document.verified = True
-                db.add(db_document)
-                db.commit()
-                db.refresh(db_document)
-                response["parsed"] = True
-                response["parse_result"] = {
-                    "updates_applied": parse_result.get("updates_applied", []),
-                    "skills_extracted": len(parse_result.get("parsed_data", {}).get("skills", [])),
-                    "experience_extracted": parse_result.get("parsed_data", {}).get("experience", 0)
-                }
-                response["message"] = "Resume parsed successfully. Profile updated with extracted information."
-            else:
-                response["parse_error"] = parse_result.get("error")
-                response["message"] = "Resume uploaded but parsing failed."
-        
-        except Exception as e:
-            response["parse_error"] = str(e)
-            response["message"] = "Resume uploaded but parsing encountered an error."
+        job = parse_job_service(db).enqueue_document(candidate.id, db_document.id, file_location)
+        response["parseJobId"] = job.id
+        response["parseStatus"] = job.status
+        response["message"] = "Resume uploaded. Parsing has been queued and the profile will update shortly."
     
     return response
 
@@ -364,7 +408,7 @@ async def delete_document(
             detail="Document not found"
         )
 
-    file_location = str(document.document_url or "").replace("/uploads/", "uploads/")
+    file_location = _upload_path(document.document_url)
     if file_location and os.path.exists(file_location):
         try:
             os.remove(file_location)
@@ -530,16 +574,18 @@ async def parse_resume(
         )
     
     # Get file path
-    file_location = document.document_url.replace("/uploads/", "uploads/")
+    file_location = _upload_path(document.document_url)
     if not os.path.exists(file_location):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume file not found"
         )
     
-    # Parse resume
+    # Parse resume; the parse blocks on the engine, so keep it off the event loop
     service = candidate_service(db)
-    parse_result = service.parse_and_update_profile(candidate.id, file_location)
+    parse_result = await run_in_threadpool(
+        service.parse_and_update_profile, candidate.id, file_location, document_id=document.id
+    )
     
     if not parse_result.get("success"):
         raise HTTPException(
@@ -564,6 +610,25 @@ async def parse_resume(
         }
     }
 
+@router.get("/candidate/resume/parse-jobs/{job_id}", response_model=Dict[str, Any])
+async def get_parse_job_status(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: Dict = Depends(require_role("candidate"))
+):
+    """
+    Get the status of a background resume parse job
+    """
+    candidate = _get_or_create_candidate_profile(db, current_user)
+    job = crud_parse_job.get_job(db, job_id)
+    if not job or job.candidate_id != candidate.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parse job not found"
+        )
+
+    return parse_job_service.serialize(job)
+
 @router.get("/candidate/resume/suggestions/{job_id}", response_model=Dict[str, Any])
 async def get_resume_suggestions(
     job_id: int,
@@ -1,11 +1,13 @@
 """
 Manager dashboard API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
-from app.database import get_db
+from typing import List, Dict, Any, Optional
+from app.database import get_async_db, get_db
 from app.utils.dependencies import require_any_role
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_cursor
 from app.schemas.mpr import MPRCreate, MPRResponse
 from app.schemas.interview import InterviewResponse
 from app.crud.mpr import crud_mpr
@@ -21,7 +23,7 @@ def _enum_value(value):
 
 @router.get("/stats/manager-dashboard", response_model=Dict[str, Any])
 async def get_manager_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_any_role(["manager", "admin"]))
 ):
     """
@@ -29,12 +31,13 @@ async def get_manager_stats(
     
     Fetch KPIs for the hiring manager hub
     """
-    service = manager_service(db)
-    return service.get_manager_stats(current_user["id"])
+    return await db.run_sync(
+        lambda session: manager_service(session).get_manager_stats(current_user["id"])
+    )
 
 @router.get("/manager/pipeline", response_model=List[Dict[str, Any]])
 async def get_manager_pipeline(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_any_role(["manager", "admin"]))
 ):
     """
@@ -42,22 +45,33 @@ async def get_manager_pipeline(
     
     Get pipeline stats for requisitions owned by the manager
     """
-    service = manager_service(db)
-    return service.get_manager_pipeline(current_user["id"])
+    return await db.run_sync(
+        lambda session: manager_service(session).get_manager_pipeline(current_user["id"])
+    )
 
 
 @router.get("/manager/pipeline-candidates", response_model=List[Dict[str, Any]])
 async def get_manager_pipeline_candidates(
     job_title: str,
     stage: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: Dict = Depends(require_any_role(["manager", "admin"]))
 ):
     """
     Get candidate drill-down for a manager pipeline stage.
+
+    Returns every candidate unless `limit` (or `cursor`) is passed, in which
+    case the response is paged and X-Next-Cursor points at the next page.
     """
     service = manager_service(db)
-    return service.get_pipeline_candidates(current_user["id"], job_title, stage)
+    candidates, next_cursor = service.get_pipeline_candidates(
+        current_user["id"], job_title, stage, cursor=cursor, limit=limit
+    )
+    set_next_cursor(response, next_cursor)
+    return candidates
 
 @router.get("/mpr/my-requests", response_model=List[Dict[str, Any]])
 async def get_my_mprs(
@@ -1,13 +1,15 @@
 """
 Recruiter dashboard API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.utils.dependencies import get_current_user, require_role, require_any_role
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_next_cursor
 from app.schemas.agency import AgencyCreate, AgencyResponse, AgencyStatusUpdate
 from app.schemas.job import JobCreate, JobResponse, JobUpdate
 from app.schemas.mpr import MPRResponse
@@ -22,9 +24,10 @@ from app.crud.interview import crud_interview
 from app.crud.offer import crud_offer
 from app.services.recruiter import recruiter_service
 from app.services.notifications import notification_service
+from app.services.pipeline_counters import get_pipeline_counts_by_mpr, reconcile_pipeline_counters
 from pydantic import ValidationError
 from app.models.candidate import CandidateApplication, CandidateDocument
-from app.models.interview import Interview, InterviewEvaluation, InterviewRound, InterviewMode, InterviewStatus
+from app.models.interview import Interview, InterviewEvaluation, InterviewPanelist, InterviewRound, InterviewMode, InterviewStatus
 from app.models.offer import Offer
 from app.models.mpr import MPR
 
@@ -35,6 +38,20 @@ def _enum_value(value):
     return value.value if hasattr(value, "value") else value
 
 
+def _pipeline_stats(mpr: MPR, counts: Optional[Dict[str, int]]) -> Any:
+    """
+    Live stage counters under the keys of the legacy pipeline_stats JSON;
+    the stored stats as they are for MPRs without linked jobs (no counts)
+    """
+    if counts is None:
+        return mpr.pipeline_stats
+    stats = dict(mpr.pipeline_stats) if isinstance(mpr.pipeline_stats, dict) else {}
+    stats.update(counts)
+    stats["profilesReceived"] = counts["sourced"]
+    stats["selected"] = counts["hired"]
+    return stats
+
+
 def _generate_job_content(title: str) -> Dict[str, str]:
     normalized_title = (title or "").strip()
     lower_title = normalized_title.lower()
@@ -152,13 +169,16 @@ def _ensure_interview_pipeline_seed(db: Session, recruiter_id: int) -> None:
                     "interview_mode": _enum_value(interview.mode),
                     "company": "HirePulse",
                 },
+                commit=False,
             )
         except Exception:
             continue
+    if created_interviews:
+        db.commit()
 
 @router.get("/stats/recruiter-dashboard", response_model=Dict[str, Any])
 async def get_recruiter_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
     """
@@ -166,8 +186,9 @@ async def get_recruiter_stats(
     
     Fetch KPIs and the main pipeline matrix for the recruiter
     """
-    service = recruiter_service(db)
-    return service.get_recruiter_stats(current_user["id"])
+    return await db.run_sync(
+        lambda session: recruiter_service(session).get_recruiter_stats(current_user["id"])
+    )
 
 @router.get("/agencies", response_model=List[Dict[str, Any]])
 async def get_all_agencies(
@@ -333,6 +354,9 @@ async def agency_candidate_submission(
 
 @router.get("/jobs", response_model=List[Dict[str, Any]])
 async def get_all_jobs(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
@@ -341,7 +365,8 @@ async def get_all_jobs(
     
     Get all job requisitions (for internal view)
     """
-    jobs = crud_job.get_all_jobs(db)
+    jobs, next_cursor = crud_job.get_all_jobs(db, cursor=cursor, limit=limit)
+    set_next_cursor(response, next_cursor)
     return [
         {
             "id": job.id,
@@ -528,6 +553,9 @@ async def delete_job_posting(
 
 @router.get("/mpr", response_model=List[Dict[str, Any]])
 async def get_all_mprs(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
@@ -536,7 +564,9 @@ async def get_all_mprs(
     
     Get all Manpower Requisitions
     """
-    mprs = crud_mpr.get_all_mprs(db)
+    mprs, next_cursor = crud_mpr.get_all_mprs(db, cursor=cursor, limit=limit)
+    set_next_cursor(response, next_cursor)
+    pipeline_counts = get_pipeline_counts_by_mpr(db, [mpr.id for mpr in mprs])
     return [
         {
             "id": mpr.id,
@@ -549,7 +579,7 @@ async def get_all_mprs(
             "daysLeft": 0,
             "positionsRequested": mpr.positions_requested,
             "positionsApproved": mpr.positions_approved,
-            "pipelineStats": mpr.pipeline_stats
+            "pipelineStats": _pipeline_stats(mpr, pipeline_counts.get(mpr.id))
         }
         for mpr in mprs
     ]
@@ -577,7 +607,10 @@ async def update_mpr_status(
 
 @router.get("/candidates", response_model=List[Dict[str, Any]])
 async def get_all_candidates(
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
     """
@@ -585,59 +618,41 @@ async def get_all_candidates(
     
     Retrieve all candidates in the database
     """
-    candidates = crud_candidate.get_all_profiles(db)
-    response: List[Dict[str, Any]] = []
-    for candidate in candidates:
-        latest_application = db.query(CandidateApplication).filter(
-            CandidateApplication.candidate_id == candidate.id
-        ).order_by(CandidateApplication.applied_at.desc()).first()
-        candidate_docs = db.query(CandidateDocument).filter(
-            CandidateDocument.candidate_id == candidate.id
-        ).all()
-        latest_resume = next(
-            (
-                d for d in sorted(
-                    candidate_docs,
-                    key=lambda x: x.uploaded_at.isoformat() if x.uploaded_at else "",
-                    reverse=True
-                )
-                if str(d.document_type).lower() == "resume"
-            ),
-            None
-        )
-
-        def _doc_status(doc_type: str) -> str:
-            doc = next(
-                (
-                    d for d in candidate_docs
-                    if str(d.document_type).lower() == doc_type
-                    or str(d.document_type).lower().startswith(f"{doc_type}_")
-                ),
-                None
-            )
-            if not doc:
-                return "MISSING"
-            return "VERIFIED" if bool(doc.verified) else "PENDING"
-
-        response.append(
-            {
-                "id": candidate.id,
-                "name": candidate.user.name if candidate.user else "",
-                "email": candidate.user.email if candidate.user else "",
-                "skills": candidate.skills or [],
-                "experience": candidate.experience_years,
-                "currentCompany": candidate.current_company,
-                "currentRole": latest_application.job.title if latest_application and latest_application.job else candidate.current_position,
-                "status": latest_application.status if latest_application else "applied",
-                "matchScore": latest_application.ai_score if latest_application and latest_application.ai_score is not None else 0,
-                "appliedDate": latest_application.applied_at.isoformat() if latest_application and latest_application.applied_at else None,
-                "applicationId": latest_application.id if latest_application else None,
-                "resumeUrl": candidate.resume_url or (latest_resume.document_url if latest_resume else ""),
-                "aadhaarStatus": _doc_status("aadhaar"),
-                "panStatus": _doc_status("pan"),
-            }
+    candidates, next_cursor = await db.run_sync(
+        lambda session: recruiter_service(session).get_candidate_list(cursor=cursor, limit=limit)
+    )
+    set_next_cursor(response, next_cursor)
+    return candidates
+
+@router.get("/candidates/search", response_model=Dict[str, Any])
+async def search_candidates(
+    response: Response,
+    skills: str = Query(..., min_length=1, description="Comma-separated skill names"),
+    match: str = Query("all", pattern="^(all|any)$"),
+    min_exp: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Dict = Depends(require_role("recruiter"))
+):
+    """
+    Search candidates by skill
+    
+    Candidates with all (match=all) or any (match=any) of the given skills
+    and at least min_exp years of experience, with match counts
+    """
+    skill_names = [skill for skill in skills.split(",") if skill.strip()]
+    result, next_cursor = await db.run_sync(
+        lambda session: recruiter_service(session).search_candidates(
+            skill_names,
+            match_all=match == "all",
+            min_experience=min_exp,
+            cursor=cursor,
+            limit=limit,
         )
-    return response
+    )
+    set_next_cursor(response, next_cursor)
+    return result
 
 @router.put("/candidates/{candidate_id}/status", response_model=Dict[str, Any])
 async def update_candidate_status(
@@ -781,15 +796,22 @@ async def delete_candidate_profile(
     interview_ids = [
         row[0] for row in db.query(Interview.id).filter(Interview.candidate_id == candidate_id).all()
     ]
+    pipeline_job_ids = {
+        row[0] for row in db.query(CandidateApplication.job_id).filter(CandidateApplication.candidate_id == candidate_id)
+    } | {row[0] for row in db.query(Offer.job_id).filter(Offer.candidate_id == candidate_id)}
     if interview_ids:
         db.query(InterviewEvaluation).filter(
             InterviewEvaluation.interview_id.in_(interview_ids)
         ).delete(synchronize_session=False)
+        db.query(InterviewPanelist).filter(
+            InterviewPanelist.interview_id.in_(interview_ids)
+        ).delete(synchronize_session=False)
 
     db.query(Offer).filter(Offer.candidate_id == candidate_id).delete(synchronize_session=False)
     db.query(Interview).filter(Interview.candidate_id == candidate_id).delete(synchronize_session=False)
     db.query(CandidateApplication).filter(CandidateApplication.candidate_id == candidate_id).delete(synchronize_session=False)
     db.query(CandidateDocument).filter(CandidateDocument.candidate_id == candidate_id).delete(synchronize_session=False)
+    reconcile_pipeline_counters(db, pipeline_job_ids, commit=False)
     db.delete(candidate)
     db.commit()
 
@@ -837,6 +859,9 @@ async def ai_candidate_screening(
 
 @router.get("/interviews", response_model=List[Dict[str, Any]])
 async def get_all_interviews(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
@@ -846,7 +871,8 @@ async def get_all_interviews(
     Get a list of all scheduled/completed interviews
     """
     _ensure_interview_pipeline_seed(db, current_user["id"])
-    interviews = crud_interview.get_all_interviews(db)
+    interviews, next_cursor = crud_interview.get_all_interviews(db, cursor=cursor, limit=limit)
+    set_next_cursor(response, next_cursor)
     return [
         {
             "id": interview.id,
@@ -1000,6 +1026,9 @@ async def submit_interview_evaluation(
 
 @router.get("/offers", response_model=List[Dict[str, Any]])
 async def get_all_offers(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: Dict = Depends(require_role("recruiter"))
 ):
@@ -1008,7 +1037,8 @@ async def get_all_offers(
     
     Get all offers released
     """
-    offers = crud_offer.get_all_offers(db)
+    offers, next_cursor = crud_offer.get_all_offers(db, cursor=cursor, limit=limit)
+    set_next_cursor(response, next_cursor)
     return [
         {
             "id": offer.id,
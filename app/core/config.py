@@ -60,6 +60,7 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = _database_url_from_env()
+    ASYNC_DATABASE_URL: Optional[str] = None  # derived from DATABASE_URL when unset
     
     # JWT
     SECRET_KEY: str = "change-me-in-production"
@@ -72,6 +73,21 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173,http://127.0.0.1:5173"
     CORS_ALLOW_ORIGIN_REGEX: str = r"https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 
+    # Password hashing: bcrypt cost (stored hashes with another cost are
+    # rehashed on login) and the threads that run it off the event loop
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # Authenticated principals cached per token; 0 disables the cache
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Public job board pages cached in process (0 disables the cache) and
+    # the Cache-Control max-age sent to browsers and CDNs
+    JOB_BOARD_CACHE_TTL_SECONDS: float = 30.0
+    JOB_BOARD_CACHE_MAX_ENTRIES: int = 256
+    JOB_BOARD_MAX_AGE_SECONDS: int = 30
+
     # Email notifications
     EMAIL_ENABLED: bool = True
     SMTP_HOST: str = "localhost"
@@ -80,6 +96,35 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     SMTP_USE_TLS: bool = False
     EMAIL_FROM: str = "no-reply@hirepulse.com"
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100  # reconnect after this many messages
+    SMTP_IDLE_TIMEOUT_SECONDS: float = 30.0  # close an unused connection after this long
+    EMAIL_OUTBOX_WORKERS: int = 1  # sender threads; 0 disables background delivery
+    EMAIL_OUTBOX_POLL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 300
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 60.0
+    EMAIL_RATE_LIMIT_PER_SECOND: float = 10.0  # across all sender threads, 0 = unlimited
+
+    # Background resume parsing
+    RESUME_PARSE_WORKERS: int = 1  # queue-polling threads; 0 disables them
+    RESUME_PARSE_POLL_SECONDS: float = 2.0
+    RESUME_PARSE_MAX_ATTEMPTS: int = 3
+    RESUME_PARSE_RETRY_BACKOFF_SECONDS: float = 30.0
+    RESUME_PARSE_LEASE_SECONDS: int = 300
+    RESUME_PARSE_PROCESSES: int = 2  # 0 parses in the worker thread itself
+    RESUME_PARSE_TIMEOUT_SECONDS: float = 60.0
+    RESUME_PARSE_MEMORY_LIMIT_MB: int = 2048  # per parser process, 0 = unlimited
+    RESUME_PARSE_MAX_TASKS_PER_CHILD: int = 200
+    RESUME_PARSE_CACHE_DIR: str = "uploads/parse_cache"  # empty = memory only
+    RESUME_PARSE_CACHE_MAX_MB: int = 256
+    RESUME_PARSE_CACHE_MEMORY_ENTRIES: int = 512
+    RESUME_SKILL_TAXONOMY_PATH: str = ""  # JSON skill taxonomy; empty = built-in
+    RESUME_PDF_BACKEND: str = "auto"  # auto, pdftotext or pdfminer
+    RESUME_PDFTOTEXT_PATH: str = "pdftotext"
+    RESUME_PDF_MAX_PAGES: int = 20  # 0 = every page
+    RESUME_PDF_TIMEOUT_SECONDS: float = 15.0  # per pdftotext run
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -1,8 +1,13 @@
 """
 Security utilities for authentication and authorization
 """
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -21,8 +26,13 @@ except Exception:
     # If bcrypt is unavailable here, passlib will handle errors during hashing/verify.
     pass
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. Hashes made with a different cost are flagged
+# by verify_and_update and rehashed on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -36,6 +46,96 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL while it hashes, so threads hash in parallel
+    without a process pool's start-up and pickling cost. `workers` caps how
+    many hashes run at once; further requests queue for a free thread
+    instead of stalling every other request on the event loop.
+    """
+
+    def __init__(self, context: CryptContext, workers: int = 4):
+        self.context = context
+        self.workers = max(1, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rehashed = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _timed(self, fn: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._timed, fn, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost"""
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plain password against a hashed password"""
+        return await self._run(self.context.verify, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and, when the stored hash uses an outdated scheme
+        or cost, return a fresh hash to store (else None).
+        """
+        verified, new_hash = await self._run(self.context.verify_and_update, plain_password, hashed_password)
+        if new_hash:
+            with self._lock:
+                self._rehashed += 1
+        return verified, new_hash
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool metrics for the health endpoint"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.workers),
+                "completed": self._completed,
+                "rehashed": self._rehashed,
+                "avg_ms": round(self._total_seconds / self._completed * 1000, 1) if self._completed else 0.0,
+                "max_ms": round(self._max_seconds * 1000, 1),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(pwd_context, workers=settings.PASSWORD_HASH_WORKERS)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
@@ -48,6 +148,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
+    # Token id: the key authenticated principals are cached under
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -1,13 +1,19 @@
 """
 CRUD operations for Candidate models
 """
-from sqlalchemy.orm import Session
-from typing import Optional, List, Union, Dict, Any
-from app.models.candidate import Candidate, CandidateDocument, CandidateApplication
+from sqlalchemy import distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Union, Dict, Any, Iterable, Tuple
+from app.models.candidate import (
+    Candidate, CandidateDocument, CandidateApplication, CandidateSkill, ParsedResume, Skill
+)
 from app.schemas.candidate import (
     CandidateProfileCreate, CandidateProfileUpdate,
     CandidateDocumentCreate, CandidateApplicationCreate, CandidateApplicationUpdate
 )
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
+from app.services.skill_index import normalize_skills
 
 class CRUDCandidate:
     # Candidate Profile operations
@@ -18,11 +24,96 @@ class CRUDCandidate:
     def get_profile_by_user_id(self, db: Session, user_id: int) -> Optional[Candidate]:
         """Get candidate profile by user ID"""
         return db.query(Candidate).filter(Candidate.user_id == user_id).first()
+
+    def get_profile_id_by_user_id(self, db: Session, user_id: int) -> Optional[int]:
+        """Get candidate profile ID by user ID"""
+        return db.query(Candidate.id).filter(Candidate.user_id == user_id).scalar()
+    
+    def get_all_profiles(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """Get a page of candidate profiles ordered by ID"""
+        query = db.query(Candidate).options(joinedload(Candidate.user))
+        return paginate(query, Candidate.id, cursor=cursor, limit=limit)
     
-    def get_all_profiles(self, db: Session, skip: int = 0, limit: int = 100) -> List[Candidate]:
-        """Get all candidate profiles"""
-        return db.query(Candidate).offset(skip).limit(limit).all()
+    async def get_all_profiles_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """Async variant of get_all_profiles"""
+        return await db.run_sync(self.get_all_profiles, cursor=cursor, limit=limit)
     
+    @staticmethod
+    def _skill_matches(names: List[str], match_all: bool):
+        """SELECT of the ids of candidates with all (or any) of `names`"""
+        matches = (
+            select(CandidateSkill.candidate_id)
+            .join(Skill, Skill.id == CandidateSkill.skill_id)
+            .where(Skill.name.in_(names))
+        )
+        if match_all:
+            return matches.group_by(CandidateSkill.candidate_id).having(func.count() == len(names))
+        return matches.distinct()
+
+    def search_profiles(
+        self,
+        db: Session,
+        skills: Iterable[str],
+        match_all: bool = True,
+        min_experience: int = 0,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Tuple[List[Candidate], Optional[str]]:
+        """
+        Get a page of candidate profiles, ordered by ID, that have all (or,
+        with `match_all=False`, any) of `skills` and at least
+        `min_experience` years of experience. Skills are matched through
+        the candidate_skills index.
+        """
+        names = sorted(normalize_skills(list(skills)))
+        if not names:
+            return [], None
+        query = (
+            db.query(Candidate)
+            .options(joinedload(Candidate.user))
+            .filter(Candidate.id.in_(self._skill_matches(names, match_all)))
+        )
+        if min_experience:
+            query = query.filter(Candidate.experience_years >= min_experience)
+        return paginate(query, Candidate.id, cursor=cursor, limit=limit)
+
+    def count_profiles_by_skill(
+        self,
+        db: Session,
+        skills: Iterable[str],
+        match_all: bool = True,
+        min_experience: int = 0,
+    ) -> Tuple[int, Dict[str, int]]:
+        """
+        Number of profiles `search_profiles` matches in total, and how many
+        of them have each requested skill (keyed by normalized name)
+        """
+        names = sorted(normalize_skills(list(skills)))
+        if not names:
+            return 0, {}
+        matches = self._skill_matches(names, match_all)
+        if min_experience:
+            matches = select(Candidate.id).where(
+                Candidate.id.in_(matches), Candidate.experience_years >= min_experience
+            )
+        matches = matches.subquery()
+        total = db.query(func.count()).select_from(matches).scalar() or 0
+        rows = (
+            db.query(Skill.name, func.count(distinct(CandidateSkill.candidate_id)))
+            .join(CandidateSkill, CandidateSkill.skill_id == Skill.id)
+            .join(matches, matches.c[0] == CandidateSkill.candidate_id)
+            .filter(Skill.name.in_(names))
+            .group_by(Skill.name)
+            .all()
+        )
+        by_skill = dict.fromkeys(names, 0)
+        by_skill.update({name: count for name, count in rows})
+        return int(total), by_skill
+
     def create_profile(self, db: Session, profile_in: CandidateProfileCreate) -> Candidate:
         """Create a candidate profile"""
         db_profile = Candidate(**profile_in.dict())
@@ -81,6 +172,57 @@ class CRUDCandidate:
         db.commit()
         return True
     
+    # Parsed resume operations
+    def get_latest_parsed_resumes(self, db: Session, candidate_ids: Iterable[int]) -> Dict[int, ParsedResume]:
+        """Get the latest parsed resume for each candidate in a single query"""
+        ids = list({candidate_id for candidate_id in candidate_ids if candidate_id is not None})
+        if not ids:
+            return {}
+        
+        ranked = (
+            db.query(
+                ParsedResume.id.label("id"),
+                func.row_number().over(
+                    partition_by=ParsedResume.candidate_id,
+                    order_by=ParsedResume.id.desc(),
+                ).label("position"),
+            )
+            .join(CandidateDocument, CandidateDocument.id == ParsedResume.document_id)
+            .filter(ParsedResume.candidate_id.in_(ids))
+            .subquery()
+        )
+        rows = (
+            db.query(ParsedResume)
+            .join(ranked, ranked.c.id == ParsedResume.id)
+            .filter(ranked.c.position == 1)
+            .all()
+        )
+        return {row.candidate_id: row for row in rows}
+    
+    def get_latest_parsed_resume(self, db: Session, candidate_id: int) -> Optional[ParsedResume]:
+        """Get the latest parsed resume for a candidate"""
+        return self.get_latest_parsed_resumes(db, [candidate_id]).get(candidate_id)
+    
+    def save_parsed_resume(
+        self,
+        db: Session,
+        candidate_id: int,
+        document_id: int,
+        data: Dict[str, Any],
+        parser_version: Optional[str] = None,
+    ) -> ParsedResume:
+        """Create or replace the parsed resume for a document"""
+        db_parsed = db.query(ParsedResume).filter(ParsedResume.document_id == document_id).first()
+        if not db_parsed:
+            db_parsed = ParsedResume(candidate_id=candidate_id, document_id=document_id)
+        db_parsed.data = data
+        db_parsed.parser_version = parser_version
+        
+        db.add(db_parsed)
+        db.commit()
+        db.refresh(db_parsed)
+        return db_parsed
+    
     # Candidate Application operations
     def get_application(self, db: Session, application_id: int) -> Optional[CandidateApplication]:
         """Get candidate application by ID"""
@@ -1,10 +1,14 @@
 """
 CRUD operations for Interview models
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from app.models.interview import Interview, InterviewEvaluation
+from typing import Iterable, Optional, List, Tuple
+from app.core.exceptions import BadRequestException
+from app.models.interview import Interview, InterviewEvaluation, InterviewPanelist, panel_user_ids
+from app.models.user import User
 from app.schemas.interview import InterviewCreate, InterviewUpdate, InterviewEvaluationCreate
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 class CRUDInterview:
     # Interview operations
@@ -12,9 +16,24 @@ class CRUDInterview:
         """Get interview by ID"""
         return db.query(Interview).filter(Interview.id == interview_id).first()
     
-    def get_all_interviews(self, db: Session, skip: int = 0, limit: int = 100) -> List[Interview]:
-        """Get all interviews"""
-        return db.query(Interview).offset(skip).limit(limit).all()
+    def get_all_interviews(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Interview], Optional[str]]:
+        """Get a page of interviews, latest scheduled first"""
+        return paginate(
+            db.query(Interview),
+            Interview.id,
+            sort_key=Interview.scheduled_time,
+            cursor=cursor,
+            limit=limit,
+            descending=True,
+        )
+    
+    async def get_all_interviews_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Interview], Optional[str]]:
+        """Async variant of get_all_interviews"""
+        return await db.run_sync(self.get_all_interviews, cursor=cursor, limit=limit)
     
     def get_interviews_by_candidate(self, db: Session, candidate_id: int) -> List[Interview]:
         """Get interviews by candidate"""
@@ -22,13 +41,29 @@ class CRUDInterview:
     
     def get_interviews_by_panel_member(self, db: Session, user_id: int) -> List[Interview]:
         """Get interviews where user is on panel"""
-        from sqlalchemy import cast, String
-        return db.query(Interview).filter(
-            cast(Interview.panel_members, String).like(f'%{user_id}%')
-        ).all()
+        return (
+            db.query(Interview)
+            .join(InterviewPanelist, InterviewPanelist.interview_id == Interview.id)
+            .filter(InterviewPanelist.user_id == user_id)
+            .all()
+        )
     
+    def check_panel_members(self, db: Session, panel_members: Optional[Iterable]) -> None:
+        """
+        Reject panel members that are not users: each one becomes an
+        interview_panelists row, whose user_id is a foreign key to users.
+        """
+        user_ids = panel_user_ids(panel_members)
+        if not user_ids:
+            return
+        known = {row[0] for row in db.query(User.id).filter(User.id.in_(user_ids))}
+        unknown = [user_id for user_id in user_ids if user_id not in known]
+        if unknown:
+            raise BadRequestException(f"Unknown panel member user id(s): {', '.join(map(str, unknown))}")
+
     def create_interview(self, db: Session, interview_in: InterviewCreate) -> Interview:
         """Create an interview"""
+        self.check_panel_members(db, interview_in.panel_members)
         db_interview = Interview(**interview_in.dict())
         db.add(db_interview)
         db.commit()
@@ -42,6 +77,8 @@ class CRUDInterview:
             return None
         
         update_data = interview_in.dict(exclude_unset=True)
+        if "panel_members" in update_data:
+            self.check_panel_members(db, update_data["panel_members"])
         for field, value in update_data.items():
             setattr(db_interview, field, value)
         
@@ -1,15 +1,23 @@
 """
 CRUD operations for Job models
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional, List
+from sqlalchemy import Float, Integer, String, and_, case, cast, func, literal_column
+from typing import Optional, List, Tuple
+import re
 from datetime import datetime
 from app.models.job import Job, JobRequisition, JobStatus
 from app.models.candidate import CandidateApplication
-from app.models.interview import Interview, InterviewEvaluation
+from app.models.interview import Interview, InterviewEvaluation, InterviewPanelist
 from app.models.offer import Offer
 from app.schemas.job import JobCreate, JobUpdate, JobRequisitionCreate
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
+from app.services.pipeline_counters import reconcile_pipeline_counters
+from app.utils.job_board_cache import job_board_cache
+
+# Words of a job search query that are matched (the rest are ignored)
+MAX_SEARCH_TERMS = 8
 
 class CRUDJob:
     # Job operations
@@ -17,16 +25,87 @@ class CRUDJob:
         """Get job by ID"""
         return db.query(Job).filter(Job.id == job_id).first()
     
-    def get_all_jobs(self, db: Session, skip: int = 0, limit: int = 100) -> List[Job]:
-        """Get all jobs"""
-        return db.query(Job).offset(skip).limit(limit).all()
+    def get_all_jobs(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Get a page of jobs, newest first"""
+        return paginate(db.query(Job), Job.id, cursor=cursor, limit=limit, descending=True)
+    
+    async def get_all_jobs_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Async variant of get_all_jobs"""
+        return await db.run_sync(self.get_all_jobs, cursor=cursor, limit=limit)
     
-    def get_public_jobs(self, db: Session, skip: int = 0, limit: int = 100) -> List[Job]:
-        """Get public/open jobs"""
+    @staticmethod
+    def _public_jobs_query(db: Session):
         return db.query(Job).filter(
             func.lower(Job.visibility) == "public",
             func.lower(Job.status) == JobStatus.OPEN.value
-        ).order_by(Job.posted_at.desc().nullslast(), Job.created_at.desc()).offset(skip).limit(limit).all()
+        )
+
+    def get_public_jobs(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Get a page of public/open jobs, most recently posted first"""
+        return paginate(
+            self._public_jobs_query(db),
+            Job.id,
+            sort_key=func.coalesce(Job.posted_at, Job.created_at),
+            cursor=cursor,
+            limit=limit,
+            descending=True,
+        )
+    
+    async def get_public_jobs_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Async variant of get_public_jobs"""
+        return await db.run_sync(self.get_public_jobs, cursor=cursor, limit=limit)
+
+    def search_public_jobs(
+        self, db: Session, q: str, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """
+        Get a page of public/open jobs matching every word of `q`, most
+        relevant first.
+
+        On PostgreSQL this is a GIN-indexed `jobs.search_vector @@
+        websearch_to_tsquery` ranked by ts_rank; elsewhere (SQLite tests) each
+        word is matched with LIKE and title hits rank above other fields.
+        """
+        terms = [term.lower() for term in re.findall(r"[\w+#.-]+", q or "")][:MAX_SEARCH_TERMS]
+        if not terms:
+            return [], None
+
+        query = self._public_jobs_query(db)
+        if db.get_bind().dialect.name == "postgresql":
+            vector = literal_column("jobs.search_vector")
+            tsquery = func.websearch_to_tsquery("english", q)
+            query = query.filter(vector.op("@@")(tsquery))
+            rank = func.ts_rank(vector, tsquery, type_=Float)
+        else:
+            title = func.lower(Job.title)
+            document = (
+                func.lower(func.coalesce(cast(Job.skills_required, String), ""))
+                + " " + func.lower(func.coalesce(Job.description, ""))
+                + " " + func.lower(func.coalesce(Job.requirements, ""))
+            )
+            query = query.filter(and_(*[
+                title.contains(term, autoescape=True) | document.contains(term, autoescape=True)
+                for term in terms
+            ]))
+            rank = sum(
+                (case((title.contains(term, autoescape=True), 2), else_=1) for term in terms),
+                start=cast(0, Integer),
+            )
+        return paginate(query, Job.id, sort_key=rank, cursor=cursor, limit=limit, descending=True)
+
+    async def search_public_jobs_async(
+        self, db: AsyncSession, q: str, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Async variant of search_public_jobs"""
+        return await db.run_sync(self.search_public_jobs, q, cursor=cursor, limit=limit)
     
     def get_jobs_by_manager(self, db: Session, manager_id: int) -> List[Job]:
         """Get jobs by manager"""
@@ -57,6 +136,8 @@ class CRUDJob:
             synchronize_session=False,
         )
         db.commit()
+        # Bulk UPDATE bypasses the session events that invalidate the board
+        job_board_cache.bump()
         return int(updated or 0)
     
     def update_job(self, db: Session, job_id: int, job_in: JobUpdate) -> Optional[Job]:
@@ -88,6 +169,9 @@ class CRUDJob:
             db.query(InterviewEvaluation).filter(
                 InterviewEvaluation.interview_id.in_(interview_ids)
             ).delete(synchronize_session=False)
+            db.query(InterviewPanelist).filter(
+                InterviewPanelist.interview_id.in_(interview_ids)
+            ).delete(synchronize_session=False)
 
         db.query(Offer).filter(Offer.job_id == job_id).delete(synchronize_session=False)
         db.query(Interview).filter(Interview.job_id == job_id).delete(synchronize_session=False)
@@ -95,6 +179,7 @@ class CRUDJob:
             CandidateApplication.job_id == job_id
         ).delete(synchronize_session=False)
         db.query(JobRequisition).filter(JobRequisition.job_id == job_id).delete(synchronize_session=False)
+        reconcile_pipeline_counters(db, [job_id], commit=False)
 
         db.delete(db_job)
         db.commit()
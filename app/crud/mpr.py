@@ -1,10 +1,12 @@
 """
 CRUD operations for MPR models
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from app.models.mpr import MPR, MPRConfig
 from app.schemas.mpr import MPRCreate, MPRUpdate, MPRConfigUpdate
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 class CRUDMPR:
     # MPR operations
@@ -16,9 +18,17 @@ class CRUDMPR:
         """Get MPR by requisition code"""
         return db.query(MPR).filter(MPR.requisition_code == requisition_code).first()
     
-    def get_all_mprs(self, db: Session, skip: int = 0, limit: int = 100) -> List[MPR]:
-        """Get all MPRs"""
-        return db.query(MPR).offset(skip).limit(limit).all()
+    def get_all_mprs(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[MPR], Optional[str]]:
+        """Get a page of MPRs, newest first"""
+        return paginate(db.query(MPR), MPR.id, cursor=cursor, limit=limit, descending=True)
+    
+    async def get_all_mprs_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[MPR], Optional[str]]:
+        """Async variant of get_all_mprs"""
+        return await db.run_sync(self.get_all_mprs, cursor=cursor, limit=limit)
     
     def get_mprs_by_manager(self, db: Session, manager_id: int) -> List[MPR]:
         """Get MPRs by hiring manager"""
@@ -0,0 +1,85 @@
+"""
+CRUD operations for the notification outbox
+"""
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime, timedelta
+from app.models.notification import NotificationLog
+
+
+class CRUDNotification:
+    def claim_batch(self, db: Session, limit: int = 50, lease_seconds: int = 300) -> List[NotificationLog]:
+        """
+        Claim up to `limit` deliverable notifications, oldest first.
+
+        Queued rows whose retry time has passed are eligible, as are rows
+        left in `sending` by a sender that died before its lease ran out.
+        Rows are locked with SKIP LOCKED so concurrent senders never claim
+        the same message.
+        """
+        now = datetime.utcnow()
+        logs = (
+            db.query(NotificationLog)
+            .filter(
+                or_(
+                    and_(
+                        NotificationLog.status == "queued",
+                        or_(NotificationLog.next_attempt_at.is_(None), NotificationLog.next_attempt_at <= now),
+                    ),
+                    and_(
+                        NotificationLog.status == "sending",
+                        NotificationLog.next_attempt_at < now,
+                    ),
+                )
+            )
+            .order_by(NotificationLog.id.asc())
+            .limit(max(1, limit))
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not logs:
+            db.rollback()
+            return []
+
+        lease_expires = now + timedelta(seconds=lease_seconds)
+        for log in logs:
+            log.status = "sending"
+            log.attempts = (log.attempts or 0) + 1
+            log.next_attempt_at = lease_expires
+            db.add(log)
+        db.commit()
+        return logs
+
+    def mark_delivered(self, db: Session, log: NotificationLog, simulated: bool = False) -> NotificationLog:
+        """Record a delivered (or simulated) notification"""
+        log.status = "simulated" if simulated else "sent"
+        log.sent_at = datetime.utcnow()
+        log.next_attempt_at = None
+        log.error_message = None
+        db.add(log)
+        db.commit()
+        return log
+
+    def mark_failed(
+        self,
+        db: Session,
+        log: NotificationLog,
+        error: str,
+        max_attempts: int = 5,
+        retry_delay_seconds: float = 0,
+    ) -> NotificationLog:
+        """Record a failed attempt; re-queue with a delay until attempts run out"""
+        log.error_message = error
+        if (log.attempts or 0) < max(1, max_attempts):
+            log.status = "queued"
+            log.next_attempt_at = datetime.utcnow() + timedelta(seconds=retry_delay_seconds)
+        else:
+            log.status = "failed"
+            log.next_attempt_at = None
+        db.add(log)
+        db.commit()
+        return log
+
+
+crud_notification = CRUDNotification()
@@ -1,11 +1,13 @@
 """
 CRUD operations for Offer models
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from app.models.offer import Offer
 from app.schemas.offer import OfferCreate, OfferUpdate, OfferStatusUpdate
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 
 class CRUDOffer:
     def get_offer(self, db: Session, offer_id: int) -> Optional[Offer]:
@@ -16,9 +18,17 @@ class CRUDOffer:
         """Get offer by code"""
         return db.query(Offer).filter(Offer.offer_code == offer_code).first()
     
-    def get_all_offers(self, db: Session, skip: int = 0, limit: int = 100) -> List[Offer]:
-        """Get all offers"""
-        return db.query(Offer).offset(skip).limit(limit).all()
+    def get_all_offers(
+        self, db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Offer], Optional[str]]:
+        """Get a page of offers, newest first"""
+        return paginate(db.query(Offer), Offer.id, cursor=cursor, limit=limit, descending=True)
+    
+    async def get_all_offers_async(
+        self, db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Offer], Optional[str]]:
+        """Async variant of get_all_offers"""
+        return await db.run_sync(self.get_all_offers, cursor=cursor, limit=limit)
     
     def get_offers_by_candidate(self, db: Session, candidate_id: int) -> List[Offer]:
         """Get offers by candidate"""
@@ -0,0 +1,146 @@
+"""
+CRUD operations for resume parse jobs
+"""
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
+from app.models.parse_job import ResumeParseJob, ParseJobStatus
+
+
+class CRUDParseJob:
+    def get_job(self, db: Session, job_id: int) -> Optional[ResumeParseJob]:
+        """Get parse job by ID"""
+        return db.query(ResumeParseJob).filter(ResumeParseJob.id == job_id).first()
+
+    def get_jobs_by_document(self, db: Session, document_id: int) -> List[ResumeParseJob]:
+        """Get parse jobs for a document, newest first"""
+        return (
+            db.query(ResumeParseJob)
+            .filter(ResumeParseJob.document_id == document_id)
+            .order_by(ResumeParseJob.id.desc())
+            .all()
+        )
+
+    def enqueue(
+        self,
+        db: Session,
+        candidate_id: int,
+        document_id: int,
+        file_path: str,
+        max_attempts: int = 3,
+    ) -> ResumeParseJob:
+        """Queue a resume parse job"""
+        db_job = ResumeParseJob(
+            candidate_id=candidate_id,
+            document_id=document_id,
+            file_path=file_path,
+            status=ParseJobStatus.QUEUED.value,
+            attempts=0,
+            max_attempts=max(1, max_attempts),
+            available_at=datetime.utcnow(),
+        )
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    def claim_next(self, db: Session, lease_seconds: int = 300) -> Optional[ResumeParseJob]:
+        """
+        Claim the next runnable job for this worker.
+
+        Queued jobs whose retry delay has elapsed are eligible, as are running
+        jobs whose lease expired (the worker that held them died) and that
+        still have attempts left; expired jobs with none left are failed
+        first. Rows are locked with SKIP LOCKED so concurrent workers never
+        claim the same job.
+        """
+        now = datetime.utcnow()
+        lease_cutoff = now - timedelta(seconds=lease_seconds)
+        self.fail_expired(db, lease_cutoff, now)
+        db_job = (
+            db.query(ResumeParseJob)
+            .filter(
+                or_(
+                    and_(
+                        ResumeParseJob.status == ParseJobStatus.QUEUED.value,
+                        or_(ResumeParseJob.available_at.is_(None), ResumeParseJob.available_at <= now),
+                    ),
+                    and_(
+                        ResumeParseJob.status == ParseJobStatus.RUNNING.value,
+                        ResumeParseJob.started_at < lease_cutoff,
+                        ResumeParseJob.attempts < ResumeParseJob.max_attempts,
+                    ),
+                )
+            )
+            .order_by(ResumeParseJob.available_at.asc(), ResumeParseJob.id.asc())
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not db_job:
+            db.rollback()
+            return None
+
+        db_job.status = ParseJobStatus.RUNNING.value
+        db_job.attempts = (db_job.attempts or 0) + 1
+        db_job.started_at = now
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    def fail_expired(self, db: Session, lease_cutoff: datetime, now: datetime) -> int:
+        """Fail running jobs whose lease expired on their last attempt"""
+        failed = (
+            db.query(ResumeParseJob)
+            .filter(
+                ResumeParseJob.status == ParseJobStatus.RUNNING.value,
+                ResumeParseJob.started_at < lease_cutoff,
+                ResumeParseJob.attempts >= ResumeParseJob.max_attempts,
+            )
+            .update(
+                {
+                    ResumeParseJob.status: ParseJobStatus.FAILED.value,
+                    ResumeParseJob.last_error: "Lease expired on the last attempt; the worker stopped mid-parse",
+                    ResumeParseJob.finished_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return failed
+
+    def mark_completed(self, db: Session, db_job: ResumeParseJob, result: Dict[str, Any]) -> ResumeParseJob:
+        """Mark a job as completed"""
+        db_job.status = ParseJobStatus.COMPLETED.value
+        db_job.result = result
+        db_job.last_error = None
+        db_job.finished_at = datetime.utcnow()
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    def mark_failed(
+        self,
+        db: Session,
+        db_job: ResumeParseJob,
+        error: str,
+        retry_delay_seconds: float = 0,
+    ) -> ResumeParseJob:
+        """Record a failed attempt; re-queue with a delay until attempts run out"""
+        now = datetime.utcnow()
+        db_job.last_error = error
+        if (db_job.attempts or 0) < (db_job.max_attempts or 1):
+            db_job.status = ParseJobStatus.QUEUED.value
+            db_job.available_at = now + timedelta(seconds=retry_delay_seconds)
+        else:
+            db_job.status = ParseJobStatus.FAILED.value
+            db_job.finished_at = now
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+
+crud_parse_job = CRUDParseJob()
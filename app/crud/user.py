@@ -1,12 +1,14 @@
 """
 CRUD operations for User model
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, password_hasher, verify_password
+from app.utils.pagination import paginate, DEFAULT_PAGE_SIZE
 from datetime import datetime
 
 class CRUDUser:
@@ -22,22 +24,41 @@ class CRUDUser:
         """Get user by employee code"""
         return db.query(User).filter(User.employee_code == employee_code).first()
     
-    def get_all(self, db: Session, skip: int = 0, limit: int = 100, include_inactive: bool = False) -> List[User]:
-        """Get all users with pagination"""
+    def get_all(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_inactive: bool = False,
+    ) -> Tuple[List[User], Optional[str]]:
+        """Get a page of users ordered by ID"""
         query = db.query(User)
         if not include_inactive:
             query = query.filter(User.status == "active")
-        return query.offset(skip).limit(limit).all()
+        return paginate(query, User.id, cursor=cursor, limit=limit)
+    
+    async def get_all_async(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_inactive: bool = False,
+    ) -> Tuple[List[User], Optional[str]]:
+        """Async variant of get_all"""
+        return await db.run_sync(self.get_all, cursor=cursor, limit=limit, include_inactive=include_inactive)
     
     def get_by_role(self, db: Session, role: str, skip: int = 0, limit: int = 100) -> List[User]:
         """Get users by role"""
         return db.query(User).filter(User.role == role).offset(skip).limit(limit).all()
     
-    def create(self, db: Session, user_in: UserCreate) -> User:
-        """Create a new user"""
+    def create(self, db: Session, user_in: UserCreate, password_hash: Optional[str] = None) -> User:
+        """
+        Create a new user. Async callers pass `password_hash` (from
+        `password_hasher.hash`) so bcrypt does not run on the event loop.
+        """
         db_user = User(
             email=user_in.email,
-            password_hash=get_password_hash(user_in.password),
+            password_hash=password_hash or get_password_hash(user_in.password),
             name=user_in.name,
             role=user_in.role,
             employee_code=user_in.employee_code,
@@ -110,9 +131,27 @@ class CRUDUser:
 
         return user
 
+    async def authenticate_async(self, db: Session, email: str, password: str) -> Optional[User]:
+        """
+        `authenticate` with bcrypt on the password hashing pool. A hash made
+        with an outdated cost is replaced on the returned (uncommitted) user,
+        so it is saved with the caller's next commit.
+        """
+        user = self.get_by_email(db, email)
 
+        if not user:
+            return None
+
+        password_ok, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+
+        if not password_ok:
+            return None
+
+        if new_hash:
+            user.password_hash = new_hash
+
+        return user
 
-    
     def create_candidate(self, db: Session, user_in) -> User:
         """Create a candidate user (public registration only)"""
         db_user = User(
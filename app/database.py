@@ -1,7 +1,10 @@
 """
 Database configuration and session management
 """
+from typing import AsyncIterator, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -29,4 +32,59 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async engine (asyncpg on PostgreSQL, aiosqlite on SQLite). Created on first
+# use so the sync-only code paths (scripts, Alembic) never import the driver.
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: str) -> str:
+    """Map the configured sync URL onto its async driver"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL),
+            pool_pre_ping=True,
+            pool_recycle=300,
+            echo=False
+        )
+        _async_sessionmaker = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_sessionmaker = None
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function to get an async database session
+
+    Queries on this session do not block the event loop. Existing sync CRUD
+    and service code runs unchanged through `await db.run_sync(...)`.
+    """
+    get_async_engine()
+    async with _async_sessionmaker() as db:
+        yield db
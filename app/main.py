@@ -15,6 +15,7 @@ from fastapi import Request
 import time
 import re
 from app.core.logging import setup_logging
+from app.utils.pagination import NEXT_CURSOR_HEADER
 from fastapi.responses import JSONResponse, Response
 
 setup_logging()
@@ -31,7 +32,6 @@ except Exception as e:
 
 # Create upload directories if they don't exist
 os.makedirs("uploads/candidate_documents", exist_ok=True)
-os.makedirs("uploads/parsed_resumes", exist_ok=True)
 os.makedirs("uploads/temp", exist_ok=True)
 
 # Initialize FastAPI app
@@ -51,6 +51,10 @@ app = FastAPI(
     }
 )
 
+# Response headers cross-origin clients may read. Credentialed requests treat
+# "*" as a literal name, so custom headers must also be listed explicitly.
+EXPOSED_HEADERS = ["*", NEXT_CURSOR_HEADER, "ETag"]
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -59,7 +63,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    expose_headers=EXPOSED_HEADERS,
     max_age=600,
 )
 
@@ -103,7 +107,7 @@ async def ensure_cors_headers(request: Request, call_next):
         response.headers["Access-Control-Allow-Credentials"] = "true"
         response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,DELETE,OPTIONS,PATCH"
         response.headers["Access-Control-Allow-Headers"] = request_headers
-        response.headers["Access-Control-Expose-Headers"] = "*"
+        response.headers["Access-Control-Expose-Headers"] = ", ".join(EXPOSED_HEADERS)
 
     return response
 
@@ -144,6 +148,7 @@ async def health_check():
     """Health check endpoint"""
     from sqlalchemy import text
     from datetime import datetime
+    from app.core.security import password_hasher
     
     try:
         # Database health check
@@ -182,7 +187,8 @@ async def health_check():
         "services": {
             "api": "running",
             "database": "running" if db_status == "healthy" else "error",
-            "resume_parser": "available"
+            "resume_parser": "available",
+            "password_hasher": password_hasher.stats(),
         }
     }
 
@@ -318,12 +324,33 @@ async def startup_event():
     except Exception as e:
         logger.error(f"❌ NLP initialization failed: {e}")
 
+    # Background resume parsing
+    if settings.RESUME_PARSE_WORKERS > 0:
+        from app.services.parse_jobs import resume_parse_worker
+        resume_parse_worker.start()
+        logger.info(f"📝 Resume parse processes: {settings.RESUME_PARSE_PROCESSES}")
+
+    # Email outbox delivery
+    if settings.EMAIL_OUTBOX_WORKERS > 0:
+        from app.services.notifications import email_outbox_worker
+        email_outbox_worker.start()
+
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     logger.info("Shutting down HirePulse API server...")
+    from app.services.parse_jobs import resume_parse_worker
+    from app.services.parse_engine import resume_parse_engine
+    from app.services.notifications import email_outbox_worker
+    from app.database import dispose_async_engine
+    from app.core.security import password_hasher
+    resume_parse_worker.stop()
+    email_outbox_worker.stop()
+    resume_parse_engine.shutdown()
+    password_hasher.shutdown()
+    await dispose_async_engine()
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
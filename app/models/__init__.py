@@ -2,29 +2,45 @@
 Database models package
 """
 from app.models.user import User
-from app.models.candidate import Candidate, CandidateDocument, CandidateApplication
-from app.models.job import Job, JobRequisition
+from app.models.candidate import (
+    Candidate, CandidateDocument, CandidateApplication, CandidateSkill, ParsedResume, Skill
+)
+from app.models.job import Job, JobRequisition, ManagerJobVisibility
 from app.models.mpr import MPR, MPRConfig
 from app.models.agency import Agency, AgencySubmission
-from app.models.interview import Interview, InterviewEvaluation
+from app.models.interview import Interview, InterviewEvaluation, InterviewPanelist
 from app.models.offer import Offer
 from app.models.blacklist import Blacklist
 from app.models.notification import NotificationLog
+from app.models.parse_job import ResumeParseJob
+from app.models.metrics import DailyHiringMetric, MPRPipelineCounter
+
+# Register the rollup/index flush listeners wherever the models are used
+# (API, scripts, migrations), not only when app.main is imported.
+from app.services import hiring_metrics, manager_visibility, pipeline_counters, skill_index  # noqa: E402,F401
 
 __all__ = [
     "User",
     "Candidate",
     "CandidateDocument",
     "CandidateApplication",
+    "ParsedResume",
+    "Skill",
+    "CandidateSkill",
     "Job",
     "JobRequisition",
+    "ManagerJobVisibility",
     "MPR",
     "MPRConfig",
     "Agency",
     "AgencySubmission",
     "Interview",
     "InterviewEvaluation",
+    "InterviewPanelist",
     "Offer",
     "Blacklist",
     "NotificationLog",
+    "ResumeParseJob",
+    "DailyHiringMetric",
+    "MPRPipelineCounter",
 ]
@@ -1,7 +1,8 @@
 """
 Candidate models for candidate portal
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -49,10 +50,20 @@ class CandidateDocument(Base):
     # Relationship
     candidate = relationship("Candidate", back_populates="documents")
 
+Index(
+    "ix_candidate_documents_candidate_id_lower_document_type",
+    CandidateDocument.candidate_id,
+    func.lower(CandidateDocument.document_type),
+)
+
 class CandidateApplication(Base):
     """Candidate job applications"""
     
     __tablename__ = "candidate_applications"
+    __table_args__ = (
+        Index("ix_candidate_applications_job_id_status", "job_id", "status"),
+        Index("ix_candidate_applications_status", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
@@ -67,3 +78,45 @@ class CandidateApplication(Base):
     # Relationships
     candidate = relationship("Candidate", back_populates="applications")
     job = relationship("Job", back_populates="applications")
+
+Index(
+    "ix_candidate_applications_candidate_id_applied_at",
+    CandidateApplication.candidate_id,
+    CandidateApplication.applied_at.desc(),
+)
+Index("ix_candidate_applications_lower_status", func.lower(CandidateApplication.status))
+
+class Skill(Base):
+    """Normalized (trimmed, lower-case) skill name"""
+    
+    __tablename__ = "skills"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+
+class CandidateSkill(Base):
+    """Inverted index of `Candidate.skills`, kept in sync on every flush"""
+    
+    __tablename__ = "candidate_skills"
+    __table_args__ = (
+        Index("ix_candidate_skills_skill_id_candidate_id", "skill_id", "candidate_id"),
+    )
+    
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+
+class ParsedResume(Base):
+    """Structured output of the resume parser for a candidate document"""
+    
+    __tablename__ = "parsed_resumes"
+    __table_args__ = (
+        Index("ix_parsed_resumes_candidate_id_id", "candidate_id", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(Integer, ForeignKey("candidate_documents.id", ondelete="CASCADE"), unique=True, nullable=False)
+    parser_version = Column(String, nullable=True)
+    data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
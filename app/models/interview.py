@@ -1,13 +1,14 @@
 """
 Interview models
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, validates
 from app.database import Base
 from sqlalchemy import Enum
 import enum
 from datetime import datetime
+from typing import List
 
 class InterviewStatus(str, enum.Enum):
     """Interview status enumeration"""
@@ -35,6 +36,11 @@ class Interview(Base):
     """Interview scheduling model"""
     
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interviews_candidate_id_job_id_status", "candidate_id", "job_id", "status"),
+        Index("ix_interviews_job_id", "job_id"),
+        Index("ix_interviews_scheduled_time", "scheduled_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
@@ -55,7 +61,7 @@ class Interview(Base):
     )
     meeting_link = Column(String, nullable=True)
     location = Column(String, nullable=True)
-    panel_members = Column(JSON, default=list)  # JSON array of user IDs
+    panel_members = Column(JSON, default=list)  # JSON array of user IDs, mirrored into interview_panelists
     notes = Column(Text, nullable=True)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -66,6 +72,12 @@ class Interview(Base):
     job = relationship("Job")
     creator = relationship("User", foreign_keys=[created_by])
     evaluation = relationship("InterviewEvaluation", uselist=False, back_populates="interview")
+    panelists = relationship(
+        "InterviewPanelist",
+        back_populates="interview",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     @validates("scheduled_time")
     def _coerce_scheduled_time(self, key, value):
@@ -77,6 +89,52 @@ class Interview(Base):
                 return value
         return value
 
+    @validates("panel_members")
+    def _sync_panelists(self, key, value):
+        """
+        Keep the interview_panelists rows in step with the JSON column.
+
+        This runs on assignment only: mutating the list in place (e.g.
+        `interview.panel_members.append(...)`) is neither tracked nor
+        mirrored, so always assign a new list. Every id must be an existing
+        user (see `crud_interview.check_panel_members`).
+        """
+        current = {panelist.user_id: panelist for panelist in self.panelists}
+        self.panelists = [
+            current.get(user_id) or InterviewPanelist(user_id=user_id)
+            for user_id in panel_user_ids(value)
+        ]
+        return value
+
+
+def panel_user_ids(panel_members) -> List[int]:
+    """Distinct user IDs from a panel_members value, in order"""
+    user_ids: List[int] = []
+    for member in panel_members or []:
+        try:
+            user_id = int(member)
+        except (TypeError, ValueError):
+            continue
+        if user_id not in user_ids:
+            user_ids.append(user_id)
+    return user_ids
+
+
+class InterviewPanelist(Base):
+    """Interview panel membership (one row per interview and panel user)"""
+    
+    __tablename__ = "interview_panelists"
+    __table_args__ = (
+        Index("ix_interview_panelists_user_id_interview_id", "user_id", "interview_id"),
+    )
+    
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    
+    # Relationships
+    interview = relationship("Interview", back_populates="panelists")
+    user = relationship("User")
+
 class InterviewEvaluation(Base):
     """Interview evaluation and feedback"""
     
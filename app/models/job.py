@@ -1,7 +1,7 @@
 """
 Job and requisition models
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -19,6 +19,9 @@ class Job(Base):
     """Job posting/requisition model"""
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_manager_id", "manager_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -44,10 +47,47 @@ class Job(Base):
     applications = relationship("CandidateApplication", back_populates="job")
     manager = relationship("User", foreign_keys=[manager_id])
 
+# Job board filters and sorts on these expressions (see crud_job.get_public_jobs);
+# manager visibility matches unlinked jobs to MPRs case-insensitively.
+Index(
+    "ix_jobs_public_board",
+    func.lower(Job.visibility),
+    func.lower(Job.status),
+    func.coalesce(Job.posted_at, Job.created_at),
+)
+Index("ix_jobs_lower_title", func.lower(Job.title))
+Index("ix_jobs_lower_department", func.lower(Job.department))
+
+# Full-text search document for the job board (PostgreSQL only): a stored
+# generated tsvector, weighted title > skills > description/requirements,
+# with a GIN index. It is not mapped; crud_job.search_public_jobs reads it
+# by name and falls back to LIKE matching on other databases.
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(skills_required::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '') || ' ' || coalesce(requirements, '')), 'C')"
+)
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL(
+        f"ALTER TABLE jobs ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({JOB_SEARCH_VECTOR_SQL}) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_jobs_search_vector ON jobs USING gin (search_vector)").execute_if(dialect="postgresql"),
+)
+
 class JobRequisition(Base):
     """Job requisition tracking model"""
     
     __tablename__ = "job_requisitions"
+    __table_args__ = (
+        Index("ix_job_requisitions_mpr_id_job_id", "mpr_id", "job_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
@@ -64,3 +104,14 @@ class JobRequisition(Base):
     job = relationship("Job")
     mpr = relationship("MPR")
     recruiter = relationship("User", foreign_keys=[recruiter_id])
+
+class ManagerJobVisibility(Base):
+    """Jobs each manager can see: their own jobs plus unlinked jobs matching their MPRs"""
+    
+    __tablename__ = "manager_job_visibility"
+    __table_args__ = (
+        Index("ix_manager_job_visibility_job_id", "job_id"),
+    )
+    
+    manager_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,34 @@
+"""
+Rollup tables for dashboard metrics.
+"""
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class DailyHiringMetric(Base):
+    """Per-day hiring activity, maintained incrementally on every flush."""
+
+    __tablename__ = "daily_hiring_metrics"
+
+    day = Column(Date, primary_key=True)
+    hires = Column(Integer, nullable=False, default=0, server_default="0")  # joined offers, by offer creation day
+    interviews = Column(Integer, nullable=False, default=0, server_default="0")  # by scheduled day
+    offers = Column(Integer, nullable=False, default=0, server_default="0")  # offers created
+    logins = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class MPRPipelineCounter(Base):
+    """Per-job pipeline stage counts, rolled up to the MPRs each job is linked to."""
+
+    __tablename__ = "mpr_pipeline_counters"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    sourced = Column(Integer, nullable=False, default=0, server_default="0")  # every application
+    screened = Column(Integer, nullable=False, default=0, server_default="0")
+    interviewed = Column(Integer, nullable=False, default=0, server_default="0")
+    offered = Column(Integer, nullable=False, default=0, server_default="0")  # offers released
+    hired = Column(Integer, nullable=False, default=0, server_default="0")
+    dnj = Column(Integer, nullable=False, default=0, server_default="0")  # declined / withdrawn / expired offers
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,7 +1,7 @@
 """
 Manpower Requisition (MPR) models
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -21,6 +21,10 @@ class MPR(Base):
     """Manpower Requisition model"""
     
     __tablename__ = "mprs"
+    __table_args__ = (
+        Index("ix_mprs_hiring_manager_id", "hiring_manager_id"),
+        Index("ix_mprs_status", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     requisition_code = Column(String, unique=True, index=True, nullable=False)
@@ -1,15 +1,23 @@
 """
 Notification log model for candidate email events.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 
 class NotificationLog(Base):
-    """Stores outbound email notifications and delivery outcome."""
+    """
+    Stores outbound email notifications and delivery outcome.
+
+    Rows double as the email outbox: they are inserted as `queued` and
+    delivered by the background sender in `app.services.notifications`.
+    """
 
     __tablename__ = "notification_logs"
+    __table_args__ = (
+        Index("ix_notification_logs_status_next_attempt_at", "status", "next_attempt_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -18,7 +26,9 @@ class NotificationLog(Base):
     to_email = Column(String, nullable=False, index=True)
     subject = Column(String, nullable=False)
     body = Column(Text, nullable=False)
-    status = Column(String, nullable=False, default="queued")  # sent, simulated, failed
+    status = Column(String, nullable=False, default="queued")  # queued, sending, sent, simulated, failed
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)  # retry time while queued, lease expiry while sending
     error_message = Column(Text, nullable=True)
     payload = Column(JSON, nullable=True)
     sent_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,7 +1,7 @@
 """
 Job offer models
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -22,6 +22,11 @@ class Offer(Base):
     """Job offer model"""
     
     __tablename__ = "offers"
+    __table_args__ = (
+        Index("ix_offers_candidate_id_job_id", "candidate_id", "job_id"),
+        Index("ix_offers_job_id_status", "job_id", "status"),
+        Index("ix_offers_status", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
@@ -0,0 +1,35 @@
+"""
+Resume parse job model for background resume parsing.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class ParseJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ResumeParseJob(Base):
+    """Queued resume parse for an uploaded candidate document."""
+
+    __tablename__ = "resume_parse_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True)
+    document_id = Column(Integer, ForeignKey("candidate_documents.id", ondelete="CASCADE"), nullable=False, index=True)
+    file_path = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=ParseJobStatus.QUEUED.value, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    last_error = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)  # updates applied + extraction summary
+    available_at = Column(DateTime(timezone=True), nullable=True)  # earliest time a worker may pick it up
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
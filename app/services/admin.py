@@ -3,7 +3,7 @@ Admin dashboard service
 """
 from typing import Dict, List, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func
 from datetime import datetime, timedelta
 from app.crud.user import crud_user
 from app.crud.mpr import crud_mpr
@@ -12,7 +12,7 @@ from app.crud.offer import crud_offer
 from app.models.user import User
 from app.models.mpr import MPR
 from app.models.offer import Offer
-from app.models.interview import Interview
+from app.services.hiring_metrics import get_daily_hiring_metrics
 
 class AdminService:
     def __init__(self, db: Session):
@@ -22,18 +22,22 @@ class AdminService:
     def _enum_value(value):
         return value.value if hasattr(value, "value") else value
 
-    def get_admin_stats(self) -> Dict[str, Any]:
+    def get_admin_stats(self, days: int = 5) -> Dict[str, Any]:
         """Get admin dashboard statistics"""
-        # Total users by role
-        total_users = self.db.query(User).count()
-        admin_count = self.db.query(User).filter(User.role == "admin").count()
-        recruiter_count = self.db.query(User).filter(User.role == "recruiter").count()
-        manager_count = self.db.query(User).filter(User.role == "manager").count()
-        candidate_count = self.db.query(User).filter(User.role == "candidate").count()
-        
-        # Active MPRs
-        active_mprs = self.db.query(MPR).filter(MPR.status == "active").count()
-        frozen_mprs = self.db.query(MPR).filter(MPR.status == "frozen").count()
+        # Users by role and MPRs by status, one grouped query each
+        role_counts = {
+            str(self._enum_value(role)): count
+            for role, count in self.db.query(User.role, func.count(User.id)).group_by(User.role)
+        }
+        total_users = sum(role_counts.values())
+        admin_count = role_counts.get("admin", 0)
+        recruiter_count = role_counts.get("recruiter", 0)
+        manager_count = role_counts.get("manager", 0)
+        candidate_count = role_counts.get("candidate", 0)
+
+        mpr_counts = dict(self.db.query(MPR.status, func.count(MPR.id)).group_by(MPR.status).all())
+        active_mprs = mpr_counts.get("active", 0)
+        frozen_mprs = mpr_counts.get("frozen", 0)
         
         # Pending offers requiring approval
         pending_approvals = self.db.query(Offer).filter(
@@ -46,18 +50,8 @@ class AdminService:
             User.last_login >= week_ago
         ).count()
         
-        velocity_data = []
-        for day_offset in range(4, -1, -1):
-            day = (datetime.utcnow() - timedelta(days=day_offset)).date()
-            day_key = day.isoformat()
-            hires = self.db.query(Offer).filter(
-                func.date(Offer.created_at) == day_key,
-                Offer.status == "joined"
-            ).count()
-            interviews = self.db.query(Interview).filter(
-                func.date(Interview.scheduled_time) == day_key
-            ).count()
-            velocity_data.append({"date": day_key, "hires": hires, "interviews": interviews})
+        # Hires/interviews/offers/logins per day from the daily rollup
+        velocity_data = get_daily_hiring_metrics(self.db, days)
 
         return {
             "kpis": [
@@ -76,8 +70,8 @@ class AdminService:
             "mprStatus": [
                 {"status": "Active", "count": active_mprs},
                 {"status": "Frozen", "count": frozen_mprs},
-                {"status": "Draft", "count": self.db.query(MPR).filter(MPR.status == "draft").count()},
-                {"status": "Closed", "count": self.db.query(MPR).filter(MPR.status == "closed").count()}
+                {"status": "Draft", "count": mpr_counts.get("draft", 0)},
+                {"status": "Closed", "count": mpr_counts.get("closed", 0)}
             ]
         }
     
@@ -7,7 +7,7 @@ from fastapi import HTTPException, status
 
 from app.crud.user import crud_user
 from app.crud.candidate import crud_candidate
-from app.core.security import create_access_token
+from app.core.security import create_access_token, password_hasher
 from app.core.config import settings
 from app.schemas.user import UserLogin, UserRegister, UserCreate
 from app.schemas.candidate import CandidateProfileCreate
@@ -39,9 +39,9 @@ class AuthService:
         }
         return actual in equivalent.get(requested, {requested})
 
-    def authenticate_user(self, login_data: UserLogin) -> dict:
-        # 🔑 Authenticate user
-        user = crud_user.authenticate(
+    async def authenticate_user(self, login_data: UserLogin) -> dict:
+        # 🔑 Authenticate user (bcrypt runs on the password hashing pool)
+        user = await crud_user.authenticate_async(
             self.db,
             login_data.email,
             login_data.password
@@ -60,7 +60,7 @@ class AuthService:
                 detail="Invalid role for user"
             )
 
-        # Update last login
+        # Update last login (also commits a rehashed password)
         crud_user.update_last_login(self.db, user.id)
 
         # Create access token
@@ -89,7 +89,7 @@ class AuthService:
             },
         }
 
-    def register_user(self, register_data: UserRegister) -> dict:
+    async def register_user(self, register_data: UserRegister) -> dict:
         # Check if user already exists
         existing_user = crud_user.get_by_email(
             self.db,
@@ -108,7 +108,8 @@ class AuthService:
             name=register_data.name,
             role=register_data.role,
         )
-        user = crud_user.create(self.db, create_data)
+        password_hash = await password_hasher.hash(register_data.password)
+        user = crud_user.create(self.db, create_data, password_hash=password_hash)
 
         if self._normalize_role(user.role) == "candidate":
             existing_profile = crud_candidate.get_profile_by_user_id(self.db, user.id)
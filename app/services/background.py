@@ -0,0 +1,79 @@
+"""
+In-process background workers backed by database queues.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class PollingWorker:
+    """
+    Runs `run_once` in a loop on a small pool of daemon threads.
+
+    Each iteration gets its own database session. When an iteration reports
+    that there was nothing to do, the thread sleeps for `poll_interval`
+    seconds (or until `stop()` is called) before polling again.
+    """
+
+    name = "worker"
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        poll_interval: float = 2.0,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.concurrency = max(0, concurrency)
+        self.poll_interval = max(0.1, poll_interval)
+        self.session_factory = session_factory
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def run_once(self, db: Session) -> bool:
+        """Process one unit of work. Return False when the queue was empty."""
+        raise NotImplementedError
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.running or self.concurrency == 0:
+            return
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"{self.name}-{index}", daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("%s started with %s thread(s)", self.name, self.concurrency)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            did_work = False
+            db = self.session_factory()
+            try:
+                did_work = self.run_once(db)
+            except Exception:
+                logger.exception("%s iteration failed", self.name)
+                db.rollback()
+            finally:
+                db.close()
+
+            if not did_work:
+                self._stop_event.wait(self.poll_interval)
@@ -1,14 +1,14 @@
 """
 Candidate portal service with resume parsing
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from sqlalchemy.orm import Session
 from app.crud.candidate import crud_candidate
 from app.crud.job import crud_job
-from app.services.resume_parser import resume_parser
+from app.services.parse_engine import resume_parse_engine
+from app.services.resume_parser import ResumeParser
 from app.models.candidate import CandidateApplication
 from app.models.offer import Offer
-import os
 
 class CandidateService:
     def __init__(self, db: Session):
@@ -18,44 +18,30 @@ class CandidateService:
     def _enum_value(value):
         return value.value if hasattr(value, "value") else value
 
-    def _load_parsed_resume_data(self, candidate_id: int, documents: List[Any]) -> Dict[str, Any] | None:
-        """Load parsed resume JSON for candidate using current and legacy file naming."""
-        for doc in documents:
-            if str(doc.document_type).lower() != "resume":
-                continue
-
-            parsed_candidates = []
-            if doc.document_url:
-                parsed_candidates.append(
-                    f"uploads/parsed_resumes/{candidate_id}_{os.path.basename(str(doc.document_url))}.json"
-                )
-            parsed_candidates.append(
-                f"uploads/parsed_resumes/{candidate_id}_{doc.file_name}.json"
-            )
-
-            for parsed_path in parsed_candidates:
-                if not os.path.exists(parsed_path):
-                    continue
-                try:
-                    import json
-                    with open(parsed_path, "r") as f:
-                        return json.load(f)
-                except Exception:
-                    continue
-        return None
-
     def get_latest_parsed_resume_data(self, candidate_id: int) -> Dict[str, Any] | None:
         """Public accessor for latest parsed resume payload for a candidate."""
-        documents = crud_candidate.get_documents_by_candidate(self.db, candidate_id)
-        return self._load_parsed_resume_data(candidate_id, documents)
+        parsed = crud_candidate.get_latest_parsed_resume(self.db, candidate_id)
+        return dict(parsed.data) if parsed else None
     
-    def parse_and_update_profile(self, candidate_id: int, file_path: str) -> Dict[str, Any]:
+    def parse_and_update_profile(
+        self,
+        candidate_id: int,
+        file_path: str,
+        parsed_data: Optional[Dict[str, Any]] = None,
+        document_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Parse resume and update candidate profile with extracted data
+
+        Pass `parsed_data` when the resume was already parsed elsewhere
+        (e.g. by the process-pool engine) to only apply the profile merge.
+        When `document_id` is given the parsed payload is stored against
+        that document in the parsed_resumes table.
         """
         try:
             # Parse resume
-            parsed_data = resume_parser.parse_resume(file_path)
+            if parsed_data is None:
+                parsed_data = resume_parse_engine.parse(file_path)
             
             if "error" in parsed_data:
                 return {"success": False, "error": parsed_data["error"]}
@@ -76,10 +62,11 @@ class CandidateService:
             if parsed_data.get("phone") and not profile.phone:
                 update_data["phone"] = parsed_data["phone"]
             
-            # Update skills (merge with existing)
-            existing_skills = set(profile.skills or [])
-            new_skills = set(parsed_data.get("skills", []))
-            all_skills = list(existing_skills.union(new_skills))
+            # Update skills (merge with existing, ignoring case; the parser's
+            # canonical spelling replaces an older one, e.g. "Aws" -> "AWS")
+            merged_skills = {skill.lower(): skill for skill in profile.skills or []}
+            merged_skills.update((skill.lower(), skill) for skill in parsed_data.get("skills", []))
+            all_skills = list(merged_skills.values())
             if all_skills:
                 update_data["skills"] = all_skills[:50]  # Limit to 50 skills
             
@@ -96,12 +83,14 @@ class CandidateService:
                 crud_candidate.update_profile(self.db, candidate_id, update_data)
             
             # Save parsed data for reference
-            parsed_data_path = f"uploads/parsed_resumes/{candidate_id}_{os.path.basename(file_path)}.json"
-            os.makedirs(os.path.dirname(parsed_data_path), exist_ok=True)
-            
-            with open(parsed_data_path, 'w') as f:
-                import json
-                json.dump(parsed_data, f, indent=2)
+            if document_id is not None:
+                crud_candidate.save_parsed_resume(
+                    self.db,
+                    candidate_id,
+                    document_id,
+                    parsed_data,
+                    parser_version=ResumeParser.VERSION,
+                )
             
             return {
                 "success": True,
@@ -120,7 +109,7 @@ class CandidateService:
         
         documents = crud_candidate.get_documents_by_candidate(self.db, candidate_id)
         
-        parsed_data = self._load_parsed_resume_data(candidate_id, documents)
+        parsed_data = self.get_latest_parsed_resume_data(candidate_id)
 
         return {
             "name": profile.user.name if profile.user else "",
@@ -163,8 +152,7 @@ class CandidateService:
             if not profile:
                 return {"success": False, "error": "Profile not found"}
             
-            documents = crud_candidate.get_documents_by_candidate(self.db, candidate_id)
-            parsed_data = self._load_parsed_resume_data(candidate_id, documents)
+            parsed_data = self.get_latest_parsed_resume_data(candidate_id)
             
             # Get job details
             job = crud_job.get_job(self.db, job_id)
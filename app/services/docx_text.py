@@ -0,0 +1,135 @@
+"""
+DOCX text extraction for the resume parser.
+
+A .docx file is a zip archive whose text lives in word/document.xml (plus
+word/header*.xml and word/footer*.xml). `extract_with_iterparse` streams
+the body, then the headers and footers (after the body, so a running header
+such as "Curriculum Vitae" is not read as the candidate's name), straight
+out of the zip with ElementTree.iterparse, collecting
+text into a list that is joined once. Paragraphs are emptied as soon as
+they have been read and each top-level paragraph or table is dropped once
+it ends, so the XML held in memory is bounded by one block, not by the
+document. Tables are read in document order, one line per cell paragraph.
+Content Word stores twice for older readers (the `mc:Fallback` copy of an
+`mc:AlternateContent` block, e.g. every text box) is read once.
+
+python-docx, which loads the whole object model, is only the fallback for
+files the streaming reader cannot handle.
+"""
+import logging
+import re
+import zipfile
+from typing import List
+from xml.etree.ElementTree import ParseError, iterparse
+
+try:
+    from docx import Document
+except ImportError:  # pragma: no cover - optional dependency
+    Document = None
+
+logger = logging.getLogger(__name__)
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TEXT = W_NS + "t"
+_TAB = W_NS + "tab"
+_BREAKS = (W_NS + "br", W_NS + "cr")
+_PARAGRAPH = W_NS + "p"
+_BODY_TAGS = (W_NS + "body", W_NS + "hdr", W_NS + "ftr")
+_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_HEADER_RE = re.compile(r"word/header(\d*)\.xml$")
+_FOOTER_RE = re.compile(r"word/footer(\d*)\.xml$")
+
+
+def _part_lines(stream, lines: List[str]) -> None:
+    """Append the text of every paragraph of one WordprocessingML part to `lines`"""
+    # Runs of each open paragraph; text boxes nest paragraphs inside one
+    paragraphs: List[List[str]] = []
+    body = None
+    body_depth = depth = 0
+    # Depth of the mc:Fallback being skipped (0 = not skipping)
+    fallback_depth = 0
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if fallback_depth:
+                continue
+            if tag == _FALLBACK:
+                fallback_depth = depth
+            elif tag == _PARAGRAPH:
+                paragraphs.append([])
+            elif body is None and tag in _BODY_TAGS:
+                body, body_depth = elem, depth
+            continue
+
+        depth -= 1
+        if fallback_depth:
+            if depth < fallback_depth:
+                fallback_depth = 0
+                elem.clear()
+            continue
+        if paragraphs:
+            if tag == _TEXT:
+                if elem.text:
+                    paragraphs[-1].append(elem.text)
+            elif tag == _TAB:
+                paragraphs[-1].append("\t")
+            elif tag in _BREAKS:
+                paragraphs[-1].append("\n")
+            elif tag == _PARAGRAPH:
+                lines.append("".join(paragraphs.pop()))
+                elem.clear()
+        if body is not None and depth == body_depth:
+            # A top-level paragraph or table is done; drop it
+            body.clear()
+
+
+def _numbered_parts(names: List[str], pattern) -> List[str]:
+    """Part names matching `pattern`, in numeric order (header2 before header10)"""
+    numbered = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(numbered)]
+
+
+def extract_with_iterparse(file_path: str) -> str:
+    """Text of the body, then headers and footers, streamed from the zip"""
+    lines: List[str] = []
+    with zipfile.ZipFile(file_path) as archive:
+        names = archive.namelist()
+        headers = _numbered_parts(names, _HEADER_RE)
+        footers = _numbered_parts(names, _FOOTER_RE)
+        for name in ("word/document.xml", *headers, *footers):
+            with archive.open(name) as stream:
+                _part_lines(stream, lines)
+    return "\n".join(lines)
+
+
+def extract_with_python_docx(file_path: str) -> str:
+    """Text of the body paragraphs, the table cells, then headers and footers, via python-docx"""
+    if Document is None:
+        raise RuntimeError("python-docx is not installed")
+    doc = Document(file_path)
+    lines = [para.text for para in doc.paragraphs]
+    for table in doc.tables:
+        for row in table.rows:
+            lines.extend(cell.text for cell in row.cells)
+    for kind in ("header", "first_page_header", "even_page_header",
+                 "footer", "first_page_footer", "even_page_footer"):
+        for section in doc.sections:
+            part = getattr(section, kind)
+            if not part.is_linked_to_previous:
+                lines.extend(para.text for para in part.paragraphs)
+    return "\n".join(lines)
+
+
+def extract_docx_text(file_path: str) -> str:
+    """Text of the DOCX at `file_path`, streamed, or via python-docx if that fails"""
+    try:
+        return extract_with_iterparse(file_path)
+    except (zipfile.BadZipFile, KeyError, ParseError) as e:
+        logger.warning(f"Streaming DOCX extraction failed on {file_path}: {e}; trying python-docx")
+    return extract_with_python_docx(file_path)
@@ -0,0 +1,206 @@
+"""
+Daily hiring metrics rollup.
+
+`daily_hiring_metrics` holds one row per day with the hires, interviews,
+offers and logins the admin dashboard charts. A session `after_flush`
+listener turns every ORM insert, update and delete of an offer, interview
+or login into per-day deltas and upserts them in the same transaction, so
+the dashboard reads any window with one primary-key range scan.
+
+`logins` is the number of distinct users who logged in that day: a user
+counts once, on the first `last_login` update of each day.
+
+Bulk `query.update()`/`query.delete()` calls bypass the listener;
+`rebuild_daily_hiring_metrics` recomputes hires, interviews and offers for
+a range from the base tables with one grouped query and is safe to run at
+any time. It leaves `logins` alone: `users.last_login` only remembers each
+user's latest login, so past days cannot be recomputed from it.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Integer, case, event, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.interview import Interview
+from app.models.metrics import DailyHiringMetric
+from app.models.offer import Offer
+from app.models.user import User
+from app.utils.counters import apply_counter_deltas, column_history, loaded_value, track_columns
+
+METRICS = ("hires", "interviews", "offers", "logins")
+# Metrics the base tables fully determine (see the module docstring)
+REBUILT_METRICS = ("hires", "interviews", "offers")
+HIRED_STATUS = "joined"
+# Columns the deltas are keyed on, per tracked model
+TRACKED_COLUMNS = {
+    Offer: ("created_at", "status"),
+    Interview: ("scheduled_time",),
+    User: ("last_login",),
+}
+
+
+def _status(value: Any) -> str:
+    value = value.value if hasattr(value, "value") else value
+    return str(value or "").lower()
+
+
+def _day(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _collect_deltas(session: Session) -> Dict[date, Dict[str, int]]:
+    deltas: Dict[date, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+
+    def bump(day: Optional[date], metric: str, amount: int) -> None:
+        if day is not None and amount:
+            deltas[day][metric] += amount
+
+    for obj in session.new:
+        if isinstance(obj, Offer):
+            day = _day(loaded_value(obj, "created_at")) or datetime.utcnow().date()
+            bump(day, "offers", 1)
+            bump(day, "hires", 1 if _status(obj.status) == HIRED_STATUS else 0)
+        elif isinstance(obj, Interview):
+            bump(_day(obj.scheduled_time), "interviews", 1)
+        elif isinstance(obj, User) and obj.last_login is not None:
+            bump(_day(obj.last_login), "logins", 1)
+
+    for obj in session.dirty:
+        if isinstance(obj, Offer):
+            old, new, changed = column_history(obj, "status")
+            if changed:
+                was_hire = _status(old) == HIRED_STATUS
+                is_hire = _status(new) == HIRED_STATUS
+                bump(_day(loaded_value(obj, "created_at")), "hires", int(is_hire) - int(was_hire))
+        elif isinstance(obj, Interview):
+            old, new, changed = column_history(obj, "scheduled_time")
+            if changed and _day(old) != _day(new):
+                bump(_day(old), "interviews", -1)
+                bump(_day(new), "interviews", 1)
+        elif isinstance(obj, User):
+            old, new, changed = column_history(obj, "last_login")
+            # Only the user's first login of the day adds to that day
+            if changed and new is not None and _day(old) != _day(new):
+                bump(_day(new), "logins", 1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Offer):
+            old_status, _, _ = column_history(obj, "status")
+            day = _day(loaded_value(obj, "created_at"))
+            bump(day, "offers", -1)
+            bump(day, "hires", -1 if _status(old_status) == HIRED_STATUS else 0)
+        elif isinstance(obj, Interview):
+            old_time, _, _ = column_history(obj, "scheduled_time")
+            bump(_day(old_time), "interviews", -1)
+
+    return {day: values for day, values in deltas.items() if any(values.values())}
+
+
+track_columns(TRACKED_COLUMNS)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_daily_hiring_metrics(session: Session, flush_context) -> None:
+    deltas = _collect_deltas(session)
+    if deltas:
+        apply_counter_deltas(session.connection(), DailyHiringMetric.__table__, "day", METRICS, deltas)
+
+
+def _bucketed_activity(start: date, end: date):
+    """
+    Per-day metrics straight from the base tables, as one grouped SELECT
+    over a UNION ALL of the three sources (the rollup's fallback). Logins
+    can only count each user's latest login day, a lower bound of the
+    rollup's distinct users per day.
+    """
+    start_at = datetime.combine(start, time.min)
+    end_at = datetime.combine(end + timedelta(days=1), time.min)
+    zero, one = literal(0, Integer), literal(1, Integer)
+
+    offer_day = func.date(Offer.created_at)
+    interview_day = func.date(Interview.scheduled_time)
+    login_day = func.date(User.last_login)
+    activity = union_all(
+        select(
+            offer_day.label("day"),
+            case((Offer.status == HIRED_STATUS, 1), else_=0).label("hires"),
+            zero.label("interviews"),
+            one.label("offers"),
+            zero.label("logins"),
+        ).where(Offer.created_at >= start_at, Offer.created_at < end_at),
+        select(interview_day, zero, one, zero, zero)
+        .where(Interview.scheduled_time >= start_at, Interview.scheduled_time < end_at),
+        select(login_day, zero, zero, zero, one)
+        .where(User.last_login >= start_at, User.last_login < end_at),
+    ).subquery()
+
+    return (
+        select(
+            activity.c.day,
+            *[func.sum(activity.c[metric]).label(metric) for metric in METRICS],
+        )
+        .group_by(activity.c.day)
+        .order_by(activity.c.day)
+    )
+
+
+def rebuild_daily_hiring_metrics(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """
+    Recompute hires, interviews and offers for [start, end] (default: all
+    history up to today) from the base tables, keeping the recorded logins.
+    Returns the number of days with activity.
+    """
+    end = end or datetime.utcnow().date()
+    start = start or date(1970, 1, 1)
+    table = DailyHiringMetric.__table__
+    in_range = (table.c.day >= start, table.c.day <= end)
+
+    db.execute(table.update().where(*in_range).values(dict.fromkeys(REBUILT_METRICS, 0)))
+    deltas = {
+        _day(row.day): {metric: int(row._mapping[metric] or 0) for metric in REBUILT_METRICS}
+        for row in db.execute(_bucketed_activity(start, end))
+    }
+    apply_counter_deltas(db.connection(), table, "day", REBUILT_METRICS, deltas)
+    db.execute(table.delete().where(*in_range, *[table.c[metric] == 0 for metric in METRICS]))
+    db.commit()
+    return len(deltas)
+
+
+def get_daily_hiring_metrics(db: Session, days: int) -> List[Dict[str, Any]]:
+    """
+    The last `days` days (oldest first, today included), zero-filled.
+
+    Served from the rollup with one primary-key range scan; falls back to
+    the grouped base-table query when the rollup has never been built.
+    """
+    today = datetime.utcnow().date()
+    start = today - timedelta(days=max(1, days) - 1)
+
+    rows = (
+        db.query(DailyHiringMetric)
+        .filter(DailyHiringMetric.day >= start, DailyHiringMetric.day <= today)
+        .all()
+    )
+    by_day = {row.day: {metric: getattr(row, metric) for metric in METRICS} for row in rows}
+    if not rows and db.query(DailyHiringMetric.day).first() is None:
+        by_day = {
+            _day(row.day): {metric: int(row._mapping[metric] or 0) for metric in METRICS}
+            for row in db.execute(_bucketed_activity(start, today))
+        }
+
+    empty = dict.fromkeys(METRICS, 0)
+    return [
+        {"date": day.isoformat(), **by_day.get(day, empty)}
+        for day in (start + timedelta(days=offset) for offset in range((today - start).days + 1))
+    ]
@@ -1,18 +1,19 @@
 """
 Manager dashboard service
 """
-from typing import Dict, List, Any
-from sqlalchemy.orm import Session
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 from app.crud.mpr import crud_mpr
 from app.crud.interview import crud_interview
 from app.crud.offer import crud_offer
-from app.models.mpr import MPR
-from app.models.interview import Interview
+from app.models.interview import Interview, InterviewPanelist
 from app.models.job import Job
-from app.models.candidate import CandidateApplication, CandidateDocument
+from app.models.candidate import Candidate, CandidateApplication, CandidateDocument
 from app.models.offer import Offer
-from sqlalchemy import func, false, and_, or_
+from app.services.manager_visibility import visible_jobs_query
+from app.utils.pagination import DEFAULT_PAGE_SIZE, paginate
+from sqlalchemy import func, false, and_
 from sqlalchemy import cast, String
 
 class ManagerService:
@@ -21,47 +22,11 @@ class ManagerService:
 
     def _resolve_manager_jobs(self, manager_id: int) -> List[Job]:
         """Resolve jobs visible to a manager, including unlinked jobs that match manager MPRs."""
-        manager_mprs = self.db.query(MPR).filter(MPR.hiring_manager_id == manager_id).all()
-        direct_jobs = self.db.query(Job).filter(Job.manager_id == manager_id)
-
-        if not manager_mprs:
-            return direct_jobs.order_by(Job.created_at.desc()).all()
-
-        mpr_match_conditions = []
-        for mpr in manager_mprs:
-            mpr_match_conditions.append(
-                and_(
-                    func.lower(Job.title) == func.lower(mpr.job_title),
-                    func.lower(Job.department) == func.lower(mpr.department),
-                )
-            )
-            mpr_match_conditions.append(
-                func.lower(Job.title) == func.lower(mpr.job_title)
-            )
-            mpr_match_conditions.append(
-                func.lower(Job.department) == func.lower(mpr.department)
-            )
-
-        return (
-            self.db.query(Job)
-            .filter(
-                or_(
-                    Job.manager_id == manager_id,
-                    and_(
-                        Job.manager_id.is_(None),
-                        or_(*mpr_match_conditions),
-                    ),
-                )
-            )
-            .order_by(Job.created_at.desc())
-            .all()
-        )
+        return visible_jobs_query(self.db, manager_id).order_by(Job.created_at.desc()).all()
 
     def get_manager_interviews(self, manager_id: int) -> List[Interview]:
         """Get interviews visible to manager from panel assignments or manager-linked jobs."""
-        panel_assigned = self.db.query(Interview).filter(
-            cast(Interview.panel_members, String).like(f"%{manager_id}%")
-        ).all()
+        panel_assigned = crud_interview.get_interviews_by_panel_member(self.db, manager_id)
         if panel_assigned:
             return panel_assigned
 
@@ -93,8 +58,10 @@ class ManagerService:
         
         # Get interviews today
         today = datetime.utcnow().date()
-        interviews_today = self.db.query(Interview).filter(
-            cast(Interview.panel_members, String).like(f'%{manager_id}%'),
+        interviews_today = self.db.query(InterviewPanelist).join(
+            Interview, Interview.id == InterviewPanelist.interview_id
+        ).filter(
+            InterviewPanelist.user_id == manager_id,
             func.date(Interview.scheduled_time) == today
         ).count()
         
@@ -108,42 +75,102 @@ class ManagerService:
     def get_manager_pipeline(self, manager_id: int) -> List[Dict[str, Any]]:
         """Get pipeline stats for manager's requisitions"""
         manager_jobs = self._resolve_manager_jobs(manager_id)
+        stage_counts = self._pipeline_stage_counts([job.id for job in manager_jobs])
 
         result = []
         for job in manager_jobs:
-            apps_query = self.db.query(CandidateApplication).filter(CandidateApplication.job_id == job.id)
-            profiles_received = apps_query.count()
-            shortlisted = apps_query.filter(cast(CandidateApplication.status, String).in_(["shortlisted"])).count()
-            interviewed = apps_query.filter(cast(CandidateApplication.status, String).in_(["interview", "offered", "joined"])).count()
-            offered = apps_query.filter(cast(CandidateApplication.status, String).in_(["offered", "joined"])).count()
-            hired = apps_query.filter(cast(CandidateApplication.status, String) == "joined").count()
-
+            counts = stage_counts.get(job.id)
             result.append({
                 "jobTitle": job.title,
-                "profilesReceived": profiles_received,
-                "shortlisted": shortlisted,
-                "interviewed": interviewed,
-                "offered": offered,
-                "hired": hired,
+                "profilesReceived": counts.profiles_received if counts else 0,
+                "shortlisted": counts.shortlisted if counts else 0,
+                "interviewed": counts.interviewed if counts else 0,
+                "offered": counts.offered if counts else 0,
+                "hired": counts.hired if counts else 0,
                 "status": job.status,
                 "mprId": job.id
             })
         
         return result
 
-    def get_pipeline_candidates(self, manager_id: int, job_title: str, stage: str) -> List[Dict[str, Any]]:
-        """Get candidate-level drill-down for a manager pipeline stage."""
-        normalized_stage = (stage or "").strip().lower()
-        manager_jobs = self._resolve_manager_jobs(manager_id)
-        selected_jobs = [
-            job for job in manager_jobs
-            if not job_title or (job.title or "").strip().lower() == job_title.strip().lower()
-        ]
-        job_ids = [job.id for job in selected_jobs]
+    def _pipeline_stage_counts(self, job_ids: List[int]) -> Dict[int, Any]:
+        """Per-job stage counts for `job_ids` from one GROUP BY job_id query"""
         if not job_ids:
-            return []
+            return {}
+        status = cast(CandidateApplication.status, String)
+        rows = (
+            self.db.query(
+                CandidateApplication.job_id,
+                func.count().label("profiles_received"),
+                func.count().filter(status == "shortlisted").label("shortlisted"),
+                func.count().filter(status.in_(["interview", "offered", "joined"])).label("interviewed"),
+                func.count().filter(status.in_(["offered", "joined"])).label("offered"),
+                func.count().filter(status == "joined").label("hired"),
+            )
+            .filter(CandidateApplication.job_id.in_(job_ids))
+            .group_by(CandidateApplication.job_id)
+            .all()
+        )
+        return {row.job_id: row for row in rows}
+
+    def get_pipeline_candidates(
+        self,
+        manager_id: int,
+        job_title: str,
+        stage: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get candidate-level drill-down for a manager pipeline stage, newest
+        applications first. Without `limit` or `cursor` every row comes
+        back; otherwise one page at a time (`limit` defaults to
+        DEFAULT_PAGE_SIZE once a cursor is passed).
+
+        Each page is one statement: the applications with their candidate,
+        user and job joined in, and the latest resume per candidate ranked
+        with a window function.
+        """
+        normalized_stage = (stage or "").strip().lower()
+        job_ids = visible_jobs_query(self.db, manager_id).with_entities(Job.id)
+        if job_title:
+            job_ids = job_ids.filter(func.lower(func.trim(Job.title)) == job_title.strip().lower())
+
+        latest_resume = (
+            self.db.query(
+                CandidateDocument.candidate_id.label("candidate_id"),
+                CandidateDocument.document_url.label("document_url"),
+                func.row_number().over(
+                    partition_by=CandidateDocument.candidate_id,
+                    order_by=(CandidateDocument.uploaded_at.desc().nullslast(), CandidateDocument.id.desc()),
+                ).label("position"),
+            )
+            .filter(
+                CandidateDocument.candidate_id.in_(
+                    self.db.query(CandidateApplication.candidate_id).filter(
+                        CandidateApplication.job_id.in_(job_ids)
+                    )
+                ),
+                func.lower(CandidateDocument.document_type).like("resume%"),
+            )
+            .subquery()
+        )
 
-        apps_query = self.db.query(CandidateApplication).filter(CandidateApplication.job_id.in_(job_ids))
+        apps_query = (
+            self.db.query(CandidateApplication, latest_resume.c.document_url)
+            .outerjoin(
+                latest_resume,
+                and_(
+                    latest_resume.c.candidate_id == CandidateApplication.candidate_id,
+                    latest_resume.c.position == 1,
+                ),
+            )
+            .options(
+                joinedload(CandidateApplication.candidate).joinedload(Candidate.user),
+                joinedload(CandidateApplication.job),
+            )
+            .filter(CandidateApplication.job_id.in_(job_ids))
+        )
 
         if normalized_stage in {"profile shortlisted", "shortlisted"}:
             apps_query = apps_query.filter(cast(CandidateApplication.status, String) == "shortlisted")
@@ -158,23 +185,31 @@ class ManagerService:
         elif normalized_stage in {"on hold"}:
             apps_query = apps_query.filter(cast(CandidateApplication.status, String) == "hold")
 
-        applications = apps_query.order_by(CandidateApplication.applied_at.desc()).all()
+        if limit is None and not cursor:
+            # Unpaged, as before pagination, for clients that never read X-Next-Cursor
+            rows = apps_query.order_by(
+                CandidateApplication.applied_at.desc(), CandidateApplication.id.desc()
+            ).all()
+            next_cursor = None
+        else:
+            rows, next_cursor = paginate(
+                apps_query,
+                CandidateApplication.id,
+                sort_key=CandidateApplication.applied_at,
+                cursor=cursor,
+                limit=limit or DEFAULT_PAGE_SIZE,
+                descending=True,
+            )
         result: List[Dict[str, Any]] = []
-        for app in applications:
+        for app, resume_document_url in rows:
             candidate = app.candidate
             user = candidate.user if candidate else None
-            resume_doc = None
-            if candidate:
-                resume_doc = self.db.query(CandidateDocument).filter(
-                    CandidateDocument.candidate_id == candidate.id,
-                    cast(CandidateDocument.document_type, String).like("resume%")
-                ).order_by(CandidateDocument.uploaded_at.desc()).first()
 
             resume_url = ""
             if candidate and candidate.resume_url:
                 resume_url = candidate.resume_url
-            elif resume_doc:
-                resume_url = resume_doc.document_url
+            elif resume_document_url:
+                resume_url = resume_document_url
 
             result.append(
                 {
@@ -187,6 +222,6 @@ class ManagerService:
                     "resumeUrl": resume_url,
                 }
             )
-        return result
+        return result, next_cursor
 
 manager_service = ManagerService
@@ -0,0 +1,132 @@
+"""
+Manager → job visibility mapping.
+
+A manager sees the jobs they own (`jobs.manager_id`) plus every unowned job
+whose title or department matches one of their MPRs (case-insensitive).
+`manager_job_visibility` stores that relation so manager endpoints resolve
+their jobs with one indexed join instead of an OR over every MPR.
+
+A session `after_flush` listener refreshes the rows of the jobs and
+managers touched by job or MPR inserts, updates and deletes, in the same
+transaction. `rebuild_manager_job_visibility` recomputes all or part of the
+mapping set-based (e.g. after bulk SQL writes).
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import event, func, or_, select, union
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, ManagerJobVisibility
+from app.models.mpr import MPR
+from app.utils.counters import column_history, track_columns
+
+# Columns that change which manager sees which job
+JOB_COLUMNS = ("title", "department", "manager_id")
+MPR_COLUMNS = ("job_title", "department", "hiring_manager_id")
+
+track_columns({Job: JOB_COLUMNS, MPR: MPR_COLUMNS})
+
+
+def _visibility_rows(job_ids: Optional[Set[int]] = None, manager_ids: Optional[Set[int]] = None):
+    """SELECT (manager_id, job_id) for the visible pairs, optionally narrowed"""
+    owned = select(Job.manager_id.label("manager_id"), Job.id.label("job_id")).where(Job.manager_id.is_not(None))
+    matched = (
+        select(MPR.hiring_manager_id, Job.id)
+        .select_from(Job)
+        .join(
+            MPR,
+            or_(
+                func.lower(Job.title) == func.lower(MPR.job_title),
+                func.lower(Job.department) == func.lower(MPR.department),
+            ),
+        )
+        .where(Job.manager_id.is_(None), MPR.hiring_manager_id.is_not(None))
+    )
+    if job_ids is not None:
+        owned = owned.where(Job.id.in_(job_ids))
+        matched = matched.where(Job.id.in_(job_ids))
+    if manager_ids is not None:
+        owned = owned.where(Job.manager_id.in_(manager_ids))
+        matched = matched.where(MPR.hiring_manager_id.in_(manager_ids))
+    # UNION (not ALL) drops pairs matched by more than one MPR
+    return union(owned, matched)
+
+
+def _refresh(connection, job_ids: Optional[Set[int]] = None, manager_ids: Optional[Set[int]] = None) -> None:
+    table = ManagerJobVisibility.__table__
+    delete = table.delete()
+    if job_ids is not None:
+        delete = delete.where(table.c.job_id.in_(job_ids))
+    if manager_ids is not None:
+        delete = delete.where(table.c.manager_id.in_(manager_ids))
+    connection.execute(delete)
+    connection.execute(
+        table.insert().from_select(["manager_id", "job_id"], _visibility_rows(job_ids, manager_ids))
+    )
+
+
+def _changed(obj, keys: Iterable[str]) -> bool:
+    return any(column_history(obj, key)[2] for key in keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_manager_job_visibility(session: Session, flush_context) -> None:
+    job_ids: Set[int] = set()
+    manager_ids: Set[int] = set()
+
+    for obj in session.new:
+        if isinstance(obj, Job):
+            job_ids.add(obj.id)
+        elif isinstance(obj, MPR) and obj.hiring_manager_id is not None:
+            manager_ids.add(obj.hiring_manager_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Job) and _changed(obj, JOB_COLUMNS):
+            job_ids.add(obj.id)
+        elif isinstance(obj, MPR) and _changed(obj, MPR_COLUMNS):
+            old_manager, new_manager, _ = column_history(obj, "hiring_manager_id")
+            manager_ids.update(manager for manager in (old_manager, new_manager) if manager is not None)
+
+    for obj in session.deleted:
+        if isinstance(obj, Job):
+            job_ids.add(obj.id)
+        elif isinstance(obj, MPR):
+            old_manager, _, _ = column_history(obj, "hiring_manager_id")
+            if old_manager is not None:
+                manager_ids.add(old_manager)
+
+    connection = session.connection() if job_ids or manager_ids else None
+    if job_ids:
+        _refresh(connection, job_ids=job_ids)
+    if manager_ids:
+        _refresh(connection, manager_ids=manager_ids)
+
+
+def rebuild_manager_job_visibility(
+    db: Session,
+    job_ids: Optional[Iterable[int]] = None,
+    manager_ids: Optional[Iterable[int]] = None,
+    commit: bool = True,
+) -> None:
+    """
+    Recompute the mapping for `job_ids` and/or `manager_ids` (default: the
+    whole table) with one DELETE and one INSERT .. SELECT.
+    """
+    _refresh(
+        db.connection(),
+        job_ids=set(job_ids) if job_ids is not None else None,
+        manager_ids=set(manager_ids) if manager_ids is not None else None,
+    )
+    if commit:
+        db.commit()
+
+
+def visible_jobs_query(db: Session, manager_id: int):
+    """Jobs visible to `manager_id`, through the mapping's primary key"""
+    return (
+        db.query(Job)
+        .join(ManagerJobVisibility, ManagerJobVisibility.job_id == Job.id)
+        .filter(ManagerJobVisibility.manager_id == manager_id)
+    )
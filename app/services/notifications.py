@@ -1,17 +1,149 @@
 """
 Email notification service for ATS candidate lifecycle events.
+
+Requests only write a `queued` row to `notification_logs` (the outbox). The
+background `EmailOutboxWorker` claims queued rows in batches and delivers
+them over persistent SMTP connections, with a global send-rate limit and
+exponential-backoff retries.
 """
 from __future__ import annotations
 
-from datetime import datetime
-from email.mime.text import MIMEText
+import logging
 import smtplib
-from typing import Any, Dict
+import threading
+import time
+from email.mime.text import MIMEText
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.crud.notification import crud_notification
 from app.models.notification import NotificationLog
+from app.services.background import PollingWorker
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket shared by every sender thread"""
+
+    def __init__(self, rate_per_second: float, burst: Optional[int] = None):
+        self.rate = max(0.0, rate_per_second)
+        self.capacity = float(burst or max(1, int(self.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate == 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMTPSender:
+    """
+    One persistent SMTP session, reused for consecutive messages.
+
+    The connection is opened lazily, recycled after
+    `SMTP_MAX_MESSAGES_PER_CONNECTION` messages, dropped after sitting idle
+    for `SMTP_IDLE_TIMEOUT_SECONDS`, and reopened once if the server closed
+    it between messages. Not thread safe: each sender thread owns one.
+    """
+
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+        self.rate_limiter = rate_limiter
+        self._server: Optional[smtplib.SMTP] = None
+        self._sent_on_connection = 0
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        try:
+            if settings.SMTP_USE_TLS:
+                server.starttls()
+            if settings.SMTP_USER and settings.SMTP_PASSWORD:
+                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except Exception:
+            self._quit(server)
+            raise
+        self._sent_on_connection = 0
+        return server
+
+    def _connection(self) -> smtplib.SMTP:
+        stale = (
+            self._server is not None
+            and (
+                self._sent_on_connection >= max(1, settings.SMTP_MAX_MESSAGES_PER_CONNECTION)
+                or time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT_SECONDS
+            )
+        )
+        if stale:
+            self.close()
+        if self._server is None:
+            self._server = self._connect()
+        return self._server
+
+    def send(self, *, to_email: str, subject: str, body: str) -> None:
+        msg = MIMEText(body, "plain", "utf-8")
+        msg["Subject"] = subject
+        msg["From"] = settings.EMAIL_FROM
+        msg["To"] = to_email
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        message = msg.as_string()
+        for attempt in range(2):
+            try:
+                self._connection().sendmail(settings.EMAIL_FROM, [to_email], message)
+                break
+            except smtplib.SMTPServerDisconnected:
+                # The relay dropped the session between messages; retry once on a fresh one.
+                self.close()
+                if attempt:
+                    raise
+            except smtplib.SMTPRecipientsRefused:
+                raise
+            except (smtplib.SMTPException, OSError):
+                self.close()
+                raise
+        self._sent_on_connection += 1
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self) -> None:
+        if self._server is not None and time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT_SECONDS:
+            self.close()
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            self._quit(server)
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+def _is_permanent_failure(exc: Exception) -> bool:
+    """5xx replies (bad recipient, rejected content) will not succeed on retry"""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code >= 500 and not isinstance(exc, smtplib.SMTPAuthenticationError)
+    return False
 
 
 class NotificationService:
@@ -27,7 +159,14 @@ class NotificationService:
         user_id: int | None = None,
         candidate_id: int | None = None,
         payload: Dict[str, Any] | None = None,
+        commit: bool = True,
     ) -> Dict[str, Any]:
+        """
+        Queue a candidate email in the outbox.
+
+        Pass `commit=False` to queue several messages (or to queue alongside
+        other changes) and commit them in one transaction.
+        """
         payload = payload or {}
         subject, body = self._build_template(event, candidate_name, payload)
 
@@ -39,45 +178,66 @@ class NotificationService:
             subject=subject,
             body=body,
             status="queued",
+            attempts=0,
             payload=payload,
         )
         self.db.add(log)
-        self.db.flush()
-
-        try:
-            sent = self._dispatch_email(to_email=to_email, subject=subject, body=body)
-            log.status = "sent" if sent else "simulated"
-            log.sent_at = datetime.utcnow()
-            log.error_message = None
-        except Exception as exc:
-            log.status = "failed"
-            log.error_message = str(exc)
-
-        self.db.add(log)
-        self.db.commit()
-        self.db.refresh(log)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
         return {"id": log.id, "status": log.status}
 
-    def _dispatch_email(self, *, to_email: str, subject: str, body: str) -> bool:
-        if not settings.EMAIL_ENABLED:
-            return False
+    def deliver_pending(self, sender: Optional[SMTPSender] = None, max_messages: Optional[int] = None) -> int:
+        """
+        Deliver queued notifications in this session; returns the number handled.
 
-        if not settings.SMTP_HOST:
-            return False
-
-        msg = MIMEText(body, "plain", "utf-8")
-        msg["Subject"] = subject
-        msg["From"] = settings.EMAIL_FROM
-        msg["To"] = to_email
+        Without EMAIL_ENABLED/SMTP_HOST messages are marked `simulated`.
+        Failed sends are re-queued with exponential backoff until
+        EMAIL_MAX_ATTEMPTS, except permanent (5xx) rejections.
+        """
+        owns_sender = sender is None
+        if owns_sender:
+            sender = SMTPSender()
+        handled = 0
+        try:
+            while max_messages is None or handled < max_messages:
+                limit = settings.EMAIL_OUTBOX_BATCH_SIZE
+                if max_messages is not None:
+                    limit = min(limit, max_messages - handled)
+                logs = crud_notification.claim_batch(
+                    self.db, limit=limit, lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS
+                )
+                if not logs:
+                    break
+                for log in logs:
+                    self._deliver(log, sender)
+                handled += len(logs)
+        finally:
+            if owns_sender:
+                sender.close()
+        return handled
 
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=10) as server:
-            if settings.SMTP_USE_TLS:
-                server.starttls()
-            if settings.SMTP_USER and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.sendmail(settings.EMAIL_FROM, [to_email], msg.as_string())
+    def _deliver(self, log: NotificationLog, sender: SMTPSender) -> None:
+        if not settings.EMAIL_ENABLED or not settings.SMTP_HOST:
+            crud_notification.mark_delivered(self.db, log, simulated=True)
+            return
 
-        return True
+        try:
+            sender.send(to_email=log.to_email, subject=log.subject, body=log.body)
+        except Exception as exc:
+            permanent = _is_permanent_failure(exc)
+            delay = settings.EMAIL_RETRY_BACKOFF_SECONDS * (2 ** max(0, (log.attempts or 1) - 1))
+            logger.warning("Email %s to %s failed (attempt %s): %s", log.id, log.to_email, log.attempts, exc)
+            crud_notification.mark_failed(
+                self.db,
+                log,
+                str(exc),
+                max_attempts=log.attempts if permanent else settings.EMAIL_MAX_ATTEMPTS,
+                retry_delay_seconds=delay,
+            )
+            return
+        crud_notification.mark_delivered(self.db, log)
 
     def _build_template(self, event: str, candidate_name: str, payload: Dict[str, Any]) -> tuple[str, str]:
         company = str(payload.get("company", "HirePulse"))
@@ -135,5 +295,49 @@ class NotificationService:
         )
 
 
+class EmailOutboxWorker(PollingWorker):
+    """Drains the notification outbox; each thread keeps its own SMTP session"""
+
+    name = "email-outbox-worker"
+
+    def __init__(self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self._local = threading.local()
+        self._senders: List[SMTPSender] = []
+        self._senders_lock = threading.Lock()
+
+    def _sender(self) -> SMTPSender:
+        sender = getattr(self._local, "sender", None)
+        if sender is None:
+            sender = self._local.sender = SMTPSender(self.rate_limiter)
+            with self._senders_lock:
+                self._senders.append(sender)
+        return sender
+
+    def run_once(self, db: Session) -> bool:
+        sender = self._sender()
+        handled = NotificationService(db).deliver_pending(
+            sender=sender, max_messages=settings.EMAIL_OUTBOX_BATCH_SIZE
+        )
+        if not handled:
+            sender.close_if_idle()
+        return handled > 0
+
+    def stop(self, timeout: float = 10.0) -> None:
+        super().stop(timeout=timeout)
+        with self._senders_lock:
+            senders, self._senders = self._senders, []
+        for sender in senders:
+            sender.close()
+
+
 def notification_service(db: Session) -> NotificationService:
     return NotificationService(db)
+
+
+email_outbox_worker = EmailOutboxWorker(
+    concurrency=settings.EMAIL_OUTBOX_WORKERS,
+    poll_interval=settings.EMAIL_OUTBOX_POLL_SECONDS,
+    rate_limiter=RateLimiter(settings.EMAIL_RATE_LIMIT_PER_SECOND),
+)
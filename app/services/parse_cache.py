@@ -0,0 +1,178 @@
+"""
+Content-addressed cache for parsed resumes.
+
+Entries are keyed by the SHA-256 of the file bytes plus the parser version,
+so re-uploads of the same resume (or the same file under another name) skip
+parsing, and bumping `ResumeParser.VERSION` invalidates everything at once.
+A small in-memory LRU sits in front of a size-bounded directory of JSON files.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    def __init__(
+        self,
+        directory: Optional[str],
+        version: str,
+        max_memory_entries: int = 512,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.version = version
+        self.max_memory_entries = max(0, max_memory_entries)
+        self.max_disk_bytes = max(0, max_disk_bytes)
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for_file(self, file_path: str) -> Optional[str]:
+        """SHA-256 of the file contents, salted with the parser version"""
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        digest.update(b"\0")
+        try:
+            with open(file_path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not key:
+            return None
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(self._memory[key])
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return dict(value)
+
+    def set(self, key: Optional[str], value: Dict[str, Any]) -> None:
+        """Store a successful parse result (error results are never cached)"""
+        if not key or "error" in value:
+            return
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.directory or self.max_disk_bytes == 0:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                value = json.load(handle)
+            os.utime(path)  # mtime doubles as the LRU clock for eviction
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.directory or self.max_disk_bytes == 0:
+            return
+        path = self._path_for(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(value, handle)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write parse cache entry %s: %s", key, exc)
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the cache is at 90% of its cap"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+
+def _build_parse_cache() -> ParseCache:
+    from app.services.resume_parser import ResumeParser
+
+    return ParseCache(
+        directory=settings.RESUME_PARSE_CACHE_DIR or None,
+        version=ResumeParser.VERSION,
+        max_memory_entries=settings.RESUME_PARSE_CACHE_MEMORY_ENTRIES,
+        max_disk_bytes=settings.RESUME_PARSE_CACHE_MAX_MB * 1024 * 1024,
+    )
+
+
+parse_cache = _build_parse_cache()
@@ -0,0 +1,204 @@
+"""
+Process-pool resume parsing engine.
+
+Resume parsing is CPU bound (PDF layout analysis, regex passes, spaCy), so
+running it on threads inside the API process serializes on the GIL. The
+engine keeps a pool of worker processes, each with the parser (and its NLP
+models) loaded once at start-up, and bounds the number of resumes in flight.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - optional dependency (not on Windows)
+    resource = None
+
+from app.core.config import settings
+from app.services.parse_cache import ParseCache, parse_cache
+
+logger = logging.getLogger(__name__)
+
+_worker_parser = None
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """Cap worker memory and warm the parser once per process."""
+    global _worker_parser
+    if resource is not None and memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+
+    from app.services.resume_parser import resume_parser
+
+    _worker_parser = resume_parser
+
+
+def _parse_in_worker(file_path: str) -> Dict[str, Any]:
+    try:
+        return _worker_parser.parse_resume(file_path)
+    except MemoryError:
+        return {"error": "Resume parser exceeded its memory limit"}
+
+
+class ResumeParseEngine:
+    """
+    Parses resumes on a pool of worker processes.
+
+    `processes=0` parses in the calling thread, which keeps scripts and
+    single-process deployments free of the pool start-up cost.
+    """
+
+    def __init__(
+        self,
+        processes: int = 2,
+        timeout: float = 60.0,
+        memory_limit_mb: int = 0,
+        max_tasks_per_child: int = 0,
+        cache: Optional[ParseCache] = None,
+    ):
+        self.processes = max(0, processes)
+        self.cache = cache
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                options: Dict[str, Any] = {
+                    "max_workers": self.processes,
+                    "mp_context": multiprocessing.get_context("spawn"),
+                    "initializer": _init_worker,
+                    "initargs": (self.memory_limit_mb,),
+                }
+                if self.max_tasks_per_child > 0:
+                    options["max_tasks_per_child"] = self.max_tasks_per_child
+                self._executor = ProcessPoolExecutor(**options)
+            return self._executor
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """Tear down a pool that has a hung or dead worker."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        # A hung task cannot be cancelled, so its process has to be killed.
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _store(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        if self.cache is not None:
+            self.cache.set(key, result)
+
+    def parse(self, file_path: str) -> Dict[str, Any]:
+        """Parse a single resume"""
+        return self.parse_many([file_path])[0]
+
+    def parse_many(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse resumes concurrently, returning results in input order.
+
+        Files already in the parse cache are answered without parsing. At
+        most `processes` resumes are in flight at once, each with its own
+        `timeout` deadline. A timed-out or crashed file yields an
+        `{"error": ...}` result; the pool is restarted and the other in-flight
+        files are resubmitted.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        keys: List[Optional[str]] = [None] * len(file_paths)
+        pending = deque()
+        for index, path in enumerate(file_paths):
+            if self.cache is not None:
+                keys[index] = self.cache.key_for_file(path)
+                results[index] = self.cache.get(keys[index])
+            if results[index] is None:
+                pending.append((index, path))
+
+        if self.processes == 0:
+            from app.services.resume_parser import resume_parser
+
+            for index, path in pending:
+                results[index] = resume_parser.parse_resume(path)
+                self._store(keys[index], results[index])
+            return results
+
+        in_flight: Dict[Future, Tuple[int, str, float]] = {}
+
+        while pending or in_flight:
+            executor = self._get_executor()
+            while pending and len(in_flight) < self.processes:
+                index, path = pending.popleft()
+                try:
+                    future = executor.submit(_parse_in_worker, path)
+                except BrokenProcessPool:
+                    pending.appendleft((index, path))
+                    self._restart(executor)
+                    break
+                in_flight[future] = (index, path, time.monotonic() + self.timeout)
+            if not in_flight:
+                continue
+
+            next_deadline = min(deadline for _, _, deadline in in_flight.values())
+            done, _ = wait(
+                list(in_flight),
+                timeout=max(0.0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+
+            broken = False
+            for future in done:
+                index, path, _ = in_flight.pop(future)
+                try:
+                    results[index] = future.result()
+                    self._store(keys[index], results[index])
+                except BrokenProcessPool:
+                    broken = True
+                    logger.error("Resume parser worker died while parsing %s", path)
+                    results[index] = {"error": "Resume parser worker crashed"}
+                except Exception as exc:
+                    results[index] = {"error": str(exc)}
+
+            now = time.monotonic()
+            expired = [future for future, (_, _, deadline) in in_flight.items() if deadline <= now]
+            for future in expired:
+                index, path, _ = in_flight.pop(future)
+                logger.warning("Resume parse timed out after %ss: %s", self.timeout, path)
+                results[index] = {"error": f"Resume parsing timed out after {self.timeout:g}s"}
+
+            if broken or expired:
+                for future, (index, path, _) in in_flight.items():
+                    pending.appendleft((index, path))
+                in_flight.clear()
+                self._restart(executor)
+
+        return [result if result is not None else {"error": "Resume was not parsed"} for result in results]
+
+
+resume_parse_engine = ResumeParseEngine(
+    processes=settings.RESUME_PARSE_PROCESSES,
+    timeout=settings.RESUME_PARSE_TIMEOUT_SECONDS,
+    memory_limit_mb=settings.RESUME_PARSE_MEMORY_LIMIT_MB,
+    max_tasks_per_child=settings.RESUME_PARSE_MAX_TASKS_PER_CHILD,
+    cache=parse_cache,
+)
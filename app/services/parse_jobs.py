@@ -0,0 +1,127 @@
+"""
+Background resume parsing: job service and worker.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.candidate import crud_candidate
+from app.crud.parse_job import crud_parse_job
+from app.models.parse_job import ResumeParseJob
+from app.services.background import PollingWorker
+from app.services.candidate import candidate_service
+from app.services.parse_engine import resume_parse_engine
+
+logger = logging.getLogger(__name__)
+
+
+class ParseJobService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue_document(self, candidate_id: int, document_id: int, file_path: str) -> ResumeParseJob:
+        """Queue a resume document for background parsing"""
+        return crud_parse_job.enqueue(
+            self.db,
+            candidate_id=candidate_id,
+            document_id=document_id,
+            file_path=file_path,
+            max_attempts=settings.RESUME_PARSE_MAX_ATTEMPTS,
+        )
+
+    def run_job(self, job: ResumeParseJob, parsed_data: Optional[Dict[str, Any]] = None) -> ResumeParseJob:
+        """
+        Merge a parsed resume into the candidate profile and mark the
+        document verified. Failures are re-queued with exponential backoff
+        until the job runs out of attempts.
+        """
+        if parsed_data is None:
+            parsed_data = resume_parse_engine.parse(job.file_path)
+
+        try:
+            parse_result = candidate_service(self.db).parse_and_update_profile(
+                job.candidate_id, job.file_path, parsed_data=parsed_data, document_id=job.document_id
+            )
+        except Exception as exc:
+            parse_result = {"success": False, "error": str(exc)}
+
+        if not parse_result.get("success"):
+            self.db.rollback()
+            delay = settings.RESUME_PARSE_RETRY_BACKOFF_SECONDS * (2 ** max(0, (job.attempts or 1) - 1))
+            logger.warning("Resume parse job %s failed (attempt %s): %s", job.id, job.attempts, parse_result.get("error"))
+            return crud_parse_job.mark_failed(self.db, job, str(parse_result.get("error")), retry_delay_seconds=delay)
+
+        document = crud_candidate.get_document(self.db, job.document_id)
+        if document:
+            document.verified = True
+            self.db.add(document)
+
+        parsed_data = parse_result.get("parsed_data", {})
+        return crud_parse_job.mark_completed(
+            self.db,
+            job,
+            {
+                "updates_applied": parse_result.get("updates_applied", []),
+                "skills_extracted": len(parsed_data.get("skills", [])),
+                "experience_extracted": parsed_data.get("experience", 0),
+            },
+        )
+
+    def run_pending(self, max_jobs: Optional[int] = None) -> int:
+        """
+        Drain runnable jobs in this session; returns the number processed.
+
+        Jobs are claimed in batches sized to the parse engine so the
+        resumes of one batch are parsed in parallel.
+        """
+        processed = 0
+        batch_size = max(1, resume_parse_engine.processes)
+        while max_jobs is None or processed < max_jobs:
+            limit = batch_size if max_jobs is None else min(batch_size, max_jobs - processed)
+            jobs = []
+            while len(jobs) < limit:
+                job = crud_parse_job.claim_next(self.db, lease_seconds=settings.RESUME_PARSE_LEASE_SECONDS)
+                if not job:
+                    break
+                jobs.append(job)
+            if not jobs:
+                break
+
+            parsed = resume_parse_engine.parse_many([job.file_path for job in jobs])
+            for job, parsed_data in zip(jobs, parsed):
+                self.run_job(job, parsed_data=parsed_data)
+            processed += len(jobs)
+        return processed
+
+    @staticmethod
+    def serialize(job: ResumeParseJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "documentId": job.document_id,
+            "status": job.status,
+            "attempts": job.attempts,
+            "maxAttempts": job.max_attempts,
+            "error": job.last_error,
+            "result": job.result,
+            "createdAt": job.created_at.isoformat() if job.created_at else None,
+            "startedAt": job.started_at.isoformat() if job.started_at else None,
+            "finishedAt": job.finished_at.isoformat() if job.finished_at else None,
+        }
+
+
+class ResumeParseWorker(PollingWorker):
+    name = "resume-parse-worker"
+
+    def run_once(self, db: Session) -> bool:
+        return ParseJobService(db).run_pending(max_jobs=resume_parse_engine.processes or 1) > 0
+
+
+parse_job_service = ParseJobService
+resume_parse_worker = ResumeParseWorker(
+    concurrency=settings.RESUME_PARSE_WORKERS,
+    poll_interval=settings.RESUME_PARSE_POLL_SECONDS,
+)
@@ -0,0 +1,108 @@
+"""
+PDF text extraction backends for the resume parser.
+
+`pdftotext` (poppler, installed in the Docker image) runs as a subprocess
+and streams the text out without building a layout tree, which is many
+times faster and lighter than pdfminer on multi-page resumes. pdfminer
+stays as the in-process fallback for when the binary is missing, times
+out or fails on a file.
+
+RESUME_PDF_BACKEND selects the order:
+
+    auto       pdftotext when it is on the PATH, else pdfminer
+    pdftotext  pdftotext, falling back to pdfminer
+    pdfminer   pdfminer only
+
+Both backends stop after RESUME_PDF_MAX_PAGES pages.
+"""
+import logging
+import shutil
+import subprocess
+from typing import Callable, Dict, List, Optional
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+except ImportError:  # pragma: no cover - optional dependency
+    pdfminer_extract_text = None
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PdfBackendUnavailable(Exception):
+    """The backend cannot run here (binary or package missing)"""
+
+
+def extract_with_pdftotext(file_path: str, max_pages: int = 0, timeout: Optional[float] = None) -> str:
+    """Text of the first `max_pages` pages (0 = all) via the pdftotext binary"""
+    binary = shutil.which(settings.RESUME_PDFTOTEXT_PATH)
+    if binary is None:
+        raise PdfBackendUnavailable(f"{settings.RESUME_PDFTOTEXT_PATH} is not installed")
+
+    command = [binary, "-q", "-enc", "UTF-8"]
+    if max_pages > 0:
+        command += ["-l", str(max_pages)]
+    command += [file_path, "-"]
+    completed = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout or None,
+        check=True,
+    )
+    return completed.stdout.decode("utf-8", errors="ignore")
+
+
+def extract_with_pdfminer(file_path: str, max_pages: int = 0, timeout: Optional[float] = None) -> str:
+    """Text of the first `max_pages` pages (0 = all) via pdfminer, in process"""
+    if pdfminer_extract_text is None:
+        raise PdfBackendUnavailable("pdfminer is not installed")
+    return pdfminer_extract_text(file_path, maxpages=max_pages)
+
+
+PDF_BACKENDS: Dict[str, Callable[..., str]] = {
+    "pdftotext": extract_with_pdftotext,
+    "pdfminer": extract_with_pdfminer,
+}
+
+
+def backend_order(backend: str) -> List[str]:
+    """Backends to try, in order, for a RESUME_PDF_BACKEND value"""
+    if backend == "pdfminer":
+        return ["pdfminer"]
+    if backend == "pdftotext":
+        return ["pdftotext", "pdfminer"]
+    if backend != "auto":
+        logger.warning(f"Unknown RESUME_PDF_BACKEND {backend!r}; using auto")
+    if shutil.which(settings.RESUME_PDFTOTEXT_PATH):
+        return ["pdftotext", "pdfminer"]
+    return ["pdfminer"]
+
+
+def extract_pdf_text(file_path: str, backend: Optional[str] = None) -> str:
+    """
+    Text of the PDF at `file_path` from the first backend that returns any.
+
+    A backend that is unavailable, fails, times out or finds no text hands
+    over to the next one; "" means none of them produced text.
+    """
+    for name in backend_order(backend or settings.RESUME_PDF_BACKEND):
+        try:
+            text = PDF_BACKENDS[name](
+                file_path,
+                max_pages=settings.RESUME_PDF_MAX_PAGES,
+                timeout=settings.RESUME_PDF_TIMEOUT_SECONDS,
+            )
+        except PdfBackendUnavailable as e:
+            logger.debug(f"PDF backend {name} unavailable: {e}")
+            continue
+        except subprocess.TimeoutExpired:
+            logger.warning(f"PDF backend {name} timed out on {file_path}")
+            continue
+        except Exception as e:
+            logger.warning(f"PDF backend {name} failed on {file_path}: {e}")
+            continue
+        if text.strip():
+            return text
+    return ""
@@ -0,0 +1,242 @@
+"""
+MPR pipeline counters.
+
+`mpr_pipeline_counters` keeps one row of stage counts (sourced, screened,
+interviewed, offered, hired, dnj) per job. A session `after_flush` listener
+turns every ORM insert, status transition, job move and delete of an
+application or offer into per-job deltas and upserts them in the same
+transaction. MPR figures are the sum over the jobs linked to the MPR, so
+the pipeline matrix costs one read proportional to the number of jobs, not
+applications. A job is linked to an MPR explicitly, by a job requisition or
+an offer carrying the MPR's id, or, for MPRs without explicit links, by a
+case-insensitive match of the job title to the MPR's job title (as in the
+manager job visibility mapping). MPRs without any linked job keep their
+stored pipeline_stats.
+
+Bulk `query.update()`/`query.delete()` calls bypass the listener; callers
+that use them run `reconcile_pipeline_counters` for the affected jobs,
+which rebuilds the counters with one set-based statement.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import Integer, String, case, cast, event, func, literal, select, union, union_all
+from sqlalchemy.orm import Session
+
+from app.models.candidate import CandidateApplication
+from app.models.job import Job, JobRequisition
+from app.models.metrics import MPRPipelineCounter
+from app.models.mpr import MPR
+from app.models.offer import Offer
+from app.utils.counters import apply_counter_deltas, column_history, track_columns
+
+COUNTERS = ("sourced", "screened", "interviewed", "offered", "hired", "dnj")
+
+# Application statuses (lower-cased) that count towards each stage
+SCREENED_STATUSES = ("screening", "shortlisted", "interview", "interviewing", "offered", "hired", "joined")
+INTERVIEWED_STATUSES = ("interview", "interviewing", "offered", "hired", "joined")
+# Offer statuses that count towards each stage
+OFFERED_STATUSES = ("offered", "accepted", "joined")
+HIRED_STATUSES = ("joined",)
+DNJ_STATUSES = ("declined", "withdrawn", "expired")
+
+TRACKED_COLUMNS = {
+    CandidateApplication: ("job_id", "status"),
+    Offer: ("job_id", "status"),
+}
+
+
+def _status(value: Any) -> str:
+    value = value.value if hasattr(value, "value") else value
+    return str(value or "").lower()
+
+
+def application_stages(status: Any) -> List[str]:
+    """Counters an application in `status` contributes to"""
+    status = _status(status)
+    stages = ["sourced"]
+    if status in SCREENED_STATUSES:
+        stages.append("screened")
+    if status in INTERVIEWED_STATUSES:
+        stages.append("interviewed")
+    return stages
+
+
+def offer_stages(status: Any) -> List[str]:
+    """Counters an offer in `status` contributes to"""
+    status = _status(status)
+    stages = []
+    if status in OFFERED_STATUSES:
+        stages.append("offered")
+    if status in HIRED_STATUSES:
+        stages.append("hired")
+    if status in DNJ_STATUSES:
+        stages.append("dnj")
+    return stages
+
+
+_STAGES = {CandidateApplication: application_stages, Offer: offer_stages}
+
+
+def _collect_deltas(session: Session) -> Dict[int, Dict[str, int]]:
+    deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+
+    def bump(job_id: Optional[int], stages: List[str], amount: int) -> None:
+        if job_id is not None:
+            for stage in stages:
+                deltas[job_id][stage] += amount
+
+    for obj in session.new:
+        stages = _STAGES.get(type(obj))
+        if stages:
+            bump(obj.job_id, stages(obj.status), 1)
+
+    for obj in session.dirty:
+        stages = _STAGES.get(type(obj))
+        if not stages:
+            continue
+        old_job, new_job, job_changed = column_history(obj, "job_id")
+        old_status, new_status, status_changed = column_history(obj, "status")
+        if job_changed or status_changed:
+            bump(old_job, stages(old_status), -1)
+            bump(new_job, stages(new_status), 1)
+
+    for obj in session.deleted:
+        stages = _STAGES.get(type(obj))
+        if stages:
+            old_job, _, _ = column_history(obj, "job_id")
+            old_status, _, _ = column_history(obj, "status")
+            bump(old_job, stages(old_status), -1)
+
+    return {job_id: values for job_id, values in deltas.items() if any(values.values())}
+
+
+track_columns(TRACKED_COLUMNS)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_pipeline_counters(session: Session, flush_context) -> None:
+    deltas = _collect_deltas(session)
+    if deltas:
+        apply_counter_deltas(session.connection(), MPRPipelineCounter.__table__, "job_id", COUNTERS, deltas)
+
+
+def _pipeline_counts_by_job(job_ids: Optional[Iterable[int]] = None):
+    """Stage counts per job straight from applications and offers, as one grouped SELECT"""
+    zero = literal(0, Integer)
+    application_status = func.lower(CandidateApplication.status)
+    offer_status = cast(Offer.status, String)
+
+    applications = select(
+        CandidateApplication.job_id.label("job_id"),
+        literal(1, Integer).label("sourced"),
+        case((application_status.in_(SCREENED_STATUSES), 1), else_=0).label("screened"),
+        case((application_status.in_(INTERVIEWED_STATUSES), 1), else_=0).label("interviewed"),
+        zero.label("offered"),
+        zero.label("hired"),
+        zero.label("dnj"),
+    )
+    offers = select(
+        Offer.job_id,
+        zero,
+        zero,
+        zero,
+        case((offer_status.in_(OFFERED_STATUSES), 1), else_=0),
+        case((offer_status.in_(HIRED_STATUSES), 1), else_=0),
+        case((offer_status.in_(DNJ_STATUSES), 1), else_=0),
+    )
+    if job_ids is not None:
+        job_ids = list(job_ids)
+        applications = applications.where(CandidateApplication.job_id.in_(job_ids))
+        offers = offers.where(Offer.job_id.in_(job_ids))
+
+    activity = union_all(applications, offers).subquery()
+    return (
+        select(activity.c.job_id, *[func.sum(activity.c[counter]).label(counter) for counter in COUNTERS])
+        .where(activity.c.job_id.is_not(None))
+        .group_by(activity.c.job_id)
+    )
+
+
+def reconcile_pipeline_counters(db: Session, job_ids: Optional[Iterable[int]] = None, commit: bool = True) -> None:
+    """
+    Rebuild the counters of `job_ids` (default: every job) from the
+    applications and offers tables with one INSERT .. SELECT.
+    """
+    table = MPRPipelineCounter.__table__
+    delete = table.delete()
+    if job_ids is not None:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        delete = delete.where(table.c.job_id.in_(job_ids))
+    db.execute(delete)
+    db.execute(table.insert().from_select(["job_id", *COUNTERS], _pipeline_counts_by_job(job_ids)))
+    if commit:
+        db.commit()
+
+
+def _mpr_job_links(mpr_ids):
+    """SELECT (mpr_id, job_id) for the jobs linked to the MPR ids selected by `mpr_ids`"""
+    explicit = union(
+        select(JobRequisition.mpr_id.label("mpr_id"), JobRequisition.job_id.label("job_id"))
+        .where(JobRequisition.mpr_id.in_(mpr_ids), JobRequisition.job_id.is_not(None)),
+        select(Offer.mpr_id, Offer.job_id).where(Offer.mpr_id.in_(mpr_ids), Offer.job_id.is_not(None)),
+    ).cte("explicit_links")
+    matched = (
+        select(MPR.id, Job.id)
+        .select_from(MPR)
+        .join(Job, func.lower(Job.title) == func.lower(MPR.job_title))
+        .where(MPR.id.in_(mpr_ids), ~select(explicit.c.mpr_id).where(explicit.c.mpr_id == MPR.id).exists())
+    )
+    # UNION (not ALL) counts a job linked twice to one MPR once
+    return union(select(explicit.c.mpr_id, explicit.c.job_id), matched).subquery()
+
+
+def _mpr_totals(mpr_ids):
+    """Counter sums per MPR for the MPR ids selected by `mpr_ids` that have linked jobs"""
+    counters = MPRPipelineCounter.__table__
+    links = _mpr_job_links(mpr_ids)
+    return (
+        select(
+            links.c.mpr_id,
+            *[func.coalesce(func.sum(counters.c[counter]), 0).label(counter) for counter in COUNTERS],
+        )
+        .select_from(links)
+        .outerjoin(counters, counters.c.job_id == links.c.job_id)
+        .group_by(links.c.mpr_id)
+    )
+
+
+def get_pipeline_counts_by_mpr(db: Session, mpr_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """Stage counts for those of `mpr_ids` that have linked jobs"""
+    mpr_ids = list(mpr_ids)
+    if not mpr_ids:
+        return {}
+    return {
+        row.mpr_id: {counter: int(row._mapping[counter] or 0) for counter in COUNTERS}
+        for row in db.execute(_mpr_totals(mpr_ids))
+    }
+
+
+def get_mpr_pipeline_rows(db: Session, limit: int = 50) -> List[Any]:
+    """
+    The `limit` newest MPRs with their stage counts, in one statement:
+    the MPR page joined to the counter sums of its jobs. `linked` is false
+    (and the counts are NULL) for MPRs without linked jobs.
+    """
+    page = select(MPR.id).order_by(MPR.created_at.desc(), MPR.id.desc()).limit(limit).scalar_subquery()
+    totals = _mpr_totals(page).subquery()
+    return (
+        db.query(
+            MPR,
+            totals.c.mpr_id.is_not(None).label("linked"),
+            *[totals.c[counter] for counter in COUNTERS],
+        )
+        .outerjoin(totals, totals.c.mpr_id == MPR.id)
+        .filter(MPR.id.in_(page))
+        .order_by(MPR.created_at.desc(), MPR.id.desc())
+        .all()
+    )
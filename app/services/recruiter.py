@@ -1,8 +1,8 @@
 """
 Recruiter dashboard service
 """
-from typing import Dict, List, Any
-from sqlalchemy.orm import Session
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timedelta
 from app.crud.mpr import crud_mpr
 from app.crud.agency import crud_agency
@@ -11,74 +11,47 @@ from app.crud.interview import crud_interview
 from app.crud.offer import crud_offer
 from app.models.mpr import MPR
 from app.models.agency import Agency
-from app.models.candidate import CandidateApplication
+from app.models.candidate import CandidateApplication, CandidateDocument
 from app.models.interview import Interview
 from app.models.offer import Offer
-from sqlalchemy import cast, String, func
+from sqlalchemy import cast, Integer, String, func, case, or_, and_, true
+from app.utils.pagination import DEFAULT_PAGE_SIZE
+from app.services.pipeline_counters import (
+    COUNTERS as PIPELINE_COUNTERS,
+    INTERVIEWED_STATUSES,
+    SCREENED_STATUSES,
+    get_mpr_pipeline_rows,
+)
 
 class RecruiterService:
+    SCREENED_STATUSES = SCREENED_STATUSES
+    INTERVIEWED_STATUSES = INTERVIEWED_STATUSES
+
     def __init__(self, db: Session):
         self.db = db
     
     def get_recruiter_stats(self, recruiter_id: int) -> Dict[str, Any]:
         """Get recruiter dashboard statistics"""
-        active_mprs = self.db.query(MPR).filter(
-            func.lower(MPR.status) == "active"
-        ).count()
-
-        total_candidates = self.db.query(CandidateApplication).count()
-
-        upcoming_interviews = self.db.query(Interview).filter(
-            Interview.scheduled_time >= datetime.utcnow(),
-            cast(Interview.status, String) == "scheduled"
-        ).count()
-
-        pending_offers = self.db.query(Offer).filter(
-            cast(Offer.status, String) == "offered"
-        ).count()
-
-        screened_candidates = self.db.query(CandidateApplication).filter(
-            func.lower(CandidateApplication.status).in_([
-                "screening", "shortlisted", "interview", "interviewing", "offered", "hired", "joined"
-            ])
-        ).count()
-        interviewed_candidates = self.db.query(CandidateApplication).filter(
-            func.lower(CandidateApplication.status).in_([
-                "interview", "interviewing", "offered", "hired", "joined"
-            ])
-        ).count()
-        offered_candidates = self.db.query(Offer).filter(
-            cast(Offer.status, String).in_(["offered", "accepted", "joined"])
-        ).count()
-        hired_candidates = self.db.query(Offer).filter(
-            cast(Offer.status, String) == "joined"
-        ).count()
-        dnj_candidates = self.db.query(Offer).filter(
-            cast(Offer.status, String).in_(["declined", "withdrawn", "expired"])
-        ).count()
-
-        total_released_offers = self.db.query(Offer).filter(
-            cast(Offer.status, String) != "draft"
-        ).count()
-        accepted_offers = self.db.query(Offer).filter(
-            cast(Offer.status, String).in_(["accepted", "joined"])
-        ).count()
-        offer_acceptance_rate = round((accepted_offers / total_released_offers) * 100, 1) if total_released_offers else 0.0
+        counts = self._recruiter_stat_counts()
+        offer_acceptance_rate = (
+            round((counts.accepted_offers / counts.total_released_offers) * 100, 1)
+            if counts.total_released_offers else 0.0
+        )
 
         return {
             "kpis": [
-                {"name": "Active MPRs", "value": active_mprs, "change": "0"},
-                {"name": "Candidates in Pipeline", "value": total_candidates, "change": "0%"},
-                {"name": "Upcoming Interviews", "value": upcoming_interviews, "change": "0"},
-                {"name": "Offers Pending", "value": pending_offers, "change": "0"}
+                {"name": "Active MPRs", "value": counts.active_mprs, "change": "0"},
+                {"name": "Candidates in Pipeline", "value": counts.total_candidates, "change": "0%"},
+                {"name": "Upcoming Interviews", "value": counts.upcoming_interviews, "change": "0"},
+                {"name": "Offers Pending", "value": counts.pending_offers, "change": "0"}
             ],
             "matrixData": {
-                "sourced": total_candidates,
-                "screened": screened_candidates,
-                "interviewed": interviewed_candidates,
-                "offered": offered_candidates,
-                "hired": hired_candidates,
-                "dnj": dnj_candidates,
+                "sourced": counts.total_candidates,
+                "screened": counts.screened_candidates,
+                "interviewed": counts.interviewed_candidates,
+                "offered": counts.offered_candidates,
+                "hired": counts.hired_candidates,
+                "dnj": counts.dnj_candidates,
             },
             "performanceMetrics": {
                 "timeToFill": 0,
@@ -87,30 +60,246 @@ class RecruiterService:
                 "sourceEffectiveness": {
                     "agency": 0,
                     "referral": 0,
-                    "direct": total_candidates,
+                    "direct": counts.total_candidates,
                     "jobBoard": 0
                 }
             }
         }
     
+    def _recruiter_stat_counts(self):
+        """
+        Every dashboard count in one statement: one conditional-aggregate
+        subquery per table, cross joined into a single row.
+        """
+        # Group by status first so each table is read through its status
+        # index; the conditional sums then run over a handful of rows.
+        status_counts = (
+            self.db.query(
+                func.lower(CandidateApplication.status).label("status"),
+                func.count().label("total"),
+            )
+            .group_by(func.lower(CandidateApplication.status))
+            .subquery()
+        )
+        applications = self._conditional_sums(status_counts, {
+            "total_candidates": None,
+            "screened_candidates": status_counts.c.status.in_(self.SCREENED_STATUSES),
+            "interviewed_candidates": status_counts.c.status.in_(self.INTERVIEWED_STATUSES),
+        })
+        offer_counts = (
+            self.db.query(Offer.status.label("status"), func.count().label("total"))
+            .group_by(Offer.status)
+            .subquery()
+        )
+        offer_status = offer_counts.c.status
+        offers = self._conditional_sums(offer_counts, {
+            "pending_offers": offer_status == "offered",
+            "offered_candidates": offer_status.in_(["offered", "accepted", "joined"]),
+            "hired_candidates": offer_status == "joined",
+            "dnj_candidates": offer_status.in_(["declined", "withdrawn", "expired"]),
+            "total_released_offers": offer_status != "draft",
+            "accepted_offers": offer_status.in_(["accepted", "joined"]),
+        })
+        interviews = self.db.query(func.count().label("upcoming_interviews")).select_from(Interview).filter(
+            Interview.scheduled_time >= datetime.utcnow(),
+            Interview.status == "scheduled",
+        ).subquery()
+        mprs = self.db.query(func.count().label("active_mprs")).select_from(MPR).filter(
+            func.lower(MPR.status) == "active"
+        ).subquery()
+
+        return (
+            self.db.query(applications, offers, interviews, mprs)
+            .select_from(applications)
+            .join(offers, true())
+            .join(interviews, true())
+            .join(mprs, true())
+            .one()
+        )
+
+    def _conditional_sums(self, grouped, conditions: Dict[str, Any]):
+        """One-row subquery of SUM(total) FILTER (WHERE condition) per label"""
+        columns = []
+        for label, condition in conditions.items():
+            total = func.sum(grouped.c.total) if condition is None else func.sum(grouped.c.total).filter(condition)
+            # SUM of counts is NUMERIC on PostgreSQL; cast back so the JSON stays integral
+            columns.append(cast(func.coalesce(total, 0), Integer).label(label))
+        return self.db.query(*columns).select_from(grouped).subquery()
+
+    @staticmethod
+    def _stored_pipeline_counts(mpr: MPR) -> Dict[str, int]:
+        """Stage counts from the MPR's stored pipeline_stats (MPRs without linked jobs)"""
+        stats = mpr.pipeline_stats if isinstance(mpr.pipeline_stats, dict) else {}
+        return {
+            "sourced": int(stats.get("profilesReceived", 0) or 0),
+            "screened": int(stats.get("screened", 0) or 0),
+            "interviewed": int(stats.get("interviewed", 0) or 0),
+            "offered": int(stats.get("offered", 0) or 0),
+            "hired": int(stats.get("selected", 0) or 0),
+            "dnj": int(stats.get("dnj", 0) or 0),
+        }
+
     def get_pipeline_matrix(self, recruiter_id: int) -> List[Dict[str, Any]]:
         """Get pipeline matrix data"""
-        mprs = self.db.query(MPR).order_by(MPR.created_at.desc()).limit(50).all()
         rows: List[Dict[str, Any]] = []
-        for mpr in mprs:
-            stats = mpr.pipeline_stats if isinstance(mpr.pipeline_stats, dict) else {}
+        for row in get_mpr_pipeline_rows(self.db, limit=50):
+            if row.linked:
+                counts = {counter: int(row._mapping[counter]) for counter in PIPELINE_COUNTERS}
+            else:
+                counts = self._stored_pipeline_counts(row.MPR)
             rows.append(
                 {
-                    "mprId": mpr.requisition_code,
-                    "role": mpr.job_title,
-                    "sourced": int(stats.get("profilesReceived", 0) or 0),
-                    "screened": int(stats.get("screened", 0) or 0),
-                    "interviewed": int(stats.get("interviewed", 0) or 0),
-                    "offered": int(stats.get("offered", 0) or 0),
-                    "hired": int(stats.get("selected", 0) or 0),
-                    "status": str(mpr.status).lower(),
+                    "mprId": row.MPR.requisition_code,
+                    "role": row.MPR.job_title,
+                    **counts,
+                    "status": str(row.MPR.status).lower(),
                 }
             )
         return rows
 
+    def get_candidate_list(
+        self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Candidate table for the recruiter dashboard, one page at a time.
+
+        Runs a constant number of queries regardless of page size: the
+        candidate page (with users), the latest application per candidate
+        (with its job), document status aggregates and the latest resume.
+        """
+        candidates, next_cursor = crud_candidate.get_all_profiles(self.db, cursor=cursor, limit=limit)
+        return self._candidate_rows(candidates), next_cursor
+
+    def search_candidates(
+        self,
+        skills: List[str],
+        match_all: bool = True,
+        min_experience: int = 0,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Candidates with all (or any) of `skills` and at least
+        `min_experience` years, one page at a time, with the total match
+        count and the number of matches per requested skill.
+        """
+        candidates, next_cursor = crud_candidate.search_profiles(
+            self.db, skills, match_all=match_all, min_experience=min_experience, cursor=cursor, limit=limit
+        )
+        total, by_skill = crud_candidate.count_profiles_by_skill(
+            self.db, skills, match_all=match_all, min_experience=min_experience
+        )
+        return {
+            "total": total,
+            "skillCounts": by_skill,
+            "candidates": self._candidate_rows(candidates),
+        }, next_cursor
+
+    def _candidate_rows(self, candidates: List[Any]) -> List[Dict[str, Any]]:
+        """Dashboard rows for a page of candidates (users loaded)"""
+        candidate_ids = [candidate.id for candidate in candidates]
+        if not candidate_ids:
+            return []
+
+        latest_applications = self._latest_applications(candidate_ids)
+        document_status = self._document_status(candidate_ids, ("aadhaar", "pan"))
+        latest_resume_urls = self._latest_resume_urls(candidate_ids)
+
+        response: List[Dict[str, Any]] = []
+        for candidate in candidates:
+            latest_application = latest_applications.get(candidate.id)
+            statuses = document_status.get(candidate.id, {})
+            response.append(
+                {
+                    "id": candidate.id,
+                    "name": candidate.user.name if candidate.user else "",
+                    "email": candidate.user.email if candidate.user else "",
+                    "skills": candidate.skills or [],
+                    "experience": candidate.experience_years,
+                    "currentCompany": candidate.current_company,
+                    "currentRole": latest_application.job.title if latest_application and latest_application.job else candidate.current_position,
+                    "status": latest_application.status if latest_application else "applied",
+                    "matchScore": latest_application.ai_score if latest_application and latest_application.ai_score is not None else 0,
+                    "appliedDate": latest_application.applied_at.isoformat() if latest_application and latest_application.applied_at else None,
+                    "applicationId": latest_application.id if latest_application else None,
+                    "resumeUrl": candidate.resume_url or latest_resume_urls.get(candidate.id, ""),
+                    "aadhaarStatus": statuses.get("aadhaar", "MISSING"),
+                    "panStatus": statuses.get("pan", "MISSING"),
+                }
+            )
+        return response
+
+    def _latest_applications(self, candidate_ids: List[int]) -> Dict[int, CandidateApplication]:
+        """Latest application (with job) per candidate in one query"""
+        ranked = (
+            self.db.query(
+                CandidateApplication.id.label("id"),
+                func.row_number().over(
+                    partition_by=CandidateApplication.candidate_id,
+                    order_by=(CandidateApplication.applied_at.desc(), CandidateApplication.id.desc()),
+                ).label("position"),
+            )
+            .filter(CandidateApplication.candidate_id.in_(candidate_ids))
+            .subquery()
+        )
+        applications = (
+            self.db.query(CandidateApplication)
+            .join(ranked, ranked.c.id == CandidateApplication.id)
+            .filter(ranked.c.position == 1)
+            .options(joinedload(CandidateApplication.job))
+            .all()
+        )
+        return {application.candidate_id: application for application in applications}
+
+    def _document_status(self, candidate_ids: List[int], doc_types: tuple) -> Dict[int, Dict[str, str]]:
+        """MISSING / PENDING / VERIFIED per document type, from one grouped query"""
+        document_type = func.lower(CandidateDocument.document_type)
+        columns = []
+        for doc_type in doc_types:
+            matches = or_(document_type == doc_type, document_type.startswith(f"{doc_type}_", autoescape=True))
+            columns.append(func.max(case((matches, 1), else_=0)).label(f"{doc_type}_present"))
+            columns.append(
+                func.max(case((and_(matches, CandidateDocument.verified == True), 1), else_=0)).label(f"{doc_type}_verified")
+            )
+
+        rows = (
+            self.db.query(CandidateDocument.candidate_id, *columns)
+            .filter(CandidateDocument.candidate_id.in_(candidate_ids))
+            .group_by(CandidateDocument.candidate_id)
+            .all()
+        )
+        statuses: Dict[int, Dict[str, str]] = {}
+        for row in rows:
+            values = row._mapping
+            statuses[row.candidate_id] = {
+                doc_type: (
+                    "VERIFIED" if values[f"{doc_type}_verified"]
+                    else "PENDING" if values[f"{doc_type}_present"]
+                    else "MISSING"
+                )
+                for doc_type in doc_types
+            }
+        return statuses
+
+    def _latest_resume_urls(self, candidate_ids: List[int]) -> Dict[int, str]:
+        """URL of the most recently uploaded resume per candidate"""
+        ranked = (
+            self.db.query(
+                CandidateDocument.candidate_id.label("candidate_id"),
+                CandidateDocument.document_url.label("document_url"),
+                func.row_number().over(
+                    partition_by=CandidateDocument.candidate_id,
+                    order_by=(CandidateDocument.uploaded_at.desc().nullslast(), CandidateDocument.id.desc()),
+                ).label("position"),
+            )
+            .filter(
+                CandidateDocument.candidate_id.in_(candidate_ids),
+                func.lower(CandidateDocument.document_type) == "resume",
+            )
+            .subquery()
+        )
+        rows = self.db.query(ranked.c.candidate_id, ranked.c.document_url).filter(ranked.c.position == 1).all()
+        return {row.candidate_id: row.document_url for row in rows}
+
+
 recruiter_service = RecruiterService
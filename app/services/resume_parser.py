@@ -18,19 +18,11 @@ try:
     import pandas as pd
 except ImportError:  # pragma: no cover - optional dependency
     pd = None
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
 import mimetypes 
-try:
-    from pdfminer.high_level import extract_text as extract_pdf_text
-except ImportError:  # pragma: no cover - optional dependency
-    extract_pdf_text = None
-
-try:
-    from docx import Document
-except ImportError:  # pragma: no cover - optional dependency
-    Document = None
 import io
 try:
     from nltk.tokenize import word_tokenize
@@ -39,6 +31,10 @@ except Exception:  # pragma: no cover - optional dependency
     word_tokenize = None
     stopwords = None
 import logging
+from app.core.config import settings
+from app.services.docx_text import extract_docx_text
+from app.services.pdf_text import extract_pdf_text
+from app.services.skill_matcher import SkillMatcher, load_skill_taxonomy
 
 # Download NLTK data when available
 if nltk is not None:
@@ -51,8 +47,102 @@ if nltk is not None:
 
 logger = logging.getLogger(__name__)
 
+class ResumeDocument:
+    """
+    One resume's text with the views every extraction stage shares.
+
+    Each view (lower-cased text, lines, section headers) is computed at
+    most once per document, on first use, instead of once per extractor.
+    """
+
+    # Section headers ("Skills:", "Summary •", ...) located in one scan
+    SECTION_HEADER_RE = re.compile(
+        r'(technical skills|core competencies|skills|summary|objective|profile)\s*[:•]',
+        re.IGNORECASE,
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.split('\n')
+
+    @cached_property
+    def lines_lower(self) -> List[str]:
+        return [line.lower() for line in self.lines]
+
+    @cached_property
+    def sections(self) -> Dict[str, str]:
+        """
+        Body of the first occurrence of each section header: the text after
+        the header up to the next blank line (or the end of the document)
+        """
+        sections: Dict[str, str] = {}
+        for match in self.SECTION_HEADER_RE.finditer(self.text):
+            header = match.group(1).lower()
+            # "Technical skills:" is also the first "skills:" if none came before
+            keys = (header, "skills") if header == "technical skills" else (header,)
+            for key in keys:
+                if key not in sections:
+                    end = self.text.find('\n\n', match.end())
+                    sections[key] = self.text[match.end():end if end != -1 else len(self.text)]
+        return sections
+
+
 class ResumeParser:
     """Resume parsing service to extract candidate information"""
+
+    # Bump whenever extraction output changes; it is part of the parse cache key.
+    VERSION = "1.5"
+
+    # Extraction stages: result field and the method computing it from a
+    # ResumeDocument. Instances may add their own with `register_stage`.
+    STAGES = (
+        ("name", "_extract_name"),
+        ("email", "_extract_email"),
+        ("phone", "_extract_phone"),
+        ("linkedin", "_extract_linkedin"),
+        ("skills", "_extract_skills"),
+        ("experience", "_extract_experience"),
+        ("education", "_extract_education"),
+        ("summary", "_extract_summary"),
+        ("companies", "_extract_companies"),
+        ("locations", "_extract_locations"),
+    )
+
+    # Patterns, compiled once at class load
+    EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+    LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/(?:in|company)/[a-zA-Z0-9_-]+', re.IGNORECASE)
+    NAME_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$')
+    NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+    SECTION_SKILL_RE = re.compile(r'[a-zA-Z0-9+#\.\s]+')
+    EXPERIENCE_RES = (
+        re.compile(r'(\d+)\+?\s*years?\s*(?:of)?\s*experience', re.IGNORECASE),
+        re.compile(r'experience\s*:\s*(\d+)\+?\s*years?', re.IGNORECASE),
+        re.compile(r'(\d+)\+?\s*years?\s*in\s*[a-zA-Z\s]+', re.IGNORECASE),
+    )
+    EXPERIENCE_LINE_RE = re.compile(r'years|yrs|experience')
+    NUMBER_RE = re.compile(r'\b(\d+)\b')
+    EDUCATION_LINE_RE = re.compile(
+        r'university|college|institute|school|bachelor|master|phd|mba|bsc|msc|degree|diploma|certification'
+    )
+    DEGREES = ('B.Sc', 'B.Tech', 'B.E', 'B.A', 'M.Sc', 'M.Tech', 'M.A', 'PhD', 'MBA')
+    YEAR_RE = re.compile(r'(19|20)\d{2}')
+    WHITESPACE_RE = re.compile(r'\s+')
+    COMPANY_RES = (
+        re.compile(r'at\s+([A-Z][a-zA-Z\s&\.]+)(?:\s+|$)'),
+        re.compile(r'company\s*:\s*([A-Z][a-zA-Z\s&\.]+)'),
+        re.compile(r'employer\s*:\s*([A-Z][a-zA-Z\s&\.]+)'),
+        re.compile(r'\b([A-Z][A-Za-z\s&\.]+(?:Inc|LLC|Ltd|Corp|Corporation|Company))\b'),
+    )
+    LOCATION_LINE_RE = re.compile(r'location|address|city|based in')
+    LOCATION_VALUE_RE = re.compile(r':\s*(.+)$')
     
     def __init__(self):
         """Initialize resume parser with NLP models"""
@@ -64,30 +154,18 @@ class ResumeParser:
                 # Keep parser functional without spaCy model.
                 self.nlp = None
         
-        # Common patterns for extraction
-        self.email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        self.phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        self.linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/(?:in|company)/[a-zA-Z0-9_-]+'
-        
-        # Skill keywords database
-        self.skill_keywords = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust'],
-            'web': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'node.js', 'express'],
-            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ci/cd'],
-            'data_science': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'machine learning', 'ai'],
-            'devops': ['jenkins', 'git', 'github', 'gitlab', 'ansible', 'prometheus', 'grafana'],
-            'soft_skills': ['communication', 'leadership', 'teamwork', 'problem solving', 'time management']
-        }
-        
-    class ResumeParser:
-        
-        SKILL_CATEGORIES = {
-        "cloud": [...],
-        "data_science": [...],
-        "devops": [...],
-        "soft_skills": [...]
-    }
+        # Skill taxonomy, compiled once into a single-pass matcher
+        self.skill_taxonomy = load_skill_taxonomy(settings.RESUME_SKILL_TAXONOMY_PATH)
+        self.skill_matcher = SkillMatcher.from_taxonomy(self.skill_taxonomy)
+
+        self.stages: List[Tuple[str, Callable[[ResumeDocument], Any]]] = [
+            (field, getattr(self, method)) for field, method in self.STAGES
+        ]
+
+    def register_stage(self, field: str, stage: Callable[[ResumeDocument], Any]) -> None:
+        """Add (or replace) the stage computing `field` of the parse result"""
+        self.stages = [(name, func) for name, func in self.stages if name != field]
+        self.stages.append((field, stage))
 
     def extract_text_from_file(self, file_path: str) -> str:
         mime_type, _ = mimetypes.guess_type(file_path)
@@ -112,12 +190,12 @@ class ResumeParser:
 
     
     def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF files"""
-        if extract_pdf_text is None:
-            logger.warning("pdfminer is not installed; PDF parsing is unavailable.")
-            return ""
+        """Extract text from PDF files with the configured backend"""
         try:
             text = extract_pdf_text(file_path)
+            if not text:
+                logger.warning(f"No PDF backend could extract text from {file_path}")
+                return ""
             # Clean up text
             text = re.sub(r'\s+', ' ', text)
             text = re.sub(r'[^\x00-\x7F]+', ' ', text)  # Remove non-ASCII
@@ -127,19 +205,9 @@ class ResumeParser:
             return ""
     
     def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX files"""
-        if Document is None:
-            logger.warning("python-docx is not installed; DOCX parsing is unavailable.")
-            return ""
+        """Extract text from DOCX files, streaming word/document.xml"""
         try:
-            doc = Document(file_path)
-            text = '\n'.join([para.text for para in doc.paragraphs])
-            # Also extract from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += '\n' + cell.text
-            return text.strip()
+            return extract_docx_text(file_path).strip()
         except Exception as e:
             logger.error(f"Error extracting DOCX: {e}")
             return ""
@@ -167,234 +235,163 @@ class ResumeParser:
             if not raw_text:
                 return {"error": "Could not extract text from resume"}
             
-            # Extract various information
-            result = {
-                "raw_text": raw_text[:500] + "...",  # Store first 500 chars
-                "name": self._extract_name(raw_text),
-                "email": self._extract_email(raw_text),
-                "phone": self._extract_phone(raw_text),
-                "linkedin": self._extract_linkedin(raw_text),
-                "skills": self._extract_skills(raw_text),
-                "experience": self._extract_experience(raw_text),
-                "education": self._extract_education(raw_text),
-                "summary": self._extract_summary(raw_text),
-                "companies": self._extract_companies(raw_text),
-                "locations": self._extract_locations(raw_text)
-            }
-            
-            return result
+            return self.parse_text(raw_text)
             
         except Exception as e:
             logger.error(f"Error parsing resume: {e}")
             return {"error": str(e)}
+
+    def parse_text(self, raw_text: str) -> Dict[str, Any]:
+        """Run every extraction stage over one shared ResumeDocument"""
+        document = ResumeDocument(raw_text)
+        result: Dict[str, Any] = {"raw_text": raw_text[:500] + "..."}  # Store first 500 chars
+        for field, stage in self.stages:
+            result[field] = stage(document)
+        return result
     
-    def _extract_name(self, text: str) -> str:
+    def _extract_name(self, doc: ResumeDocument) -> str:
         """Extract candidate name from resume"""
         # Look for name patterns at the beginning of the resume
-        lines = text.split('\n')
-        for line in lines[:10]:  # Check first 10 lines
-            line = line.strip()
-            if line and len(line) < 50:  # Name is usually short
-                # Check if line looks like a name (contains letters and maybe spaces)
-                if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$', line):
-                    return line
+        lines = [line.strip() for line in doc.lines[:10]]  # Check first 10 lines
+        for line in lines:
+            # Name is usually short and made of capitalized words
+            if line and len(line) < 50 and self.NAME_RE.match(line):
+                return line
         
         # Fallback: Use the first line that's not empty and not too long
-        for line in lines[:10]:
-            line = line.strip()
+        for line in lines:
             if line and len(line) < 100:
                 return line
         
         return ""
     
-    def _extract_email(self, text: str) -> str:
+    def _extract_email(self, doc: ResumeDocument) -> str:
         """Extract email address"""
-        emails = re.findall(self.email_pattern, text)
-        return emails[0] if emails else ""
+        match = self.EMAIL_RE.search(doc.text)
+        return match.group(0) if match else ""
     
-    def _extract_phone(self, text: str) -> str:
+    def _extract_phone(self, doc: ResumeDocument) -> str:
         """Extract phone number"""
-        phones = re.findall(self.phone_pattern, text)
+        match = self.PHONE_RE.search(doc.text)
         # Clean phone number
-        if phones:
-            phone = re.sub(r'[^\d+]', '', phones[0])
+        if match:
+            phone = self.NON_PHONE_CHARS_RE.sub('', match.group(1) or '')
             return phone[:15]  # Limit length
         return ""
     
-    def _extract_linkedin(self, text: str) -> str:
+    def _extract_linkedin(self, doc: ResumeDocument) -> str:
         """Extract LinkedIn profile"""
-        linkedin = re.findall(self.linkedin_pattern, text, re.IGNORECASE)
-        return linkedin[0] if linkedin else ""
+        match = self.LINKEDIN_RE.search(doc.text)
+        return match.group(0) if match else ""
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, doc: ResumeDocument) -> List[str]:
         """Extract skills from resume text"""
-        skills = []
-        text_lower = text.lower()
+        # Taxonomy skills (whole words and synonyms) in one pass over the text
+        skills = self.skill_matcher.find(doc.text)
+        taxonomy_count = len(skills)
         
-        # Check for each skill category
-        for category, skill_list in self.skill_keywords.items():
-            for skill in skill_list:
-                if skill.lower() in text_lower:
+        # Also look for skills listed in a skills section
+        for header in ("skills", "technical skills", "core competencies"):
+            section_text = doc.sections.get(header)
+            if section_text is None:
+                continue
+            # Extract individual skills from the section
+            for skill in self.SECTION_SKILL_RE.findall(section_text.lower()):
+                skill = skill.strip()
+                if skill and len(skill) < 50:
                     skills.append(skill)
         
-        # Also look for skills mentioned in a skills section
-        skills_section_patterns = [
-            r'skills(?:\s*[:•])(.*?)(?:\n\n|\Z)',
-            r'technical skills(?:\s*[:•])(.*?)(?:\n\n|\Z)',
-            r'core competencies(?:\s*[:•])(.*?)(?:\n\n|\Z)'
-        ]
-        
-        for pattern in skills_section_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            if match:
-                section_text = match.group(1)
-                # Extract individual skills from the section
-                section_skills = re.findall(r'[a-zA-Z0-9+#\.\s]+', section_text)
-                for skill in section_skills:
-                    skill = skill.strip()
-                    if skill and len(skill) < 50:
-                        skills.append(skill)
-        
-        # Remove duplicates and clean up
-        skills = list(set([s.strip().title() for s in skills if s.strip()]))
-        return skills[:20]  # Limit to 20 skills
+        # Remove duplicates (case-insensitively, keeping the first spelling)
+        unique: Dict[str, str] = {}
+        for index, skill in enumerate(skills):
+            skill = skill.strip()
+            if skill:
+                # Taxonomy names keep their canonical spelling
+                unique.setdefault(skill.lower(), skill if index < taxonomy_count else skill.title())
+        return list(unique.values())[:20]  # Limit to 20 skills
     
-    def _extract_experience(self, text: str) -> int:
+    def _extract_experience(self, doc: ResumeDocument) -> int:
         """Extract total years of experience"""
         # Look for patterns like "5 years", "10+ years", etc.
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of)?\s*experience',
-            r'experience\s*:\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*[a-zA-Z\s]+'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    years = int(match)
-                    if 0 <= years <= 50:  # Reasonable range
-                        return years
-                except:
-                    pass
+        for pattern in self.EXPERIENCE_RES:
+            for match in pattern.finditer(doc.text):
+                years = int(match.group(1))
+                if 0 <= years <= 50:  # Reasonable range
+                    return years
         
         # Try to calculate from employment history
-        # This is a simplified calculation
-        experience_keywords = ['years', 'yrs', 'experience']
-        lines = text.lower().split('\n')
-        for line in lines:
-            for keyword in experience_keywords:
-                if keyword in line:
-                    # Look for numbers near the keyword
-                    numbers = re.findall(r'\b(\d+)\b', line)
-                    for num in numbers:
-                        try:
-                            years = int(num)
-                            if 1 <= years <= 50:
-                                return years
-                        except:
-                            pass
+        # This is a simplified calculation: a number on a line mentioning experience
+        for line in doc.lines_lower:
+            if self.EXPERIENCE_LINE_RE.search(line):
+                for number in self.NUMBER_RE.findall(line):
+                    years = int(number)
+                    if 1 <= years <= 50:
+                        return years
         
         return 0
     
-    def _extract_education(self, text: str) -> List[Dict[str, str]]:
+    def _extract_education(self, doc: ResumeDocument) -> List[Dict[str, str]]:
         """Extract education information"""
         education = []
         
-        # Common education keywords
-        education_keywords = [
-            'university', 'college', 'institute', 'school',
-            'bachelor', 'master', 'phd', 'mba', 'bsc', 'msc',
-            'degree', 'diploma', 'certification'
-        ]
-        
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+        for line, line_lower in zip(doc.lines, doc.lines_lower):
             # Check if line contains education keywords
-            if any(keyword in line_lower for keyword in education_keywords):
+            if self.EDUCATION_LINE_RE.search(line_lower):
                 edu_entry = {
                     "institution": line.strip(),
-                    "degree": self._extract_degree(line),
+                    "degree": self._extract_degree(line_lower),
                     "year": self._extract_year(line)
                 }
                 education.append(edu_entry)
+                if len(education) == 5:  # Limit to 5 education entries
+                    break
         
-        return education[:5]  # Limit to 5 education entries
+        return education
     
-    def _extract_degree(self, text: str) -> str:
-        """Extract degree from education line"""
-        degrees = ['B.Sc', 'B.Tech', 'B.E', 'B.A', 'M.Sc', 'M.Tech', 'M.A', 'PhD', 'MBA']
-        for degree in degrees:
-            if degree.lower() in text.lower():
+    def _extract_degree(self, line_lower: str) -> str:
+        """Extract degree from a lower-cased education line"""
+        for degree in self.DEGREES:
+            if degree.lower() in line_lower:
                 return degree
         return ""
     
     def _extract_year(self, text: str) -> str:
         """Extract year from education line"""
-        years = re.findall(r'(19|20)\d{2}', text)
-        return years[0] if years else ""
+        match = self.YEAR_RE.search(text)
+        return match.group(1) if match else ""
     
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, doc: ResumeDocument) -> str:
         """Extract summary/objective from resume"""
-        summary_patterns = [
-            r'summary(?:\s*[:•])(.*?)(?:\n\n|\Z)',
-            r'objective(?:\s*[:•])(.*?)(?:\n\n|\Z)',
-            r'profile(?:\s*[:•])(.*?)(?:\n\n|\Z)'
-        ]
-        
-        for pattern in summary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                summary = match.group(1).strip()
+        for header in ("summary", "objective", "profile"):
+            summary = doc.sections.get(header)
+            if summary is not None:
                 # Clean up summary
-                summary = re.sub(r'\s+', ' ', summary)
+                summary = self.WHITESPACE_RE.sub(' ', summary.strip())
                 return summary[:500]  # Limit length
         
         # Fallback: Use first paragraph
-        paragraphs = text.split('\n\n')
-        if paragraphs:
-            return paragraphs[0][:300]
-        
-        return ""
+        return doc.text.split('\n\n', 1)[0][:300]
     
-    def _extract_companies(self, text: str) -> List[str]:
+    def _extract_companies(self, doc: ResumeDocument) -> List[str]:
         """Extract company names from work experience"""
-        companies = []
-        
-        # Common company indicators
-        experience_patterns = [
-            r'at\s+([A-Z][a-zA-Z\s&\.]+)(?:\s+|$)',
-            r'company\s*:\s*([A-Z][a-zA-Z\s&\.]+)',
-            r'employer\s*:\s*([A-Z][a-zA-Z\s&\.]+)'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text)
-            companies.extend(matches)
-        
-        # Look for company names in all caps or with Inc/LLC/etc
-        company_pattern = r'\b([A-Z][A-Za-z\s&\.]+(?:Inc|LLC|Ltd|Corp|Corporation|Company))\b'
-        matches = re.findall(company_pattern, text)
-        companies.extend(matches)
-        
-        # Clean and deduplicate
-        companies = list(set([c.strip() for c in companies if len(c) > 2]))
-        return companies[:10]
+        # Company indicators ("at X", "Company: X") and names ending in Inc/LLC/etc
+        companies: Dict[str, None] = {}
+        for pattern in self.COMPANY_RES:
+            for company in pattern.findall(doc.text):
+                if len(company) > 2:
+                    companies.setdefault(company.strip(), None)
+        return list(companies)[:10]
     
-    def _extract_locations(self, text: str) -> List[str]:
+    def _extract_locations(self, doc: ResumeDocument) -> List[str]:
         """Extract locations from resume"""
         # This is a simplified location extraction
         # In production, use a proper NER model or geocoding service
-        location_keywords = ['location', 'address', 'city', 'based in']
         locations = []
         
-        lines = text.split('\n')
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in location_keywords):
+        for line, line_lower in zip(doc.lines, doc.lines_lower):
+            if self.LOCATION_LINE_RE.search(line_lower):
                 # Extract potential location
-                location_match = re.search(r':\s*(.+)$', line)
+                location_match = self.LOCATION_VALUE_RE.search(line)
                 if location_match:
                     locations.append(location_match.group(1).strip())
         
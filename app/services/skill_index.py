@@ -0,0 +1,140 @@
+"""
+Candidate skill index.
+
+`Candidate.skills` is a free-form JSON array, which no database can filter
+through an index. `skills` holds each distinct skill once (trimmed,
+whitespace-collapsed, lower-cased) and `candidate_skills` maps candidates to
+them, so a skill filter is an index range scan per requested skill.
+
+A session `after_flush` listener re-indexes every candidate whose skills
+were inserted, changed or deleted, in the same transaction.
+`rebuild_skill_index` re-indexes all or some candidates (e.g. after bulk
+SQL writes).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate, CandidateSkill, Skill
+from app.utils.counters import column_history, track_columns
+
+# Candidates re-indexed per batch by rebuild_skill_index
+REBUILD_BATCH_SIZE = 1000
+
+track_columns({Candidate: ("skills",)})
+
+
+def normalize_skill(name: Any) -> str:
+    """Index form of a skill name ('' for anything unusable)"""
+    if not isinstance(name, str):
+        return ""
+    return " ".join(name.split()).lower()
+
+
+def normalize_skills(names: Any) -> Set[str]:
+    """Distinct index forms of a skills value (a list of names)"""
+    if not isinstance(names, (list, tuple, set)):
+        return set()
+    return {skill for skill in (normalize_skill(name) for name in names) if skill}
+
+
+def _skill_ids(connection, names: Set[str]) -> Dict[str, int]:
+    """Ids of `names`, inserting the missing skills"""
+    if not names:
+        return {}
+    table = Skill.__table__
+    existing = dict(connection.execute(select(table.c.name, table.c.id).where(table.c.name.in_(names))).all())
+    missing = sorted(names - existing.keys())
+    if missing:
+        rows = [{"name": name} for name in missing]
+        dialect = connection.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            # A concurrent transaction may add the same skill first
+            connection.execute(insert(table).on_conflict_do_nothing(index_elements=[table.c.name]), rows)
+        else:
+            connection.execute(table.insert(), rows)
+        existing.update(
+            connection.execute(select(table.c.name, table.c.id).where(table.c.name.in_(missing))).all()
+        )
+    return existing
+
+
+def _insert_index_rows(connection, skills_by_candidate: Dict[int, Set[str]]) -> None:
+    ids = _skill_ids(connection, set().union(*skills_by_candidate.values()))
+    rows = [
+        {"candidate_id": candidate_id, "skill_id": ids[name]}
+        for candidate_id, names in sorted(skills_by_candidate.items())
+        for name in sorted(names)
+    ]
+    if rows:
+        connection.execute(CandidateSkill.__table__.insert(), rows)
+
+
+def _reindex(connection, skills_by_candidate: Dict[int, Set[str]]) -> None:
+    """Replace the index rows of the given candidates"""
+    if not skills_by_candidate:
+        return
+    table = CandidateSkill.__table__
+    connection.execute(table.delete().where(table.c.candidate_id.in_(list(skills_by_candidate))))
+    _insert_index_rows(connection, skills_by_candidate)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_skill_index(session: Session, flush_context) -> None:
+    skills_by_candidate: Dict[int, Set[str]] = {}
+
+    for obj in session.new:
+        if isinstance(obj, Candidate):
+            skills_by_candidate[obj.id] = normalize_skills(obj.skills)
+
+    for obj in session.dirty:
+        if isinstance(obj, Candidate) and column_history(obj, "skills")[2]:
+            skills_by_candidate[obj.id] = normalize_skills(obj.skills)
+
+    for obj in session.deleted:
+        if isinstance(obj, Candidate):
+            skills_by_candidate[obj.id] = set()
+
+    if skills_by_candidate:
+        _reindex(session.connection(), skills_by_candidate)
+
+
+def rebuild_skill_index(db: Session, candidate_ids: Optional[Iterable[int]] = None, commit: bool = True) -> int:
+    """
+    Re-index `candidate_ids` (default: every candidate) from
+    `Candidate.skills`, REBUILD_BATCH_SIZE candidates at a time. Returns the
+    number of candidates indexed.
+    """
+    connection = db.connection()
+    table = CandidateSkill.__table__
+    delete = table.delete()
+    query = select(Candidate.id, Candidate.skills).order_by(Candidate.id).limit(REBUILD_BATCH_SIZE)
+    if candidate_ids is not None:
+        candidate_ids = list(candidate_ids)
+        if not candidate_ids:
+            return 0
+        delete = delete.where(table.c.candidate_id.in_(candidate_ids))
+        query = query.where(Candidate.id.in_(candidate_ids))
+    connection.execute(delete)
+
+    indexed = 0
+    last_id = None
+    while True:
+        batch_query = query if last_id is None else query.where(Candidate.id > last_id)
+        rows = connection.execute(batch_query).all()
+        if not rows:
+            break
+        skills_by_candidate = {candidate_id: normalize_skills(skills) for candidate_id, skills in rows}
+        if any(skills_by_candidate.values()):
+            _insert_index_rows(connection, skills_by_candidate)
+        indexed += len(rows)
+        last_id = rows[-1][0]
+
+    if commit:
+        db.commit()
+    return indexed
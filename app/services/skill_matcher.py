@@ -0,0 +1,229 @@
+"""
+Skill matching for the resume parser.
+
+`SkillMatcher` compiles a skill taxonomy (canonical names and their
+synonyms) into an Aho-Corasick automaton once, then finds every skill in a
+document with a single left-to-right pass over its lower-cased text, no
+matter how many skills the taxonomy holds. A match only counts on word
+boundaries, so "go" does not match "good" and "ai" does not match "email".
+
+The built-in taxonomy can be replaced with a JSON file
+(RESUME_SKILL_TAXONOMY_PATH) of the same shape:
+
+    {"category": {"Canonical Name": ["synonym", ...], ...}, ...}
+
+where a category may also be a plain list of canonical names.
+"""
+import json
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Taxonomy = Dict[str, Union[Dict[str, List[str]], List[str]]]
+
+DEFAULT_SKILL_TAXONOMY: Taxonomy = {
+    "programming": {
+        "Python": [],
+        "Java": [],
+        "JavaScript": ["js", "ecmascript"],
+        "TypeScript": ["ts"],
+        "C++": ["cpp"],
+        "C#": ["csharp", "c sharp"],
+        "Ruby": [],
+        "PHP": [],
+        "Swift": [],
+        "Kotlin": [],
+        "Go": ["golang"],
+        "Rust": [],
+    },
+    "web": {
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "React": ["react.js", "reactjs"],
+        "Angular": ["angularjs", "angular.js"],
+        "Vue": ["vue.js", "vuejs"],
+        "Django": [],
+        "Flask": [],
+        "FastAPI": [],
+        "Node.js": ["nodejs", "node"],
+        "Express": ["express.js", "expressjs"],
+    },
+    "database": {
+        "SQL": [],
+        "MySQL": [],
+        "PostgreSQL": ["postgres", "psql"],
+        "MongoDB": ["mongo"],
+        "Redis": [],
+        "Oracle": [],
+        "SQLite": [],
+    },
+    "cloud": {
+        "AWS": ["amazon web services"],
+        "Azure": ["microsoft azure"],
+        "GCP": ["google cloud", "google cloud platform"],
+        "Docker": [],
+        "Kubernetes": ["k8s"],
+        "Terraform": [],
+        "CI/CD": ["cicd", "ci-cd"],
+    },
+    "data_science": {
+        "Pandas": [],
+        "NumPy": [],
+        "TensorFlow": [],
+        "PyTorch": [],
+        "Scikit-Learn": ["sklearn", "scikit learn"],
+        "Machine Learning": ["ml"],
+        "AI": ["artificial intelligence"],
+    },
+    "devops": {
+        "Jenkins": [],
+        "Git": [],
+        "GitHub": [],
+        "GitLab": [],
+        "Ansible": [],
+        "Prometheus": [],
+        "Grafana": [],
+    },
+    "soft_skills": {
+        "Communication": [],
+        "Leadership": [],
+        "Teamwork": [],
+        "Problem Solving": ["problem-solving"],
+        "Time Management": [],
+    },
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(term: str) -> str:
+    return _WHITESPACE.sub(" ", term.strip().lower())
+
+
+def flatten_taxonomy(taxonomy: Taxonomy) -> Dict[str, List[str]]:
+    """{canonical name: synonyms} across every category of `taxonomy`"""
+    skills: Dict[str, List[str]] = {}
+    for entries in taxonomy.values():
+        if isinstance(entries, dict):
+            for canonical, synonyms in entries.items():
+                skills.setdefault(canonical, []).extend(synonyms or [])
+        else:
+            for canonical in entries:
+                skills.setdefault(canonical, [])
+    return skills
+
+
+def load_skill_taxonomy(path: Optional[str] = None) -> Taxonomy:
+    """The taxonomy in the JSON file at `path`, or the built-in one"""
+    if not path:
+        return DEFAULT_SKILL_TAXONOMY
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load skill taxonomy from {path}: {e}; using the built-in taxonomy")
+        return DEFAULT_SKILL_TAXONOMY
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over the names and synonyms of a skill taxonomy"""
+
+    def __init__(self, skills: Dict[str, Iterable[str]]):
+        # Node 0 is the root; each node has transitions, a failure link and
+        # the ids of the patterns ending there (including via failure links).
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+        self._canonical: List[str] = []
+
+        seen = set()
+        for canonical, synonyms in skills.items():
+            for term in (canonical, *synonyms):
+                term = _normalize(term)
+                if term and term not in seen:
+                    seen.add(term)
+                    self._add(term, canonical)
+        self._build_failure_links()
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: Taxonomy) -> "SkillMatcher":
+        return cls(flatten_taxonomy(taxonomy))
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _add(self, term: str, canonical: str) -> None:
+        node = 0
+        for char in term:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append(len(self._lengths))
+        self._lengths.append(len(term))
+        self._canonical.append(canonical)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def find_all(self, text: str, overlapping: bool = False) -> List[Tuple[int, int, str]]:
+        """
+        (start, end, canonical name) of the whole-word skill mentions in
+        `text`, as offsets into its whitespace-normalized lower-case form.
+
+        Unless `overlapping`, a mention inside a longer one is dropped, so
+        "node.js" is Node.js only, not also JavaScript ("js").
+        """
+        text = _WHITESPACE.sub(" ", text.lower())
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        size = len(text)
+        matches = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not out[node]:
+                continue
+            end = index + 1
+            if end < size and text[end].isalnum():
+                continue
+            for pattern in out[node]:
+                start = end - lengths[pattern]
+                if start == 0 or not text[start - 1].isalnum():
+                    matches.append((start, end, self._canonical[pattern]))
+        if overlapping:
+            return matches
+
+        # Leftmost-longest: keep the longest mention at each start, skip
+        # mentions that begin inside one already kept
+        kept = []
+        covered_until = 0
+        for start, end, canonical in sorted(matches, key=lambda match: (match[0], -match[1])):
+            if start >= covered_until:
+                kept.append((start, end, canonical))
+                covered_until = end
+        return kept
+
+    def find(self, text: str) -> List[str]:
+        """Distinct canonical skills mentioned in `text`, in order of first mention"""
+        found: Dict[str, None] = {}
+        for _, _, canonical in self.find_all(text):
+            found.setdefault(canonical, None)
+        return list(found)
@@ -3,13 +3,20 @@ Pytest configuration and fixtures
 """
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.database import Base, get_db
+from app.api import candidate as candidate_api
+from app.core.config import settings
+from app.database import Base, get_async_db, get_db
 from app.core.security import get_password_hash
+from app.utils.job_board_cache import job_board_cache
+from app.services import parse_cache as parse_cache_module
+from app.services.parse_cache import ParseCache
+from app.services.parse_engine import resume_parse_engine
+from app.services.resume_parser import ResumeParser
 
 # Test database
 # Use in-memory SQLite with StaticPool so tests avoid filesystem/OneDrive lock issues.
@@ -26,6 +33,7 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 @pytest.fixture(scope="function")
 def db():
     """Create a fresh database for each test"""
+    job_board_cache.clear()
     Base.metadata.create_all(bind=engine)
     db = TestingSessionLocal()
     try:
@@ -34,6 +42,50 @@ def db():
         db.close()
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(autouse=True)
+def isolated_uploads(tmp_path, monkeypatch):
+    """Write uploaded documents under tmp_path instead of the repo's uploads/"""
+    monkeypatch.setattr(candidate_api, "UPLOAD_ROOT", str(tmp_path / "uploads"))
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path, monkeypatch):
+    """Give every test its own parse cache instead of uploads/parse_cache"""
+    monkeypatch.setattr(settings, "RESUME_PARSE_CACHE_DIR", str(tmp_path / "parse_cache"))
+    cache = ParseCache(str(tmp_path / "parse_cache"), version=ResumeParser.VERSION)
+    monkeypatch.setattr(parse_cache_module, "parse_cache", cache)
+    monkeypatch.setattr(resume_parse_engine, "cache", cache)
+    yield cache
+
+@pytest.fixture
+def query_counter():
+    """Record SQL statements executed against the test database"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+class _SyncBackedAsyncSession:
+    """Serve `get_async_db` routes from the per-test sync session"""
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+    async def close(self):
+        pass
+
 @pytest.fixture(scope="function")
 def client(db):
     """Create test client with override dependency"""
@@ -43,7 +95,11 @@ def client(db):
         finally:
             pass
     
+    async def override_get_async_db():
+        yield _SyncBackedAsyncSession(db)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
@@ -16,6 +16,71 @@ def test_get_admin_stats(client, admin_token):
     assert "velocityData" in response.json()
     assert isinstance(response.json()["kpis"], list)
 
+def test_admin_velocity_reads_daily_rollup(client, admin_token, db, query_counter):
+    """Test the daily hiring rollup tracks ORM changes and serves the velocity window"""
+    from datetime import datetime, timedelta
+    from app.models.interview import Interview, InterviewRound
+    from app.models.offer import Offer
+    from app.models.user import User, UserRole, UserStatus
+    from app.services.hiring_metrics import get_daily_hiring_metrics, rebuild_daily_hiring_metrics
+
+    now = datetime.utcnow()
+    offers = [
+        Offer(candidate_id=1, job_id=1, offer_code=f"OFF-{index}", ctc_fixed=1, ctc_total=1,
+              date_of_joining=now, status=offer_status, offered_by=1)
+        for index, offer_status in enumerate(["offered", "joined", "offered"])
+    ]
+    interviews = [
+        Interview(candidate_id=1, job_id=1, round=InterviewRound.HR, scheduled_time=scheduled_time, created_by=1)
+        for scheduled_time in [now, now - timedelta(days=2), now - timedelta(days=2)]
+    ]
+    db.add_all(offers + interviews)
+    db.commit()
+
+    offers[0].status = "joined"
+    db.delete(offers[2])
+    interviews[1].scheduled_time = now
+    db.commit()
+
+    response = client.get(
+        "/api/stats/admin-dashboard?days=30",
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    velocity = response.json()["velocityData"]
+    assert len(velocity) == 30
+    assert velocity[-1] == {
+        "date": now.date().isoformat(), "hires": 2, "interviews": 2, "offers": 2, "logins": 1,
+    }
+    assert velocity[-3]["interviews"] == 1
+
+    query_counter.clear()
+    assert get_daily_hiring_metrics(db, 365)[-30:] == velocity
+    assert len(query_counter) == 1
+
+    rebuild_daily_hiring_metrics(db)
+    assert get_daily_hiring_metrics(db, 30) == velocity
+
+    # Logins count distinct users per day and survive a rebuild
+    user = User(email="login@hirepulse.com", password_hash="x", name="Login User",
+                role=UserRole.RECRUITER, status=UserStatus.ACTIVE, last_login=now - timedelta(days=3))
+    db.add(user)
+    db.commit()
+    noon = now.replace(hour=12, minute=0, second=0, microsecond=0)
+    for last_login in (noon, noon + timedelta(seconds=1)):
+        user.last_login = last_login
+        db.commit()
+    rebuild_daily_hiring_metrics(db)
+    velocity = get_daily_hiring_metrics(db, 30)
+    assert velocity[-1]["logins"] == 2
+    assert velocity[-4]["logins"] == 1
+
+    response = client.get(
+        "/api/stats/admin-dashboard?days=366",
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 def test_get_admin_stats_unauthorized(client):
     """Test getting admin stats without authorization"""
     response = client.get("/api/stats/admin-dashboard")
@@ -72,6 +72,33 @@ def test_login_wrong_password(client):
     
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+def test_login_rehashes_outdated_password_cost(client, db):
+    """Test a hash with an outdated bcrypt cost is replaced on login"""
+    from passlib.hash import bcrypt
+    from app.core.config import settings
+    from app.core.security import password_hasher
+    from app.models.user import User
+
+    user = User(
+        email="old_cost@example.com",
+        password_hash=bcrypt.using(rounds=4).hash("Password@123"),
+        name="Old Cost",
+        role="candidate",
+    )
+    db.add(user)
+    db.commit()
+    rehashed = password_hasher.stats()["rehashed"]
+
+    response = client.post("/auth/login", json={
+        "email": "old_cost@example.com",
+        "password": "Password@123"
+    })
+
+    assert response.status_code == status.HTTP_200_OK
+    db.refresh(user)
+    assert user.password_hash.startswith(f"$2b${settings.PASSWORD_BCRYPT_ROUNDS:02d}$")
+    assert password_hasher.stats()["rehashed"] == rehashed + 1
+
 def test_login_nonexistent_user(client):
     """Test login with non-existent user"""
     response = client.post("/auth/login", json={
@@ -92,6 +119,24 @@ def test_get_current_user(client, candidate_token):
     assert "user" in response.json()
     assert response.json()["user"]["email"] == "test_candidate@example.com"
 
+def test_current_user_served_from_principal_cache(client, candidate_token, db, query_counter):
+    """Test repeat requests skip the user lookup until the user changes"""
+    from app.crud.user import crud_user
+    from app.models.user import User
+    from app.schemas.user import UserUpdate
+
+    headers = {"Authorization": f"Bearer {candidate_token}"}
+    assert client.get("/auth/me", headers=headers).status_code == status.HTTP_200_OK
+
+    query_counter.clear()
+    response = client.get("/auth/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert query_counter == []
+
+    user = db.query(User).filter(User.email == "test_candidate@example.com").first()
+    crud_user.update(db, user.id, UserUpdate(name="Renamed Candidate"))
+    assert client.get("/auth/me", headers=headers).json()["name"] == "Renamed Candidate"
+
 def test_get_current_user_no_token(client):
     """Test getting current user without token"""
     response = client.get("/auth/me")
@@ -13,6 +13,160 @@ def test_get_public_job_board(client):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
 
+def test_public_job_board_cursor_pagination(client, db):
+    """Test paging through the public job board with cursors"""
+    from datetime import datetime, timedelta
+    from app.models.job import Job, JobStatus
+
+    base = datetime(2026, 1, 1)
+    for index in range(7):
+        db.add(Job(
+            title=f"Public Job {index}",
+            description="Paged",
+            department="Engineering",
+            status=JobStatus.OPEN,
+            visibility="public",
+            # Two jobs share a timestamp and two rely on created_at
+            posted_at=None if index in (5, 6) else base + timedelta(days=min(index, 3)),
+        ))
+    db.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/jobs/public", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(job["id"] for job in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+
+    response = client.get("/api/jobs/public", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_cors_exposes_pagination_headers(client, db):
+    """Test credentialed cross-origin clients can read X-Next-Cursor and ETag"""
+    response = client.get("/api/jobs/public", headers={"Origin": "http://localhost:3000"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Access-Control-Allow-Credentials"] == "true"
+    exposed = [name.strip() for name in response.headers["Access-Control-Expose-Headers"].split(",")]
+    assert "X-Next-Cursor" in exposed
+    assert "ETag" in exposed
+
+def test_public_job_board_conditional_get(client, db, query_counter):
+    """Test the job board is cached, revalidated with ETags and invalidated on change"""
+    from app.crud.job import crud_job
+    from app.models.job import Job, JobStatus
+    from app.schemas.job import JobUpdate
+
+    job = Job(title="Cached Job", description="Open", department="Engineering",
+              status=JobStatus.OPEN, visibility="public")
+    draft = Job(title="Draft Job", description="Draft", department="Engineering",
+                status=JobStatus.DRAFT, visibility="internal")
+    db.add_all([job, draft])
+    db.commit()
+
+    response = client.get("/api/jobs/public")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    query_counter.clear()
+    cached = client.get("/api/jobs/public")
+    assert cached.content == response.content
+    assert query_counter == []
+
+    not_modified = client.get("/api/jobs/public", headers={"If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    crud_job.update_job(db, job.id, JobUpdate(title="Renamed Job"))
+    response = client.get("/api/jobs/public", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["title"] for item in response.json()] == ["Renamed Job"]
+    assert response.headers["ETag"] != etag
+
+    crud_job.publish_draft_jobs(db)
+    titles = {item["title"] for item in client.get("/api/jobs/public").json()}
+    assert titles == {"Renamed Job", "Draft Job"}
+
+def test_search_public_job_board(client, db):
+    """Test job search matches every word, ranks title hits first and pages"""
+    from app.models.job import Job, JobStatus
+
+    db.add_all([
+        Job(title="Backend Engineer", description="Build APIs in Python",
+            department="Engineering", status=JobStatus.OPEN, visibility="public"),
+        Job(title="Python Developer", description="Services and APIs",
+            department="Engineering", status=JobStatus.OPEN, visibility="public"),
+        Job(title="Data Analyst", description="Reporting", requirements="SQL",
+            department="Analytics", status=JobStatus.OPEN, visibility="public",
+            skills_required=["Python", "Tableau"]),
+        Job(title="Python Intern", description="Internal only",
+            department="Engineering", status=JobStatus.OPEN, visibility="internal"),
+        Job(title="Java Developer", description="Spring",
+            department="Engineering", status=JobStatus.OPEN, visibility="public"),
+    ])
+    db.commit()
+
+    response = client.get("/api/jobs/public/search", params={"q": "python"})
+    assert response.status_code == status.HTTP_200_OK
+    titles = [job["title"] for job in response.json()]
+    assert titles[0] == "Python Developer"
+    assert set(titles) == {"Python Developer", "Backend Engineer", "Data Analyst"}
+
+    response = client.get("/api/jobs/public/search", params={"q": "python apis"})
+    assert {job["title"] for job in response.json()} == {"Python Developer", "Backend Engineer"}
+
+    first = client.get("/api/jobs/public/search", params={"q": "python", "limit": 2})
+    second = client.get(
+        "/api/jobs/public/search",
+        params={"q": "python", "limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert [job["title"] for job in first.json() + second.json()] == titles
+
+    response = client.get("/api/jobs/public/search", params={"q": "100%_"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+def test_public_job_board_on_async_driver(tmp_path, monkeypatch):
+    """Test the job board end to end on a real async session (aiosqlite)"""
+    pytest.importorskip("aiosqlite")
+    import asyncio
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app import database
+    from app.database import Base, dispose_async_engine, get_async_db
+    from app.main import app
+    from app.models.job import Job, JobStatus
+
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=sync_engine)
+    with sessionmaker(bind=sync_engine)() as session:
+        session.add(Job(title="Async Job", description="Open", department="Engineering",
+                        status=JobStatus.OPEN, visibility="public"))
+        session.commit()
+
+    monkeypatch.setattr(database.settings, "ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    asyncio.run(dispose_async_engine())
+    app.dependency_overrides.pop(get_async_db, None)
+    try:
+        response = TestClient(app).get("/api/jobs/public")
+        assert response.status_code == status.HTTP_200_OK
+        assert [job["title"] for job in response.json()] == ["Async Job"]
+    finally:
+        asyncio.run(dispose_async_engine())
+        sync_engine.dispose()
+
 def test_apply_for_job(client, candidate_token, db):
     """Test applying for a job"""
     from app.models.job import Job, JobStatus
@@ -49,6 +203,62 @@ def test_apply_for_job(client, candidate_token, db):
     assert "applicationId" in response.json()
     assert "status" in response.json()
 
+def test_application_email_goes_through_outbox(client, candidate_token, db, monkeypatch):
+    """Test applying only queues the email and the outbox retries delivery"""
+    import smtplib
+    from app.core.config import settings
+    from app.models.job import Job, JobStatus
+    from app.models.notification import NotificationLog
+    from app.services.notifications import NotificationService
+
+    class FlakySender:
+        def __init__(self):
+            self.sent = []
+            self.failures = 1
+
+        def send(self, *, to_email, subject, body):
+            if self.failures:
+                self.failures -= 1
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            self.sent.append(to_email)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(settings, "EMAIL_ENABLED", True)
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+
+    job = Job(title="Outbox Job", description="Open", department="Engineering",
+              status=JobStatus.OPEN, visibility="public")
+    db.add(job)
+    db.commit()
+
+    response = client.post(f"/api/jobs/{job.id}/apply", headers={"Authorization": f"Bearer {candidate_token}"})
+    assert response.status_code == status.HTTP_200_OK
+
+    log = db.query(NotificationLog).filter(NotificationLog.event == "application_submitted").one()
+    assert log.status == "queued"
+    assert log.attempts == 0
+
+    sender = FlakySender()
+    service = NotificationService(db)
+    assert service.deliver_pending(sender=sender) == 1
+    db.refresh(log)
+    assert log.status == "queued"
+    assert log.attempts == 1
+    assert log.error_message
+
+    # Backoff not elapsed yet
+    assert service.deliver_pending(sender=sender) == 0
+
+    log.next_attempt_at = None
+    db.commit()
+    assert service.deliver_pending(sender=sender) == 1
+    db.refresh(log)
+    assert log.status == "sent"
+    assert log.attempts == 2
+    assert sender.sent == ["test_candidate@example.com"]
+
 def test_get_my_profile(client, candidate_token):
     """Test getting candidate profile"""
     response = client.get(
@@ -120,7 +330,7 @@ def test_delete_document(client, candidate_token):
     assert delete_response.status_code == status.HTTP_200_OK
     assert delete_response.json()["id"] == document_id
 
-def test_upload_and_parse_resume(client, candidate_token):
+def test_upload_and_parse_resume(client, candidate_token, db):
     """Test uploading and parsing a resume"""
     # Create a simple resume text file
     resume_content = b"""John Doe
@@ -150,8 +360,202 @@ University of Technology, 2018"""
     )
     
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["parsed"] == True
-    assert "parse_result" in response.json()
+    assert response.json()["parsed"] == False
+    job_id = response.json()["parseJobId"]
+
+    # Drain the queue the way the background worker would
+    from app.services.parse_jobs import ParseJobService
+    assert ParseJobService(db).run_pending() == 1
+
+    job_response = client.get(
+        f"/api/candidate/resume/parse-jobs/{job_id}",
+        headers={"Authorization": f"Bearer {candidate_token}"}
+    )
+    assert job_response.status_code == status.HTTP_200_OK
+    assert job_response.json()["status"] == "completed"
+    assert job_response.json()["result"]["skills_extracted"] > 0
+
+    from app.models.candidate import CandidateDocument
+    document = db.query(CandidateDocument).filter(CandidateDocument.id == response.json()["id"]).first()
+    assert document.verified == True
+
+    parsed_response = client.get(
+        "/api/candidate/resume/parsed-data",
+        headers={"Authorization": f"Bearer {candidate_token}"}
+    )
+    assert parsed_response.status_code == status.HTTP_200_OK
+    assert parsed_response.json()["parsed_data"]["email"] == "john.doe@example.com"
+
+def test_latest_parsed_resumes_batch(db, query_counter):
+    """Test latest parsed resume per candidate is loaded in one query"""
+    from app.models.user import User, UserRole
+    from app.models.candidate import Candidate, CandidateDocument
+    from app.crud.candidate import crud_candidate
+
+    candidate_ids = []
+    for index in range(3):
+        user = User(email=f"batch{index}@example.com", password_hash="x", name=f"Batch {index}", role=UserRole.CANDIDATE)
+        db.add(user)
+        db.flush()
+        candidate = Candidate(user_id=user.id)
+        db.add(candidate)
+        db.flush()
+        candidate_ids.append(candidate.id)
+        for version in range(2):
+            document = CandidateDocument(
+                candidate_id=candidate.id,
+                document_type="resume",
+                document_url=f"/uploads/{index}_{version}.pdf",
+                file_name=f"{index}_{version}.pdf",
+            )
+            db.add(document)
+            db.flush()
+            crud_candidate.save_parsed_resume(db, candidate.id, document.id, {"version": version})
+
+    query_counter.clear()
+    latest = crud_candidate.get_latest_parsed_resumes(db, candidate_ids)
+    assert len(query_counter) == 1
+    assert {candidate_id: row.data["version"] for candidate_id, row in latest.items()} == {
+        candidate_id: 1 for candidate_id in candidate_ids
+    }
+
+def test_reparse_merges_skills_ignoring_case(db, candidate_token):
+    """Test a re-parse replaces an older skill spelling instead of adding a duplicate"""
+    from app.models.candidate import Candidate
+    from app.services.candidate import candidate_service
+
+    candidate = db.query(Candidate).first()
+    candidate.skills = ["Aws", "Node.Js", "Python"]
+    db.commit()
+
+    result = candidate_service(db).parse_and_update_profile(
+        candidate.id, "resume.pdf", parsed_data={"skills": ["AWS", "Node.js", "Docker"]}
+    )
+    assert result["success"]
+    db.refresh(candidate)
+    assert sorted(candidate.skills) == ["AWS", "Docker", "Node.js", "Python"]
+
+def test_parse_job_retries_then_fails(db, candidate_token):
+    """Test failed parse jobs are re-queued until attempts run out"""
+    from app.models.candidate import Candidate, CandidateDocument
+    from app.crud.parse_job import crud_parse_job
+    from app.services.parse_jobs import ParseJobService
+
+    candidate = db.query(Candidate).first()
+    document = CandidateDocument(
+        candidate_id=candidate.id,
+        document_type="resume",
+        document_url="/uploads/missing.pdf",
+        file_name="missing.pdf",
+    )
+    db.add(document)
+    db.commit()
+
+    job = crud_parse_job.enqueue(db, candidate.id, document.id, "uploads/does-not-exist.pdf", max_attempts=2)
+    service = ParseJobService(db)
+
+    service.run_job(crud_parse_job.claim_next(db))
+    db.refresh(job)
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert job.last_error
+
+    # Retry delay not elapsed yet
+    assert crud_parse_job.claim_next(db) is None
+
+    job.available_at = None
+    db.commit()
+    service.run_job(crud_parse_job.claim_next(db))
+    db.refresh(job)
+    assert job.status == "failed"
+    assert job.attempts == 2
+
+def test_parse_job_expired_lease_without_attempts_fails(db, candidate_token):
+    """Test a job whose lease expired on its last attempt is failed, not re-run"""
+    from datetime import datetime, timedelta
+    from app.models.candidate import Candidate, CandidateDocument
+    from app.crud.parse_job import crud_parse_job
+
+    candidate = db.query(Candidate).first()
+    document = CandidateDocument(
+        candidate_id=candidate.id,
+        document_type="resume",
+        document_url="/uploads/stuck.pdf",
+        file_name="stuck.pdf",
+    )
+    db.add(document)
+    db.commit()
+
+    job = crud_parse_job.enqueue(db, candidate.id, document.id, "uploads/stuck.pdf", max_attempts=2)
+    job.status = "running"
+    job.attempts = 2
+    job.started_at = datetime.utcnow() - timedelta(hours=1)
+    db.commit()
+
+    assert crud_parse_job.claim_next(db, lease_seconds=60) is None
+    db.refresh(job)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert job.last_error
+    assert job.finished_at is not None
+
+    # One attempt left: the expired lease is reclaimed
+    job.status = "running"
+    job.attempts = 1
+    job.finished_at = None
+    db.commit()
+    claimed = crud_parse_job.claim_next(db, lease_seconds=60)
+    assert claimed.id == job.id
+    assert claimed.attempts == 2
+
+def test_parse_engine_parse_many(tmp_path):
+    """Test the process-pool engine parses files in order and isolates failures"""
+    from app.services.parse_engine import ResumeParseEngine
+
+    first = tmp_path / "first.txt"
+    first.write_text("Jane Smith\nEmail: jane@example.com\nSkills: Python, Docker")
+    second = tmp_path / "second.txt"
+    second.write_text("Raj Kumar\nEmail: raj@example.com\n7 years of experience")
+
+    engine = ResumeParseEngine(processes=2, timeout=60)
+    try:
+        results = engine.parse_many([str(first), str(tmp_path / "missing.pdf"), str(second)])
+    finally:
+        engine.shutdown()
+
+    assert results[0]["email"] == "jane@example.com"
+    assert "error" in results[1]
+    assert results[2]["experience"] == 7
+
+def test_parse_cache_skips_reparsing_identical_files(tmp_path, monkeypatch):
+    """Test identical resume bytes are parsed once and served from cache"""
+    from app.services.parse_cache import ParseCache
+    from app.services.parse_engine import ResumeParseEngine
+    from app.services.resume_parser import resume_parser
+
+    calls = []
+    original = resume_parser.parse_resume
+    monkeypatch.setattr(resume_parser, "parse_resume", lambda path: calls.append(path) or original(path))
+
+    content = "Jane Smith\nEmail: jane@example.com\nSkills: Python"
+    first = tmp_path / "first.txt"
+    first.write_text(content)
+    renamed = tmp_path / "renamed.txt"
+    renamed.write_text(content)
+
+    cache = ParseCache(str(tmp_path / "cache"), version="test", max_memory_entries=1)
+    engine = ResumeParseEngine(processes=0, cache=cache)
+    assert engine.parse(str(first))["email"] == "jane@example.com"
+    assert engine.parse(str(renamed))["email"] == "jane@example.com"
+    assert len(calls) == 1
+
+    # Disk layer survives a cold memory cache; a new parser version misses
+    cache.clear_memory()
+    assert engine.parse(str(first))["email"] == "jane@example.com"
+    assert len(calls) == 1
+    engine.cache = ParseCache(str(tmp_path / "cache"), version="test-2")
+    engine.parse(str(first))
+    assert len(calls) == 2
 
 def test_get_application_status(client, candidate_token):
     """Test getting application status"""
@@ -129,6 +129,205 @@ def test_get_my_interviews(client, admin_token, db):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
 
+def test_panel_lookup_matches_exact_user(db):
+    """Test panel lookups use interview_panelists and do not match user 11 for user 1"""
+    from app.crud.interview import crud_interview
+    from app.models.candidate import Candidate
+    from app.models.interview import Interview, InterviewPanelist, InterviewRound
+    from app.models.user import User, UserRole
+    from app.schemas.interview import InterviewCreate, InterviewUpdate
+    from fastapi import HTTPException
+
+    users = [
+        User(email=f"panel{index}@example.com", password_hash="x", name=f"Panel {index}", role=UserRole.MANAGER)
+        for index in range(12)
+    ]
+    db.add_all(users)
+    db.commit()
+    first, eleventh = users[0], users[11]
+    assert str(first.id) in str(eleventh.id)
+
+    candidate = Candidate(user_id=users[5].id)
+    db.add(candidate)
+    db.commit()
+
+    shared = Interview(candidate_id=candidate.id, round=InterviewRound.HR, scheduled_time="2026-01-20T10:00:00Z",
+                       panel_members=[first.id, eleventh.id], created_by=first.id)
+    other = Interview(candidate_id=candidate.id, round=InterviewRound.HR, scheduled_time="2026-01-21T10:00:00Z",
+                      panel_members=[eleventh.id], created_by=first.id)
+    db.add_all([shared, other])
+    db.commit()
+
+    assert [i.id for i in crud_interview.get_interviews_by_panel_member(db, first.id)] == [shared.id]
+    assert sorted(i.id for i in crud_interview.get_interviews_by_panel_member(db, eleventh.id)) == sorted([shared.id, other.id])
+
+    # Reassigning the panel rewrites the association rows
+    shared.panel_members = [eleventh.id]
+    db.commit()
+    assert crud_interview.get_interviews_by_panel_member(db, first.id) == []
+    assert db.query(InterviewPanelist).filter(InterviewPanelist.interview_id == shared.id).count() == 1
+
+    # Unknown panel user ids are a 400, not a foreign key failure at flush
+    with pytest.raises(HTTPException) as error:
+        crud_interview.create_interview(db, InterviewCreate(
+            candidate_id=candidate.id, round=InterviewRound.HR, scheduled_time="2026-01-22T10:00:00Z",
+            panel_members=[first.id, 9999], created_by=first.id,
+        ))
+    assert error.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert "9999" in error.value.detail
+    with pytest.raises(HTTPException):
+        crud_interview.update_interview(db, shared.id, InterviewUpdate(panel_members=[9999]))
+    updated = crud_interview.update_interview(db, shared.id, InterviewUpdate(panel_members=[first.id]))
+    assert [panelist.user_id for panelist in updated.panelists] == [first.id]
+
+def test_manager_pipeline_query_count_is_constant(db, query_counter):
+    """Test the manager pipeline counts every job's stages in one grouped query"""
+    from app.models.candidate import CandidateApplication
+    from app.models.job import Job
+    from app.services.manager import ManagerService
+
+    def add_jobs(count, offset):
+        for index in range(offset, offset + count):
+            job = Job(title=f"Role {index}", description="x", department="Engineering", manager_id=1)
+            db.add(job)
+            db.flush()
+            for app_status in ["applied", "shortlisted", "interview", "offered", "joined"]:
+                db.add(CandidateApplication(candidate_id=index, job_id=job.id, status=app_status))
+        db.commit()
+
+    add_jobs(2, 0)
+    query_counter.clear()
+    assert len(ManagerService(db).get_manager_pipeline(1)) == 2
+    few_jobs_queries = len(query_counter)
+
+    add_jobs(38, 2)
+    query_counter.clear()
+    pipeline = ManagerService(db).get_manager_pipeline(1)
+    assert len(pipeline) == 40
+    assert len(query_counter) == few_jobs_queries
+
+    assert {key: pipeline[0][key] for key in ["profilesReceived", "shortlisted", "interviewed", "offered", "hired"]} == {
+        "profilesReceived": 5, "shortlisted": 1, "interviewed": 3, "offered": 2, "hired": 1,
+    }
+
+def test_manager_job_visibility_follows_jobs_and_mprs(db):
+    """Test the visibility mapping tracks job and MPR changes and matches a full rebuild"""
+    from app.models.job import Job, ManagerJobVisibility
+    from app.models.mpr import MPR
+    from app.services.manager import ManagerService
+    from app.services.manager_visibility import rebuild_manager_job_visibility
+
+    def visible(manager_id):
+        return sorted(job.title for job in ManagerService(db)._resolve_manager_jobs(manager_id))
+
+    owned = Job(title="Owned", description="x", department="Sales", manager_id=1)
+    by_title = Job(title="data engineer", description="x", department="Finance")
+    by_department = Job(title="Designer", description="x", department="engineering")
+    other_manager = Job(title="Data Engineer", description="x", department="Platform", manager_id=2)
+    db.add_all([owned, by_title, by_department, other_manager])
+    db.commit()
+    assert visible(1) == ["Owned"]
+
+    mpr = MPR(requisition_code="MPR-VIS", job_title="Data Engineer", job_description="x", department="Engineering",
+              hiring_manager_id=1, job_type="permanent", budget_min=1, budget_max=2)
+    db.add(mpr)
+    db.commit()
+    assert visible(1) == ["Designer", "Owned", "data engineer"]
+
+    by_department.department = "Marketing"
+    by_title.manager_id = 2
+    db.commit()
+    assert visible(1) == ["Owned"]
+    assert visible(2) == ["Data Engineer", "data engineer"]
+
+    mpr.hiring_manager_id = 3
+    mpr.department = "Marketing"
+    db.commit()
+    assert visible(3) == ["Designer"]
+
+    db.delete(by_department)
+    db.commit()
+    assert visible(3) == []
+
+    maintained = sorted(db.query(ManagerJobVisibility.manager_id, ManagerJobVisibility.job_id).all())
+    rebuild_manager_job_visibility(db)
+    assert sorted(db.query(ManagerJobVisibility.manager_id, ManagerJobVisibility.job_id).all()) == maintained
+
+def test_flush_listeners_register_with_the_models():
+    """Test scripts that only import models (e.g. the seed script) still maintain the rollups"""
+    import subprocess
+    import sys
+
+    script = "\n".join([
+        "from sqlalchemy import create_engine",
+        "from sqlalchemy.orm import sessionmaker",
+        "from app.database import Base",
+        "from app.models.job import Job, ManagerJobVisibility",
+        "from app.models.mpr import MPR",
+        "from app.models.user import User, UserRole",
+        "engine = create_engine('sqlite://')",
+        "Base.metadata.create_all(engine)",
+        "db = sessionmaker(bind=engine)()",
+        "manager = User(email='m@example.com', password_hash='x', name='M', role=UserRole.MANAGER)",
+        "db.add(manager)",
+        "db.flush()",
+        "db.add(MPR(requisition_code='MPR-1', job_title='Engineer', job_description='x', department='Eng',"
+        " hiring_manager_id=manager.id, job_type='permanent', budget_min=1, budget_max=2))",
+        "db.add(Job(title='Engineer', description='x', department='Eng'))",
+        "db.commit()",
+        "print(db.query(ManagerJobVisibility).count())",
+    ])
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "1"
+
+def test_pipeline_candidates_page_in_one_statement(db, query_counter):
+    """Test the stage drill-down pages with one statement and picks each candidate's latest resume"""
+    from datetime import datetime, timedelta
+    from app.models.candidate import Candidate, CandidateApplication, CandidateDocument
+    from app.models.job import Job
+    from app.models.user import User, UserRole
+    from app.services.manager import ManagerService
+
+    job = Job(title="Backend Engineer", description="x", department="Engineering", manager_id=1)
+    db.add(job)
+    db.flush()
+    now = datetime.utcnow()
+    for index in range(5):
+        user = User(email=f"drill{index}@example.com", password_hash="x", name=f"Drill {index}", role=UserRole.CANDIDATE)
+        db.add(user)
+        db.flush()
+        candidate = Candidate(user_id=user.id)
+        db.add(candidate)
+        db.flush()
+        db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="rejected",
+                                    applied_at=now - timedelta(days=index)))
+        db.add(CandidateDocument(candidate_id=candidate.id, document_type="resume", file_name="old.pdf",
+                                 document_url=f"/uploads/{index}_old.pdf", uploaded_at=now - timedelta(days=2)))
+        db.add(CandidateDocument(candidate_id=candidate.id, document_type="Resume", file_name="new.pdf",
+                                 document_url=f"/uploads/{index}_new.pdf", uploaded_at=now))
+    db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="applied"))
+    db.commit()
+
+    service = ManagerService(db)
+    names, cursor, pages = [], None, 0
+    while True:
+        query_counter.clear()
+        rows, cursor = service.get_pipeline_candidates(1, " backend engineer ", "Rejected", cursor=cursor, limit=2)
+        assert len(query_counter) == 1
+        pages += 1
+        names.extend(row["name"] for row in rows)
+        assert all(row["resumeUrl"].endswith("_new.pdf") for row in rows)
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert names == [f"Drill {index}" for index in range(5)]
+
+    # Without a limit every row comes back in one response, as before paging
+    rows, cursor = service.get_pipeline_candidates(1, "Backend Engineer", "Rejected")
+    assert [row["name"] for row in rows] == names
+    assert cursor is None
+
 def test_submit_interview_feedback(client, admin_token):
     """Test submitting interview feedback"""
     response = client.post(
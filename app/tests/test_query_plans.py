@@ -0,0 +1,137 @@
+"""
+Query plan tests: the hot pipeline queries must be served by an index
+"""
+import pytest
+from datetime import datetime
+from sqlalchemy import String, cast, event, func, text
+
+from app.models.candidate import CandidateApplication, CandidateDocument, CandidateSkill
+from app.models.interview import Interview, InterviewPanelist
+from app.models.job import Job, ManagerJobVisibility
+from app.models.offer import Offer
+
+
+def query_plan(db, query):
+    """EXPLAIN QUERY PLAN detail lines for an ORM query (SQLite)"""
+    compiled = query.statement.compile(bind=db.get_bind(), compile_kwargs={"literal_binds": True})
+    return [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+
+
+def assert_uses_index(db, query, index_name):
+    plan = query_plan(db, query)
+    assert any(index_name in line for line in plan), f"expected {index_name} in plan: {plan}"
+
+
+@pytest.mark.parametrize(
+    "build, index_name",
+    [
+        (
+            lambda db: db.query(Job)
+            .filter(func.lower(Job.visibility) == "public", func.lower(Job.status) == "open")
+            .order_by(func.coalesce(Job.posted_at, Job.created_at).desc()),
+            "ix_jobs_public_board",
+        ),
+        (
+            lambda db: db.query(Job).filter(func.lower(Job.title) == "backend engineer"),
+            "ix_jobs_lower_title",
+        ),
+        (
+            lambda db: db.query(CandidateApplication)
+            .filter(CandidateApplication.candidate_id == 1)
+            .order_by(CandidateApplication.applied_at.desc()),
+            "ix_candidate_applications_candidate_id_applied_at",
+        ),
+        (
+            lambda db: db.query(CandidateApplication).filter(
+                CandidateApplication.job_id == 1,
+                cast(CandidateApplication.status, String) == "joined",
+            ),
+            "ix_candidate_applications_job_id_status",
+        ),
+        (
+            lambda db: db.query(CandidateApplication).filter(
+                func.lower(CandidateApplication.status).in_(["interview", "offered"])
+            ),
+            "ix_candidate_applications_lower_status",
+        ),
+        (
+            lambda db: db.query(CandidateDocument).filter(
+                CandidateDocument.candidate_id.in_([1, 2, 3]),
+                func.lower(CandidateDocument.document_type) == "resume",
+            ),
+            "ix_candidate_documents_candidate_id_lower_document_type",
+        ),
+        (
+            lambda db: db.query(Interview).filter(
+                Interview.candidate_id == 1,
+                Interview.job_id == 1,
+                Interview.status.in_(["scheduled", "completed"]),
+            ),
+            "ix_interviews_candidate_id_job_id_status",
+        ),
+        (
+            lambda db: db.query(Interview)
+            .join(InterviewPanelist, InterviewPanelist.interview_id == Interview.id)
+            .filter(InterviewPanelist.user_id == 1),
+            "ix_interview_panelists_user_id_interview_id",
+        ),
+        (
+            lambda db: db.query(Job)
+            .join(ManagerJobVisibility, ManagerJobVisibility.job_id == Job.id)
+            .filter(ManagerJobVisibility.manager_id == 1),
+            "sqlite_autoindex_manager_job_visibility_1",
+        ),
+        (
+            lambda db: db.query(CandidateSkill.candidate_id).filter(CandidateSkill.skill_id.in_([1, 2])),
+            "ix_candidate_skills_skill_id_candidate_id",
+        ),
+        (
+            lambda db: db.query(Interview).filter(Interview.scheduled_time >= datetime(2026, 1, 1)),
+            "ix_interviews_scheduled_time",
+        ),
+        (
+            lambda db: db.query(Offer).filter(Offer.candidate_id == 1, Offer.job_id == 1),
+            "ix_offers_candidate_id_job_id",
+        ),
+        (
+            lambda db: db.query(Offer).filter(Offer.status == "offered"),
+            "ix_offers_status",
+        ),
+    ],
+)
+def test_hot_query_uses_index(db, build, index_name):
+    """Test each hot pipeline filter is answered from its index"""
+    assert_uses_index(db, build(db), index_name)
+
+
+def executed_statements(db, run):
+    """(SQL, parameters) of every statement `run()` executes on the test database"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        run()
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+    return statements
+
+
+@pytest.mark.parametrize("page", ["first", "next"])
+def test_public_job_board_sorts_from_index(db, page):
+    """Test the job board page query is read from its index without a sort step"""
+    from app.crud.job import crud_job
+    from app.utils.pagination import encode_cursor
+
+    cursor = encode_cursor(datetime(2026, 1, 1), 10) if page == "next" else None
+    statements = executed_statements(db, lambda: crud_job.get_public_jobs(db, cursor=cursor))
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    assert "coalesce" in statement.lower()
+
+    plan = [row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    assert any("ix_jobs_public_board" in line for line in plan), plan
+    assert not any("USE TEMP B-TREE FOR ORDER BY" in line for line in plan), plan
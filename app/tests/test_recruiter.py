@@ -135,6 +135,220 @@ def test_get_all_candidates(client, recruiter_token):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
 
+def _seed_candidates(db, count, offset=0):
+    from app.models.candidate import Candidate, CandidateApplication, CandidateDocument
+    from app.models.job import Job
+    from app.models.user import User, UserRole
+
+    job = Job(title=f"Backend Engineer {offset}", description="APIs", department="Engineering")
+    db.add(job)
+    db.flush()
+    for index in range(offset, offset + count):
+        user = User(email=f"listed{index}@example.com", password_hash="x", name=f"Listed {index}", role=UserRole.CANDIDATE)
+        db.add(user)
+        db.flush()
+        candidate = Candidate(user_id=user.id, skills=["Python"], experience_years=index)
+        db.add(candidate)
+        db.flush()
+        db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="applied"))
+        db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="screening", ai_score=80))
+        db.add(CandidateDocument(candidate_id=candidate.id, document_type="resume", document_url=f"/uploads/{index}.pdf", file_name="cv.pdf"))
+        db.add(CandidateDocument(candidate_id=candidate.id, document_type="aadhaar_front", document_url=f"/uploads/{index}_a.pdf", file_name="a.pdf", verified=True))
+        db.add(CandidateDocument(candidate_id=candidate.id, document_type="PAN", document_url=f"/uploads/{index}_p.pdf", file_name="p.pdf"))
+    db.commit()
+
+def test_candidate_list_query_count_is_constant(db, query_counter):
+    """Test the candidate list does not issue per-candidate queries"""
+    from app.services.recruiter import RecruiterService
+
+    _seed_candidates(db, 3)
+    query_counter.clear()
+    rows, _ = RecruiterService(db).get_candidate_list()
+    small_page_queries = len(query_counter)
+
+    assert len(rows) == 3
+    assert rows[0]["status"] == "screening"
+    assert rows[0]["matchScore"] == 80
+    assert rows[0]["currentRole"] == "Backend Engineer 0"
+    assert rows[0]["resumeUrl"] == "/uploads/0.pdf"
+    assert rows[0]["aadhaarStatus"] == "VERIFIED"
+    assert rows[0]["panStatus"] == "PENDING"
+
+    _seed_candidates(db, 20, offset=3)
+    db.expire_all()
+    query_counter.clear()
+    rows, _ = RecruiterService(db).get_candidate_list()
+    assert len(rows) == 23
+    assert len(query_counter) == small_page_queries
+
+def test_search_candidates_by_skill(client, recruiter_token, db):
+    """Test skill search through the maintained candidate_skills index"""
+    from app.crud.candidate import crud_candidate
+    from app.models.candidate import Candidate
+    from app.models.user import User, UserRole
+
+    profiles = {
+        "Ana": (["Python", "AWS"], 5),
+        "Ben": (["python", " Docker "], 2),
+        "Cy": (["AWS"], 8),
+    }
+    ids = {}
+    for name, (skills, years) in profiles.items():
+        user = User(email=f"{name.lower()}@example.com", password_hash="x", name=name, role=UserRole.CANDIDATE)
+        db.add(user)
+        db.flush()
+        candidate = Candidate(user_id=user.id, skills=skills, experience_years=years)
+        db.add(candidate)
+        db.flush()
+        ids[name] = candidate.id
+    db.commit()
+
+    headers = {"Authorization": f"Bearer {recruiter_token}"}
+
+    def search(**params):
+        response = client.get("/api/candidates/search", params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    result = search(skills="python,aws")
+    assert [row["name"] for row in result["candidates"]] == ["Ana"]
+    assert result["total"] == 1
+    assert result["skillCounts"] == {"aws": 1, "python": 1}
+
+    result = search(skills="PYTHON, aws", match="any", min_exp=3)
+    assert {row["name"] for row in result["candidates"]} == {"Ana", "Cy"}
+    assert result["total"] == 2
+    assert result["skillCounts"] == {"aws": 2, "python": 1}
+
+    crud_candidate.update_profile(db, ids["Cy"], {"skills": ["AWS", "Python"]})
+    assert search(skills="python,aws")["total"] == 2
+    assert search(skills="docker")["candidates"][0]["name"] == "Ben"
+    assert search(skills="rust")["total"] == 0
+
+def test_recruiter_stats_single_statement(db, query_counter):
+    """Test the recruiter dashboard counts come from one aggregate statement"""
+    from datetime import datetime, timedelta
+    from app.models.candidate import Candidate, CandidateApplication
+    from app.models.interview import Interview, InterviewRound
+    from app.models.job import Job
+    from app.models.mpr import MPR
+    from app.models.offer import Offer
+    from app.services.recruiter import RecruiterService
+
+    _seed_candidates(db, 3)
+    candidate = db.query(Candidate).first()
+    job = db.query(Job).first()
+    db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="Interview"))
+    db.add(CandidateApplication(candidate_id=candidate.id, job_id=job.id, status="joined"))
+    for index, offer_status in enumerate(["offered", "accepted", "joined", "declined", "draft", "expired"]):
+        db.add(Offer(candidate_id=candidate.id, job_id=job.id, offer_code=f"OFF-{index}", ctc_fixed=1, ctc_total=1,
+                     date_of_joining=datetime(2026, 2, 1), status=offer_status, offered_by=1))
+    now = datetime.utcnow()
+    for scheduled_time, interview_status in [
+        (now + timedelta(days=1), "scheduled"),
+        (now - timedelta(days=1), "scheduled"),
+        (now + timedelta(days=2), "completed"),
+    ]:
+        db.add(Interview(candidate_id=candidate.id, job_id=job.id, round=InterviewRound.HR,
+                         scheduled_time=scheduled_time, status=interview_status, created_by=1))
+    for index, mpr_status in enumerate(["active", "Active", "draft"]):
+        db.add(MPR(requisition_code=f"MPR-{index}", job_title="Engineer", job_description="x", department="Engineering",
+                   hiring_manager_id=1, job_type="permanent", budget_min=1, budget_max=2, status=mpr_status))
+    db.commit()
+
+    query_counter.clear()
+    stats = RecruiterService(db).get_recruiter_stats(recruiter_id=1)
+    assert len(query_counter) <= 2
+
+    assert [kpi["value"] for kpi in stats["kpis"]] == [2, 8, 1, 1]
+    assert stats["matrixData"] == {
+        "sourced": 8, "screened": 5, "interviewed": 2, "offered": 3, "hired": 1, "dnj": 2,
+    }
+    assert stats["performanceMetrics"]["offerAcceptanceRate"] == 40.0
+    assert stats["performanceMetrics"]["sourceEffectiveness"]["direct"] == 8
+
+def test_pipeline_matrix_reads_maintained_counters(db, query_counter):
+    """Test the pipeline counters follow status transitions and serve the matrix in one read"""
+    from datetime import datetime
+    from app.models.candidate import Candidate, CandidateApplication
+    from app.models.job import Job, JobRequisition
+    from app.models.mpr import MPR
+    from app.models.offer import Offer
+    from app.services.pipeline_counters import reconcile_pipeline_counters
+    from app.services.recruiter import RecruiterService
+
+    _seed_candidates(db, 2)
+    _seed_candidates(db, 1, offset=10)
+    first_job, second_job = db.query(Job).order_by(Job.id).all()
+    candidate = db.query(Candidate).first()
+    mpr = MPR(requisition_code="MPR-1", job_title="Engineer", job_description="x", department="Engineering",
+              hiring_manager_id=1, job_type="permanent", budget_min=1, budget_max=2, status="active",
+              pipeline_stats={"profilesReceived": 99})
+    db.add(mpr)
+    db.flush()
+    db.add_all([
+        JobRequisition(job_id=first_job.id, mpr_id=mpr.id),
+        JobRequisition(job_id=second_job.id, mpr_id=mpr.id),
+        JobRequisition(job_id=second_job.id, mpr_id=mpr.id),
+    ])
+    offer = Offer(candidate_id=candidate.id, job_id=first_job.id, offer_code="OFF-1", ctc_fixed=1, ctc_total=1,
+                  date_of_joining=datetime(2026, 2, 1), status="offered", offered_by=1)
+    db.add(offer)
+    db.commit()
+
+    applications = db.query(CandidateApplication).order_by(CandidateApplication.id).all()
+    applications[0].status = "Interview"
+    applications[1].status = "joined"
+    applications[2].job_id = second_job.id
+    db.delete(applications[3])
+    offer.status = "joined"
+    db.commit()
+
+    query_counter.clear()
+    matrix = RecruiterService(db).get_pipeline_matrix(recruiter_id=1)
+    assert len(query_counter) == 1
+    expected = {"sourced": 5, "screened": 3, "interviewed": 2, "offered": 1, "hired": 1, "dnj": 0}
+    assert {key: matrix[0][key] for key in expected} == expected
+
+    reconcile_pipeline_counters(db)
+    assert RecruiterService(db).get_pipeline_matrix(recruiter_id=1) == matrix
+
+def test_mpr_pipeline_links_jobs_by_offer_and_title(client, recruiter_token, db):
+    """Test MPRs link jobs by offer or title and unlinked MPRs keep their stored stats"""
+    from datetime import datetime
+    from app.models.candidate import Candidate
+    from app.models.job import Job
+    from app.models.mpr import MPR
+    from app.models.offer import Offer
+    from app.services.recruiter import RecruiterService
+
+    _seed_candidates(db, 2)
+    _seed_candidates(db, 1, offset=10)
+    second_job = db.query(Job).order_by(Job.id.desc()).first()
+    mprs = [
+        MPR(requisition_code=f"MPR-{index}", job_title=title, job_description="x", department="Engineering",
+            hiring_manager_id=1, job_type="permanent", budget_min=1, budget_max=2, status="active",
+            pipeline_stats={"profilesReceived": 15, "selected": 1})
+        for index, title in enumerate(["backend engineer 0", "Designer", "Backend Engineer 0"])
+    ]
+    db.add_all(mprs)
+    db.flush()
+    # An explicit link replaces the title match
+    db.add(Offer(candidate_id=db.query(Candidate).first().id, job_id=second_job.id, mpr_id=mprs[2].id,
+                 offer_code="OFF-1", ctc_fixed=1, ctc_total=1, date_of_joining=datetime(2026, 2, 1),
+                 status="offered", offered_by=1))
+    db.commit()
+
+    matrix = {row["mprId"]: row for row in RecruiterService(db).get_pipeline_matrix(recruiter_id=1)}
+    assert (matrix["MPR-0"]["sourced"], matrix["MPR-0"]["screened"], matrix["MPR-0"]["offered"]) == (4, 2, 0)
+    assert (matrix["MPR-1"]["sourced"], matrix["MPR-1"]["hired"]) == (15, 1)
+    assert (matrix["MPR-2"]["sourced"], matrix["MPR-2"]["offered"]) == (2, 1)
+
+    response = client.get("/api/mpr", headers={"Authorization": f"Bearer {recruiter_token}"})
+    stats = {mpr["id"]: mpr["pipelineStats"] for mpr in response.json()}
+    assert stats[mprs[1].id] == {"profilesReceived": 15, "selected": 1}
+    assert (stats[mprs[0].id]["profilesReceived"], stats[mprs[2].id]["profilesReceived"]) == (4, 2)
+
 def test_ai_candidate_screening(client, recruiter_token, db):
     """Test AI candidate screening"""
     from app.models.candidate import Candidate
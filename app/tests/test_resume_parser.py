@@ -0,0 +1,226 @@
+"""
+Resume parser tests
+"""
+import json
+import zipfile
+from xml.etree.ElementTree import ParseError
+
+from docx import Document
+
+from app.core.config import settings
+from app.services import docx_text
+from app.services.docx_text import extract_docx_text, extract_with_iterparse
+from app.services.pdf_text import backend_order, extract_pdf_text
+from app.services.resume_parser import ResumeDocument, ResumeParser, resume_parser
+from app.services.skill_matcher import SkillMatcher, load_skill_taxonomy, DEFAULT_SKILL_TAXONOMY
+
+
+def test_skill_matcher_matches_whole_words_only():
+    """Test short skills do not match inside longer words"""
+    matcher = SkillMatcher.from_taxonomy(DEFAULT_SKILL_TAXONOMY)
+
+    assert matcher.find("A good team player, reachable by email.") == []
+    assert matcher.find("Go, AI and SQL; not MySQL-only.") == ["Go", "AI", "SQL", "MySQL"]
+    assert matcher.find("Java and JavaScript") == ["Java", "JavaScript"]
+
+def test_skill_matcher_synonyms_and_longest_match():
+    """Test synonyms map to canonical names and the longest mention wins"""
+    matcher = SkillMatcher.from_taxonomy(DEFAULT_SKILL_TAXONOMY)
+
+    assert matcher.find("golang services on k8s, sklearn models") == ["Go", "Kubernetes", "Scikit-Learn"]
+    assert matcher.find("Node.js APIs, C++ and C#") == ["Node.js", "C++", "C#"]
+    assert matcher.find("Machine\n  Learning on Google Cloud") == ["Machine Learning", "GCP"]
+    spans = matcher.find_all("node.js", overlapping=True)
+    assert {canonical for _, _, canonical in spans} == {"Node.js", "JavaScript"}
+
+def test_skill_matcher_large_taxonomy():
+    """Test a 5,000-skill taxonomy still finds exactly the mentioned skills"""
+    skills = {f"Skill {index}": [f"sk{index}"] for index in range(5000)}
+    matcher = SkillMatcher(skills)
+
+    assert len(matcher) == 10000
+    assert matcher.find("skill 42, sk4999 and skill 4200000") == ["Skill 42", "Skill 4999"]
+
+def test_load_skill_taxonomy_from_file(tmp_path):
+    """Test a JSON taxonomy file replaces the built-in one"""
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps({"hr": {"Payroll": ["payroll processing"]}, "tools": ["Excel"]}))
+
+    matcher = SkillMatcher.from_taxonomy(load_skill_taxonomy(str(path)))
+    assert matcher.find("Payroll processing in excel") == ["Payroll", "Excel"]
+    assert load_skill_taxonomy(str(tmp_path / "missing.json")) is DEFAULT_SKILL_TAXONOMY
+
+def test_extract_skills_merges_taxonomy_and_skills_section():
+    """Test taxonomy skills keep their spelling and section skills are deduplicated"""
+    text = "Jane Doe\nBuilt APIs with python and fastapi.\n\nSkills: Python, Figma\n"
+
+    skills = resume_parser.parse_text(text)["skills"]
+    assert skills[:2] == ["Python", "FastAPI"]
+    assert "Figma" in skills
+    assert len([skill for skill in skills if skill.lower() == "python"]) == 1
+
+def test_resume_document_sections():
+    """Test section bodies run from the first header to the next blank line"""
+    doc = ResumeDocument(
+        "Jane Doe\nTechnical Skills: Go, SQL\nDocker\n\nSummary:  Backend\n engineer\n\nProfile: unused"
+    )
+
+    assert doc.sections["technical skills"] == " Go, SQL\nDocker"
+    assert doc.sections["skills"] == doc.sections["technical skills"]
+    assert doc.sections["summary"] == "  Backend\n engineer"
+    assert "objective" not in doc.sections
+
+def test_parse_text_runs_every_stage_once():
+    """Test the stage pipeline fills every field and accepts custom stages"""
+    text = (
+        "Jane Doe\njane@example.com | linkedin.com/in/janedoe\n"
+        "Summary: Backend engineer with 6 years of experience\n\n"
+        "Skills: Python, PostgreSQL\n\n"
+        "Senior Engineer at Globex Inc\nB.Tech, State University 2015\nLocation: Pune"
+    )
+    parser = ResumeParser()
+    parser.register_stage("line_count", lambda doc: len(doc.lines))
+
+    result = parser.parse_text(text)
+    assert [field for field, _ in ResumeParser.STAGES] == list(result)[1:11]
+    assert result["name"] == "Jane Doe"
+    assert result["email"] == "jane@example.com"
+    assert result["linkedin"] == "linkedin.com/in/janedoe"
+    assert result["experience"] == 6
+    assert result["summary"] == "Backend engineer with 6 years of experience"
+    assert result["skills"][:2] == ["Python", "PostgreSQL"]
+    assert result["education"][0]["degree"] == "B.Tech"
+    assert "Globex Inc" in result["companies"]
+    assert result["locations"] == ["Pune"]
+    assert result["line_count"] == 9
+
+def _make_pdf(pages):
+    """A minimal PDF with one line of Helvetica text per page"""
+    count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (4 + 2 * index) for index in range(count)), count),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index, text in enumerate(pages):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * index)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+def _fake_pdftotext(tmp_path, script):
+    path = tmp_path / "pdftotext"
+    path.write_text("#!/bin/sh\n" + script)
+    path.chmod(0o755)
+    return str(path)
+
+def test_pdf_backend_prefers_pdftotext(tmp_path, monkeypatch):
+    """Test the pdftotext fast path gets the page cap and its output is cleaned"""
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(_make_pdf(["Jane Doe"]))
+    monkeypatch.setattr(settings, "RESUME_PDFTOTEXT_PATH", _fake_pdftotext(tmp_path, 'echo "Jane Doe\n\nargs: $*"\n'))
+    monkeypatch.setattr(settings, "RESUME_PDF_MAX_PAGES", 3)
+
+    assert backend_order("auto") == ["pdftotext", "pdfminer"]
+    text = resume_parser.extract_text_from_file(str(pdf))
+    assert text == f"Jane Doe args: -q -enc UTF-8 -l 3 {pdf} -"
+
+def test_pdf_backend_falls_back_to_pdfminer(tmp_path, monkeypatch):
+    """Test a missing, failing or hung pdftotext hands over to pdfminer"""
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(_make_pdf(["Jane Doe", "Python developer", "Page three"]))
+    monkeypatch.setattr(settings, "RESUME_PDF_MAX_PAGES", 2)
+    monkeypatch.setattr(settings, "RESUME_PDF_TIMEOUT_SECONDS", 0.5)
+
+    monkeypatch.setattr(settings, "RESUME_PDFTOTEXT_PATH", str(tmp_path / "missing"))
+    assert backend_order("auto") == ["pdfminer"]
+    assert extract_pdf_text(str(pdf), backend="pdftotext").split() == ["Jane", "Doe", "Python", "developer"]
+
+    for script in ("exit 1\n", "sleep 5\n"):
+        monkeypatch.setattr(settings, "RESUME_PDFTOTEXT_PATH", _fake_pdftotext(tmp_path, script))
+        assert resume_parser.extract_text_from_file(str(pdf)) == "Jane Doe Python developer"
+
+def _make_docx(path):
+    document = Document()
+    document.sections[0].header.paragraphs[0].text = "Curriculum Vitae"
+    document.sections[0].footer.paragraphs[0].text = "Page 1"
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("Summary: Backend engineer")
+    document.add_paragraph("")
+    table = document.add_table(rows=2, cols=2)
+    for row, cells in zip(table.rows, (("Skills", "Python, Go"), ("Employer", "Globex Inc"))):
+        for cell, text in zip(row.cells, cells):
+            cell.text = text
+    run = document.add_paragraph("Location:").add_run()
+    run.add_tab()
+    run.add_text("Pune")
+    document.save(str(path))
+
+def test_docx_streaming_extraction(tmp_path):
+    """Test the body, tables (in document order), then headers and footers are streamed out"""
+    path = tmp_path / "resume.docx"
+    _make_docx(path)
+
+    assert extract_with_iterparse(str(path)).split("\n") == [
+        "Jane Doe",
+        "Summary: Backend engineer",
+        "",
+        "Skills", "Python, Go", "Employer", "Globex Inc",
+        "Location:\tPune",
+        "Curriculum Vitae",
+        "Page 1",
+    ]
+    text = resume_parser.extract_text_from_file(str(path))
+    assert resume_parser.parse_text(text)["name"] == "Jane Doe"
+
+def test_docx_text_boxes_and_part_order(tmp_path):
+    """Test text boxes are read once (not again from mc:Fallback) and headers sort numerically"""
+    w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    mc = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+    text_box = (
+        '<w:p><w:r><w:t>Contact:</w:t></w:r><w:r><mc:AlternateContent>'
+        '<mc:Choice Requires="wps"><w:txbxContent><w:p><w:r><w:t>jane@example.com</w:t></w:r></w:p>'
+        '</w:txbxContent></mc:Choice>'
+        '<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>jane@example.com</w:t></w:r></w:p>'
+        '</w:txbxContent></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r></w:p>'
+    )
+    path = tmp_path / "resume.docx"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", f'<w:document {w} {mc}><w:body>{text_box}</w:body></w:document>')
+        for number in (10, 2):
+            archive.writestr(f"word/header{number}.xml",
+                             f'<w:hdr {w}><w:p><w:r><w:t>Header {number}</w:t></w:r></w:p></w:hdr>')
+
+    assert extract_with_iterparse(str(path)).split("\n") == ["jane@example.com", "Contact:", "Header 2", "Header 10"]
+
+def test_docx_falls_back_to_python_docx(tmp_path, monkeypatch):
+    """Test python-docx reads files the streaming reader rejects"""
+    path = tmp_path / "resume.docx"
+    _make_docx(path)
+
+    def broken(file_path):
+        raise ParseError("mismatched tag")
+
+    monkeypatch.setattr(docx_text, "extract_with_iterparse", broken)
+    text = extract_docx_text(str(path))
+    assert text.startswith("Jane Doe\nSummary: Backend engineer\n\nLocation:\tPune")
+    assert "Globex Inc" in text
+    assert text.endswith("Curriculum Vitae\nPage 1")
+
+    (tmp_path / "broken.docx").write_bytes(b"not a zip")
+    assert resume_parser.extract_text_from_file(str(tmp_path / "broken.docx")) == ""
@@ -0,0 +1,89 @@
+"""
+Helpers for counter rollup tables maintained from ORM flushes
+"""
+from typing import Any, Dict, Sequence, Tuple, Type
+
+from sqlalchemy import Table, event, func, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def loaded_value(obj, key: str) -> Any:
+    """Value already in the instance state, without triggering a load"""
+    return inspect(obj).dict.get(key)
+
+
+def column_history(obj, key: str) -> Tuple[Any, Any, bool]:
+    """(old, new, changed) for a column attribute in the current flush"""
+    history = inspect(obj).attrs[key].history
+    if not history.has_changes():
+        current = history.unchanged[0] if history.unchanged else None
+        return current, current, False
+    old = history.deleted[0] if history.deleted else None
+    new = history.added[0] if history.added else None
+    return old, new, True
+
+
+def _keep_previous_value(target, value, oldvalue, initiator) -> None:
+    pass
+
+
+def track_columns(tracked: Dict[Type, Sequence[str]]) -> None:
+    """
+    Make the old values of `tracked` ({model: column keys}) visible to
+    `column_history` in after_flush listeners.
+
+    active_history loads the old value on assignment even when the
+    attribute was expired by a commit, and the before_flush hook loads the
+    columns of rows about to be deleted, which can no longer be loaded once
+    the DELETE has run.
+    """
+    for model, keys in tracked.items():
+        for key in keys:
+            event.listen(getattr(model, key), "set", _keep_previous_value, active_history=True)
+
+    def _load_tracked_columns(session: Session, flush_context, instances) -> None:
+        for obj in list(session.dirty) + list(session.deleted):
+            for key in tracked.get(type(obj), ()):
+                getattr(obj, key)
+
+    event.listen(Session, "before_flush", _load_tracked_columns)
+
+
+def apply_counter_deltas(
+    connection, table: Table, key: str, columns: Sequence[str], deltas: Dict[Any, Dict[str, int]]
+) -> None:
+    """
+    Add `deltas` ({key value: {column: delta}}) to the counter rows of
+    `table`, creating missing rows. One INSERT .. ON CONFLICT DO UPDATE on
+    PostgreSQL and SQLite, an UPDATE-then-INSERT per row elsewhere.
+    """
+    rows = [
+        {key: key_value, **{column: values.get(column, 0) for column in columns}}
+        for key_value, values in sorted(deltas.items())
+    ]
+    if not rows:
+        return
+
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={
+                **{column: table.c[column] + stmt.excluded[column] for column in columns},
+                "updated_at": func.now(),
+            },
+        )
+        connection.execute(stmt, rows)
+        return
+
+    for row in rows:
+        updated = connection.execute(
+            table.update()
+            .where(table.c[key] == row[key])
+            .values({column: table.c[column] + row[column] for column in columns})
+        )
+        if not updated.rowcount:
+            connection.execute(table.insert().values(**row))
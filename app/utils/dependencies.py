@@ -8,6 +8,8 @@ from typing import Optional
 from app.database import get_db
 from app.core.security import decode_token
 from app.crud.user import crud_user
+from app.crud.candidate import crud_candidate
+from app.utils.principal_cache import principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -23,6 +25,9 @@ def get_current_user(
 ) -> dict:
     """
     Get current user from JWT token
+
+    Served from the principal cache when the token was seen recently, so
+    most authenticated requests do not touch the database for auth.
     """
     payload = decode_token(token)
     if not payload:
@@ -37,6 +42,11 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
+
+    cache_key = payload.get("jti") or token
+    principal = principal_cache.get(cache_key)
+    if principal and principal["email"] == email:
+        return principal
     
     user = crud_user.get_by_email(db, email)
     if not user:
@@ -45,13 +55,17 @@ def get_current_user(
             detail="User not found"
         )
     
-    return {
+    role = _normalize_value(user.role)
+    principal = {
         "id": user.id,
         "email": user.email,
-        "role": _normalize_value(user.role),
+        "role": role,
         "name": user.name,
         "status": _normalize_value(user.status),
+        "candidate_id": crud_candidate.get_profile_id_by_user_id(db, user.id) if role == "candidate" else None,
     }
+    principal_cache.set(cache_key, principal, expires_at=payload.get("exp"))
+    return principal
 
 def require_role(required_role: str):
     """
@@ -0,0 +1,136 @@
+"""
+Response cache for the public job board
+
+`GET /api/jobs/public` is unauthenticated and the busiest endpoint. Each
+page is serialized once and kept, with a strong ETag over its bytes, under
+(cursor, limit) until the board changes. Every committed insert, update or
+delete of a job bumps the board version, which drops all pages;
+`publish_draft_jobs` bumps it explicitly because its bulk UPDATE bypasses
+the session events.
+
+Pages also expire after JOB_BOARD_CACHE_TTL_SECONDS. The cache is per
+process, so the TTL bounds how long another worker can serve a page that
+predates a change made elsewhere.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job import Job
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    next_cursor: Optional[str]
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches `etag` (weak comparison, as
+    RFC 9110 requires for If-None-Match)
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class JobBoardCache:
+    """Bounded, thread-safe TTL LRU of serialized job board pages"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, CachedPage]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[CachedPage]:
+        """Cached page for `key`, or None when missing, expired or outdated"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic() or entry[1] != self.version:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: Hashable, version: int, body: bytes, next_cursor: Optional[str] = None) -> CachedPage:
+        """
+        Cache `body` under `key` and return the page with its ETag.
+
+        `version` is the board version read before the page was queried; a
+        page built while a change was being committed is not cached.
+        """
+        page = CachedPage(body=body, etag=make_etag(body), next_cursor=next_cursor)
+        if not self.enabled:
+            return page
+        with self._lock:
+            if version != self.version:
+                return page
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, version, page)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return page
+
+    def bump(self) -> None:
+        """Invalidate every cached page"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def clear(self) -> None:
+        self.bump()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+job_board_cache = JobBoardCache(
+    max_entries=settings.JOB_BOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.JOB_BOARD_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_job_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, Job) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["job_board_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_job_board(session: Session) -> None:
+    if session.info.pop("job_board_changed", False):
+        job_board_cache.bump()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_job_changes(session: Session, previous_transaction) -> None:
+    session.info.pop("job_board_changed", None)
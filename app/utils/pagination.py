@@ -0,0 +1,112 @@
+"""
+Keyset (cursor) pagination for list endpoints
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from fastapi import Response
+from sqlalchemy.orm import Query
+
+from app.core.exceptions import BadRequestException
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the (sort_key, id) of the last row on a page as an opaque token"""
+    payload = json.dumps([sort_value, row_id], default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """Decode a cursor produced by `encode_cursor`"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return sort_value, int(row_id)
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise BadRequestException("Invalid cursor")
+
+
+def _coerce_sort_value(sort_key, value: Any) -> Any:
+    try:
+        python_type = sort_key.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if isinstance(value, str) and python_type is datetime:
+        return datetime.fromisoformat(value)
+    if isinstance(value, str) and python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def paginate(
+    query: Query,
+    id_column,
+    sort_key=None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Return one page of `query` ordered by (sort_key, id) and the cursor for
+    the next page (None on the last page).
+
+    The position of the previous page's last row is re-read from the table
+    by id rather than trusted from the cursor, so the comparison always uses
+    the database's own representation of the sort key; the encoded value is
+    only a fallback for when that row has since been deleted. Sort keys must
+    be non-null.
+
+    Queries selecting extra columns next to the entity page as tuples of
+    (entity, *columns); single-entity queries page as entities.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    key = sort_key if sort_key is not None else id_column
+    order = [key.desc(), id_column.desc()] if descending else [key.asc(), id_column.asc()]
+    if sort_key is None:
+        order = order[1:]
+
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_key is None:
+            query = query.filter(id_column < last_id if descending else id_column > last_id)
+        else:
+            anchor = (
+                select(sort_key)
+                .where(id_column == last_id)
+                .correlate(None)
+                .scalar_subquery()
+            )
+            anchor = func.coalesce(anchor, _coerce_sort_value(sort_key, sort_value))
+            if descending:
+                query = query.filter(or_(sort_key < anchor, and_(sort_key == anchor, id_column < last_id)))
+            else:
+                query = query.filter(or_(sort_key > anchor, and_(sort_key == anchor, id_column > last_id)))
+
+    rows = query.add_columns(key.label("cursor_key")).order_by(*order).limit(limit + 1).all()
+    items = [row[0] if len(row) == 2 else tuple(row[:-1]) for row in rows[:limit]]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last_row = rows[limit - 1]
+        next_cursor = encode_cursor(last_row[-1], getattr(last_row[0], id_column.key))
+    return items, next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next page cursor without changing list response bodies"""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,138 @@
+"""
+Cache of authenticated principals
+
+`get_current_user` resolves the user behind a JWT on every authenticated
+request. The resolved principal (id, email, name, role, status and
+candidate_id) is cached per token id, so repeat requests with the same
+token skip the database entirely.
+
+Entries expire after PRINCIPAL_CACHE_TTL_SECONDS (or when the token does)
+and are dropped as soon as a committed transaction changes the user or
+creates their candidate profile. The cache is per process, so the TTL
+also bounds how stale another worker's copy can be.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.models.user import User
+
+# User columns copied into the principal
+PRINCIPAL_COLUMNS = ("email", "name", "role", "status")
+
+
+class PrincipalCache:
+    """Bounded, thread-safe TTL LRU of principals keyed by token id"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached principal for `key`, or None when missing or expired"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, key: str, principal: Dict[str, Any], expires_at: Optional[float] = None) -> None:
+        """
+        Cache `principal` under `key` for the TTL, or until `expires_at`
+        (a Unix timestamp, e.g. the token's exp) if that comes first.
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, dict(principal))
+            self._tokens_by_user.setdefault(principal["id"], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached token of `user_id`"""
+        with self._lock:
+            for key in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, principal = self._entries.pop(key)
+        tokens = self._tokens_by_user.get(principal["id"])
+        if tokens is not None:
+            tokens.discard(key)
+            if not tokens:
+                del self._tokens_by_user[principal["id"]]
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def _principal_changed(obj: User) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in PRINCIPAL_COLUMNS)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session: Session, flush_context) -> None:
+    user_ids = session.info.setdefault("principal_changes", set())
+    for obj in session.dirty:
+        if isinstance(obj, User) and _principal_changed(obj):
+            user_ids.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+    for obj in session.new:
+        if isinstance(obj, Candidate) and obj.user_id is not None:
+            user_ids.add(obj.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session: Session) -> None:
+    # After commit, so a concurrent request cannot re-cache the old row
+    for user_id in session.info.pop("principal_changes", ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changed_principals(session: Session, previous_transaction) -> None:
+    session.info.pop("principal_changes", None)
@@ -0,0 +1,63 @@
+"""
+Import legacy parsed resume JSON files into the parsed_resumes table.
+
+Older releases wrote parser output to uploads/parsed_resumes/{candidate_id}_{file}.json.
+Safe to run multiple times; documents that already have a row are skipped.
+"""
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.models.candidate import CandidateDocument, ParsedResume
+
+
+LEGACY_DIR = "uploads/parsed_resumes"
+
+
+def _legacy_paths(document: CandidateDocument):
+    if document.document_url:
+        yield os.path.join(LEGACY_DIR, f"{document.candidate_id}_{os.path.basename(str(document.document_url))}.json")
+    yield os.path.join(LEGACY_DIR, f"{document.candidate_id}_{document.file_name}.json")
+
+
+def backfill_parsed_resumes() -> None:
+    db = SessionLocal()
+    imported = 0
+    try:
+        existing = {row.document_id for row in db.query(ParsedResume.document_id).all()}
+        documents = (
+            db.query(CandidateDocument)
+            .filter(CandidateDocument.document_type == "resume")
+            .order_by(CandidateDocument.id)
+            .all()
+        )
+        for document in documents:
+            if document.id in existing:
+                continue
+            for path in _legacy_paths(document):
+                if not os.path.exists(path):
+                    continue
+                try:
+                    with open(path, "r") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                db.add(ParsedResume(
+                    candidate_id=document.candidate_id,
+                    document_id=document.id,
+                    parser_version="legacy",
+                    data=data,
+                ))
+                imported += 1
+                break
+        db.commit()
+        print(f"Imported {imported} parsed resume(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_parsed_resumes()
@@ -0,0 +1,86 @@
+"""
+Load-test the read-heavy routes that run on the async database session.
+
+Fires concurrent GET requests at a running server and reports throughput and
+p50/p95/p99 latency per route. Run it once against a build on the sync
+session and once against this one to compare.
+
+    python scripts/benchmark_async_routes.py --base-url http://127.0.0.1:8000 \\
+        --token <recruiter or admin JWT> --concurrency 50 --requests 1000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/jobs/public",
+    "/api/candidates",
+    "/api/stats/admin-dashboard",
+    "/api/stats/recruiter-dashboard",
+    "/api/stats/manager-dashboard",
+    "/api/manager/pipeline",
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_path(client: httpx.AsyncClient, path: str, concurrency: int, total: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "errors": errors,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", default=None, help="Bearer token for the authenticated routes")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per route")
+    parser.add_argument("--path", action="append", dest="paths", help="Route to test (repeatable)")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=60) as client:
+        print(f"{'route':<34}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for path in args.paths or DEFAULT_PATHS:
+            result = await run_path(client, path, args.concurrency, args.requests)
+            print(
+                f"{path:<34}{result['rps']:>10.1f}{result['p50']:>10.1f}"
+                f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
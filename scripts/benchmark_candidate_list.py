@@ -0,0 +1,121 @@
+"""
+Benchmark the recruiter candidate list against the old per-candidate queries.
+
+Seeds a throwaway SQLite database (default 10,000 candidates) and reports the
+statement count and wall time of RecruiterService.get_candidate_list next to
+the previous N+1 implementation.
+
+    python scripts/benchmark_candidate_list.py --candidates 10000 --page-size 100
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Candidate, CandidateApplication, CandidateDocument, Job, User
+from app.models.user import UserRole
+from app.services.recruiter import RecruiterService
+
+
+def seed(db, candidates: int) -> None:
+    jobs = [Job(title=f"Job {index}", description="Benchmark", department="Engineering") for index in range(50)]
+    db.add_all(jobs)
+    db.flush()
+    users = [
+        {"email": f"bench{index}@example.com", "password_hash": "x", "name": f"Bench {index}", "role": UserRole.CANDIDATE}
+        for index in range(candidates)
+    ]
+    db.bulk_insert_mappings(User, users)
+    user_ids = [row.id for row in db.query(User.id).order_by(User.id)]
+    db.bulk_insert_mappings(Candidate, [{"user_id": user_id, "skills": ["Python"], "experience_years": 3} for user_id in user_ids])
+    candidate_ids = [row.id for row in db.query(Candidate.id).order_by(Candidate.id)]
+
+    applications, documents = [], []
+    for index, candidate_id in enumerate(candidate_ids):
+        for attempt in range(3):
+            applications.append({"candidate_id": candidate_id, "job_id": jobs[(index + attempt) % len(jobs)].id, "status": "applied"})
+        for doc_type in ("resume", "aadhaar", "pan_card"):
+            documents.append({
+                "candidate_id": candidate_id,
+                "document_type": doc_type,
+                "document_url": f"/uploads/{candidate_id}_{doc_type}.pdf",
+                "file_name": f"{doc_type}.pdf",
+                "verified": index % 2 == 0,
+            })
+    db.bulk_insert_mappings(CandidateApplication, applications)
+    db.bulk_insert_mappings(CandidateDocument, documents)
+    db.commit()
+
+
+def legacy_candidate_list(db, limit: int):
+    """The pre-batching implementation: several queries per candidate."""
+    response = []
+    for candidate in db.query(Candidate).limit(limit).all():
+        latest_application = db.query(CandidateApplication).filter(
+            CandidateApplication.candidate_id == candidate.id
+        ).order_by(CandidateApplication.applied_at.desc()).first()
+        candidate_docs = db.query(CandidateDocument).filter(CandidateDocument.candidate_id == candidate.id).all()
+        response.append((
+            candidate.user.name,
+            latest_application.job.title if latest_application and latest_application.job else None,
+            len(candidate_docs),
+        ))
+    return response
+
+
+def walk_all_pages(db, page_size: int):
+    rows, cursor = RecruiterService(db).get_candidate_list(limit=page_size)
+    while cursor:
+        page, cursor = RecruiterService(db).get_candidate_list(cursor=cursor, limit=page_size)
+        rows.extend(page)
+    return rows
+
+
+def measure(engine, label, func):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    started = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", _record)
+    print(f"{label:<28} rows={len(rows):>6}  queries={len(statements):>6}  time={elapsed * 1000:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        with Session() as db:
+            started = time.perf_counter()
+            seed(db, args.candidates)
+            print(f"Seeded {args.candidates} candidates in {time.perf_counter() - started:.1f}s")
+
+        with Session() as db:
+            measure(engine, f"legacy (limit={args.page_size})", lambda: legacy_candidate_list(db, args.page_size))
+        with Session() as db:
+            measure(engine, f"batched (limit={args.page_size})", lambda: RecruiterService(db).get_candidate_list(limit=args.page_size)[0])
+        with Session() as db:
+            measure(engine, "legacy (all)", lambda: legacy_candidate_list(db, args.candidates))
+        with Session() as db:
+            measure(engine, "batched (all, cursor walk)", lambda: walk_all_pages(db, args.page_size))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark the resume parser's PDF text backends (pdftotext vs pdfminer).
+
+Runs every backend over the same PDF corpus, each in a fresh process, and
+reports the time per resume, the throughput and the peak resident memory
+of that process and the subprocesses it started. Without --corpus a
+synthetic corpus of multi-page resumes is generated in a temp directory.
+
+    python scripts/benchmark_pdf_backends.py --resumes 50 --pages 4
+    python scripts/benchmark_pdf_backends.py --corpus uploads/resumes --max-pages 20
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.pdf_text import PDF_BACKENDS, PdfBackendUnavailable
+
+WORDS = (
+    "designed scalable backend services python postgresql kubernetes led migration mentored "
+    "engineers reduced latency improved reliability observability automated deployments"
+).split()
+
+
+def build_pdf(pages, rng) -> bytes:
+    """A PDF of `pages` pages, each with 45 lines of Helvetica text"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (4 + 2 * index) for index in range(pages)), pages),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index in range(pages):
+        lines = (" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(45))
+        stream = b"BT /F1 10 Tf 14 TL 50 750 Td " + b" ".join(b"(%s) '" % line.encode() for line in lines) + b" ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * index)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+def build_corpus(directory: Path, resumes: int, pages: int, seed: int = 3):
+    rng = random.Random(seed)
+    paths = []
+    for index in range(resumes):
+        path = directory / f"resume_{index}.pdf"
+        path.write_bytes(build_pdf(pages, rng))
+        paths.append(str(path))
+    return paths
+
+
+def run_backend(name, paths, max_pages, timeout, results) -> None:
+    """Extract every file with one backend (in its own process) and report back"""
+    extract = PDF_BACKENDS[name]
+    started = time.perf_counter()
+    characters = failures = 0
+    try:
+        for path in paths:
+            try:
+                characters += len(extract(path, max_pages=max_pages, timeout=timeout))
+            except PdfBackendUnavailable:
+                raise
+            except Exception:
+                failures += 1
+    except PdfBackendUnavailable as e:
+        results.put((name, None, str(e)))
+        return
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is in KiB on Linux
+    peak_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    results.put((name, (elapsed, characters, failures, peak_kb), None))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of PDFs; default is a synthetic corpus")
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--max-pages", type=int, default=20, help="page cap, 0 = every page")
+    parser.add_argument("--timeout", type=float, default=15.0, help="pdftotext timeout per file")
+    parser.add_argument("--backends", nargs="+", default=list(PDF_BACKENDS), choices=list(PDF_BACKENDS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        if args.corpus:
+            paths = sorted(str(path) for path in Path(args.corpus).glob("**/*.pdf"))
+        else:
+            paths = build_corpus(Path(scratch), args.resumes, args.pages)
+        if not paths:
+            sys.exit("No PDFs found")
+        print(f"pdfs={len(paths)}  max_pages={args.max_pages or 'all'}")
+
+        context = multiprocessing.get_context("spawn")
+        for name in args.backends:
+            results = context.Queue()
+            process = context.Process(
+                target=run_backend, args=(name, paths, args.max_pages, args.timeout, results)
+            )
+            process.start()
+            name, stats, error = results.get()
+            process.join()
+            if error:
+                print(f"{name:<10} unavailable: {error}")
+                continue
+            elapsed, characters, failures, peak_kb = stats
+            print(
+                f"{name:<10} {elapsed / len(paths) * 1000:8.2f} ms/pdf  "
+                f"{len(paths) / elapsed:8.1f} pdf/s  peak_rss={peak_kb / 1024:7.1f} MiB  "
+                f"chars={characters}  failures={failures}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark the recruiter dashboard counts against the old one-COUNT-per-KPI queries.
+
+Seeds a throwaway SQLite database (default 1,000,000 applications) and
+reports the statement count and wall time of
+RecruiterService.get_recruiter_stats next to the previous implementation,
+after checking that both return the same response. Pass --database-url to
+run against PostgreSQL instead (the tables must be empty).
+
+    python scripts/benchmark_recruiter_stats.py --applications 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import String, cast, create_engine, event, func
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Candidate, CandidateApplication, Interview, Job, MPR, Offer, User
+from app.models.user import UserRole
+from app.services.recruiter import RecruiterService
+
+APPLICATION_STATUSES = ["applied", "screening", "shortlisted", "interview", "offered", "joined", "rejected"]
+OFFER_STATUSES = ["draft", "offered", "accepted", "declined", "withdrawn", "expired", "joined"]
+BATCH = 50000
+
+
+def seed(db, applications: int) -> None:
+    rng = random.Random(7)
+    user = User(email="bench@example.com", password_hash="x", name="Bench", role=UserRole.CANDIDATE)
+    job = Job(title="Bench", description="Benchmark", department="Engineering")
+    db.add_all([user, job])
+    db.flush()
+    candidate = Candidate(user_id=user.id)
+    db.add(candidate)
+    db.flush()
+
+    for start in range(0, applications, BATCH):
+        db.bulk_insert_mappings(CandidateApplication, [
+            {"candidate_id": candidate.id, "job_id": job.id, "status": rng.choice(APPLICATION_STATUSES)}
+            for _ in range(start, min(applications, start + BATCH))
+        ])
+    related = max(1, applications // 10)
+    now = datetime.utcnow()
+    db.bulk_insert_mappings(Offer, [
+        {
+            "candidate_id": candidate.id, "job_id": job.id, "offer_code": f"BENCH-{index}", "ctc_fixed": 1,
+            "ctc_total": 1, "date_of_joining": now, "offered_by": user.id, "status": rng.choice(OFFER_STATUSES),
+        }
+        for index in range(related)
+    ])
+    db.bulk_insert_mappings(Interview, [
+        {
+            "candidate_id": candidate.id, "job_id": job.id, "round": "hr", "created_by": user.id,
+            "scheduled_time": now + timedelta(hours=rng.randint(-720, 720)),
+            "status": rng.choice(["scheduled", "completed", "cancelled"]),
+        }
+        for _ in range(related)
+    ])
+    db.bulk_insert_mappings(MPR, [
+        {
+            "requisition_code": f"BENCH-{index}", "job_title": "Bench", "job_description": "x", "department": "Eng",
+            "hiring_manager_id": user.id, "job_type": "permanent", "budget_min": 1, "budget_max": 2,
+            "status": rng.choice(["active", "draft", "closed"]),
+        }
+        for index in range(max(1, related // 100))
+    ])
+    db.commit()
+
+
+def legacy_recruiter_stats(db):
+    """The previous implementation: one COUNT(*) round-trip per figure."""
+    count = lambda model, *criteria: db.query(model).filter(*criteria).count()
+    total_candidates = db.query(CandidateApplication).count()
+    total_released = count(Offer, cast(Offer.status, String) != "draft")
+    accepted = count(Offer, cast(Offer.status, String).in_(["accepted", "joined"]))
+    return {
+        "kpis": [
+            {"name": "Active MPRs", "value": count(MPR, func.lower(MPR.status) == "active"), "change": "0"},
+            {"name": "Candidates in Pipeline", "value": total_candidates, "change": "0%"},
+            {"name": "Upcoming Interviews", "value": count(
+                Interview, Interview.scheduled_time >= datetime.utcnow(), cast(Interview.status, String) == "scheduled"
+            ), "change": "0"},
+            {"name": "Offers Pending", "value": count(Offer, cast(Offer.status, String) == "offered"), "change": "0"},
+        ],
+        "matrixData": {
+            "sourced": total_candidates,
+            "screened": count(CandidateApplication, func.lower(CandidateApplication.status).in_(
+                list(RecruiterService.SCREENED_STATUSES))),
+            "interviewed": count(CandidateApplication, func.lower(CandidateApplication.status).in_(
+                list(RecruiterService.INTERVIEWED_STATUSES))),
+            "offered": count(Offer, cast(Offer.status, String).in_(["offered", "accepted", "joined"])),
+            "hired": count(Offer, cast(Offer.status, String) == "joined"),
+            "dnj": count(Offer, cast(Offer.status, String).in_(["declined", "withdrawn", "expired"])),
+        },
+        "performanceMetrics": {
+            "timeToFill": 0,
+            "offerAcceptanceRate": round((accepted / total_released) * 100, 1) if total_released else 0.0,
+            "candidateSatisfaction": 0,
+            "sourceEffectiveness": {"agency": 0, "referral": 0, "direct": total_candidates, "jobBoard": 0},
+        },
+    }
+
+
+def measure(engine, label, func):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", _record)
+    print(f"{label:<12} round-trips={len(statements):>3}  time={elapsed * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=1000000)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(args.database_url or f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        with Session() as db:
+            started = time.perf_counter()
+            seed(db, args.applications)
+            print(f"Seeded {args.applications} applications in {time.perf_counter() - started:.1f}s")
+
+        with Session() as db:
+            legacy = measure(engine, "legacy", lambda: legacy_recruiter_stats(db))
+        with Session() as db:
+            current = measure(engine, "aggregate", lambda: RecruiterService(db).get_recruiter_stats(recruiter_id=0))
+        print("responses identical:", legacy == current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark resume field extraction against the old per-extractor passes.
+
+Generates a synthetic resume corpus (default 500 resumes) and reports the
+time per resume of ResumeParser.parse_text, which builds one shared
+ResumeDocument and runs precompiled patterns, next to the previous
+implementation, in which every extractor re-split and re-lowercased the
+text and looked its patterns up by string. Both use the same skill matcher,
+so the difference is the text handling alone.
+
+    python scripts/benchmark_resume_parser.py --resumes 500 --lines 120
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.resume_parser import resume_parser
+
+LINES = [
+    "Jane Doe", "jane.doe@example.com", "+1 (555) 123-4567", "linkedin.com/in/janedoe",
+    "Summary: Backend engineer building reliable distributed services", "Objective: lead platform teams",
+    "Skills: Python, Go, PostgreSQL, AWS, Docker", "Technical Skills: Kubernetes, Terraform",
+    "8+ years of experience in backend development", "Senior Engineer at Globex Inc (2019 - 2024)",
+    "Software Engineer at Initech LLC", "B.Tech in Computer Science, State University 2014",
+    "MBA, City College 2018", "Location: Pune, India", "Designed APIs serving 20k requests per second",
+    "Mentored five engineers and ran hiring loops", "Cut infrastructure cost by 30 percent",
+    "Led migration to event-driven architecture", "",
+]
+
+
+def build_corpus(resumes: int, lines: int, seed: int = 11):
+    rng = random.Random(seed)
+    return ["\n".join(rng.choice(LINES) for _ in range(lines)) for _ in range(resumes)]
+
+
+def legacy_parse(text: str):
+    """The pre-pipeline extraction: each extractor re-reads the whole text"""
+    parser = resume_parser
+    lines = text.split('\n')
+    name = next((line.strip() for line in lines[:10]
+                 if line.strip() and len(line.strip()) < 50
+                 and re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$', line.strip())), "")
+    emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    phones = re.findall(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    linkedin = re.findall(r'(?:https?://)?(?:www\.)?linkedin\.com/(?:in|company)/[a-zA-Z0-9_-]+', text, re.IGNORECASE)
+
+    skills = parser.skill_matcher.find(text)
+    text_lower = text.lower()
+    for pattern in (r'skills(?:\s*[:•])(.*?)(?:\n\n|\Z)', r'technical skills(?:\s*[:•])(.*?)(?:\n\n|\Z)',
+                    r'core competencies(?:\s*[:•])(.*?)(?:\n\n|\Z)'):
+        match = re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        if match:
+            skills.extend(s.strip() for s in re.findall(r'[a-zA-Z0-9+#\.\s]+', match.group(1)) if s.strip())
+
+    experience = 0
+    for pattern in (r'(\d+)\+?\s*years?\s*(?:of)?\s*experience', r'experience\s*:\s*(\d+)\+?\s*years?',
+                    r'(\d+)\+?\s*years?\s*in\s*[a-zA-Z\s]+'):
+        found = [int(value) for value in re.findall(pattern, text, re.IGNORECASE) if 0 <= int(value) <= 50]
+        if found:
+            experience = found[0]
+            break
+
+    keywords = ['university', 'college', 'institute', 'school', 'bachelor', 'master', 'phd', 'mba',
+                'bsc', 'msc', 'degree', 'diploma', 'certification']
+    education = [
+        {"institution": line.strip(), "year": (re.findall(r'(19|20)\d{2}', line) or [""])[0]}
+        for line in text.split('\n') if any(keyword in line.lower() for keyword in keywords)
+    ][:5]
+
+    summary = ""
+    for pattern in (r'summary(?:\s*[:•])(.*?)(?:\n\n|\Z)', r'objective(?:\s*[:•])(.*?)(?:\n\n|\Z)',
+                    r'profile(?:\s*[:•])(.*?)(?:\n\n|\Z)'):
+        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        if match:
+            summary = re.sub(r'\s+', ' ', match.group(1).strip())[:500]
+            break
+
+    companies = []
+    for pattern in (r'at\s+([A-Z][a-zA-Z\s&\.]+)(?:\s+|$)', r'company\s*:\s*([A-Z][a-zA-Z\s&\.]+)',
+                    r'employer\s*:\s*([A-Z][a-zA-Z\s&\.]+)',
+                    r'\b([A-Z][A-Za-z\s&\.]+(?:Inc|LLC|Ltd|Corp|Corporation|Company))\b'):
+        companies.extend(re.findall(pattern, text))
+
+    locations = [
+        match.group(1).strip()
+        for line in text.split('\n')
+        if any(keyword in line.lower() for keyword in ['location', 'address', 'city', 'based in'])
+        for match in [re.search(r':\s*(.+)$', line)] if match
+    ]
+    return name, emails, phones, linkedin, skills, experience, education, summary, companies, locations
+
+
+def timed(func, corpus):
+    started = time.perf_counter()
+    for text in corpus:
+        func(text)
+    return (time.perf_counter() - started) / len(corpus)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=120)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.resumes, args.lines)
+    # Warm up both paths (regex cache, skill matcher)
+    legacy_parse(corpus[0])
+    resume_parser.parse_text(corpus[0])
+
+    legacy = timed(legacy_parse, corpus)
+    pipeline = timed(resume_parser.parse_text, corpus)
+    print(f"resumes={len(corpus)}  lines/resume={args.lines}")
+    print(f"legacy extractors   {legacy * 1000:8.3f} ms/resume")
+    print(f"shared pipeline     {pipeline * 1000:8.3f} ms/resume  ({legacy / pipeline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
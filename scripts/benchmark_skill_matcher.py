@@ -0,0 +1,84 @@
+"""
+Benchmark resume skill extraction against the old per-keyword substring scan.
+
+Builds synthetic taxonomies (default 50, 500 and 5,000 skills, each with one
+synonym) and a synthetic resume, then reports the automaton build time and
+the per-resume extraction time of SkillMatcher next to the previous
+`skill in text_lower` loop, whose cost grows with the taxonomy size.
+
+    python scripts/benchmark_skill_matcher.py --sizes 50 500 5000 --resume-kb 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.skill_matcher import SkillMatcher
+
+WORDS = (
+    "delivered scalable services for customers across regions while mentoring engineers "
+    "and improving reliability latency cost observability with automated testing"
+).split()
+
+
+def build_taxonomy(size: int):
+    return {f"Skill{index} Framework": [f"sk{index}"] for index in range(size)}
+
+
+def build_resume(skills, size_kb: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    names = list(skills)
+    words = []
+    while sum(len(word) + 1 for word in words) < size_kb * 1024:
+        words.append(rng.choice(names) if rng.random() < 0.02 else rng.choice(WORDS))
+    return " ".join(words)
+
+
+def legacy_extract(skills, text: str):
+    """The pre-automaton implementation: one substring scan per keyword"""
+    text_lower = text.lower()
+    found = []
+    for name, synonyms in skills.items():
+        for term in (name, *synonyms):
+            if term.lower() in text_lower:
+                found.append(name)
+                break
+    return found
+
+
+def timed(func, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--resume-kb", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        skills = build_taxonomy(size)
+        text = build_resume(skills, args.resume_kb)
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build = time.perf_counter() - started
+
+        legacy, legacy_found = timed(lambda: legacy_extract(skills, text), args.repeat)
+        automaton, found = timed(lambda: matcher.find(text), args.repeat)
+        print(
+            f"skills={size:>6}  build={build * 1000:8.1f} ms  "
+            f"legacy={legacy * 1000:8.2f} ms/resume ({len(legacy_found)} found)  "
+            f"automaton={automaton * 1000:6.2f} ms/resume ({len(found)} found)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Rebuild the dashboard rollup tables from the base tables.
+
+The ORM keeps mpr_pipeline_counters, daily_hiring_metrics,
+manager_job_visibility and candidate_skills current on every flush; bulk
+`query.update()`/`query.delete()` writes and manual SQL do not. The rollups
+are rebuilt with one set-based statement each and the skill index in
+batches, so this is safe to run on a schedule.
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.hiring_metrics import rebuild_daily_hiring_metrics
+from app.services.manager_visibility import rebuild_manager_job_visibility
+from app.services.pipeline_counters import reconcile_pipeline_counters
+from app.services.skill_index import rebuild_skill_index
+
+
+def reconcile_rollups() -> None:
+    db = SessionLocal()
+    try:
+        reconcile_pipeline_counters(db)
+        print("Rebuilt mpr_pipeline_counters")
+        days = rebuild_daily_hiring_metrics(db)
+        print(f"Rebuilt daily_hiring_metrics ({days} day(s))")
+        rebuild_manager_job_visibility(db)
+        print("Rebuilt manager_job_visibility")
+        candidates = rebuild_skill_index(db)
+        print(f"Rebuilt candidate_skills ({candidates} candidate(s))")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_rollups()